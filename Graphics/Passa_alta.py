@@ -1,81 +1,32 @@
-import numpy as np
-import matplotlib.pyplot as plt
-import schemdraw
-import schemdraw.elements as elm
-from scipy.signal import TransferFunction, bode
-
-def main(R_pa, C_pa):
+import cache
+import calculo
+import esquematicos
 
+def calcular(R_pa, C_pa, grade="fixa"):
     # PARÂMETROS
-    R = R_pa       # ohms
-    C = C_pa      # F
-    wc = 1.0 / (R * C)   # frequência de corte rad/s
+    # R em ohms, C em F — ωc = 1/(RC) rad/s
+    return cache.calcular(calculo.FiltroSpec("passa_alta", R_pa, C_pa, grade=grade))
 
-    # -----------------------------
-    # Desenho do circuito
-    # -----------------------------
-    with schemdraw.Drawing(file='rc_highpass_diagram.svg') as d:
-        d.config(unit=3)
-        # Fonte senoidal
-        vin = d.add(elm.SourceSin().label('Vin', loc='left'))
-        # Capacitor em série
-        c = d.add(elm.Capacitor().right().label('C'))
-        # Nó de saída +
-        d.add(elm.Dot(open=True).at(c.end).label('Vout+', loc='right'))
-        # Resistor para o terra
-        r = d.add(elm.Resistor().down().label('R'))
-        d.add(elm.Dot(open=True).at(r.end).label('Vout-', loc='right'))
-        d.add(elm.Line().left())
+def renderizar(resposta, desenhar=True, plotar=True):
 
-    print("Diagrama salvo em 'rc_highpass_diagram.svg'")
+    R, C = resposta.spec.R, resposta.spec.C
+    wc = resposta.metricas.wc
 
     # -----------------------------
-    # Função de transferência
+    # Desenho do circuito
     # -----------------------------
-    num = [R*C, 0.0]   # sRC
-    den = [R*C, 1.0]   # sRC + 1
-    H = TransferFunction(num, den)
+    if desenhar:
+        arquivo = esquematicos.desenhar("passa_alta", R=R, C=C)
+        print(f"Diagrama salvo em '{arquivo}'")
 
     print(f"ωc = {wc:.4e} rad/s")
 
     # -----------------------------
     # Análise de frequência (Bode)
     # -----------------------------
-    n_points = 2000
-    w_log = np.logspace(np.log10(wc*1e-2), np.log10(wc*1e2), n_points)
-    w_bode, mag_db, phase_deg = bode(H, w=w_log)
-
-    # Magnitude normalizada
-    mag_linear = 10**(mag_db / 20.0)
-    mag_norm = mag_linear / np.max(mag_linear)
-
-    # PLOT 1 — Magnitude
-    plt.figure(figsize=(12,6))
-    plt.semilogx(w_bode, mag_norm, label='|H(jω)| normalizado', linewidth=2)
-
-    # linha de corte
-    plt.axvline(wc, color='r', linestyle='--', linewidth=1.5, label=rf'$\omega_c$ = {wc:.2e}')
-
-    plt.title("Filtro RC Passa-Alta — Magnitude normalizada")
-    plt.xlabel("ω [rad/s]")
-    plt.ylabel("|H(jω)| (normalizado)")
-    plt.grid(which='both', linestyle='--', alpha=0.6)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
-
-    # PLOT 2 — Fase
-    plt.figure(figsize=(12,6))
-    plt.semilogx(w_bode, phase_deg, label='∠H(jω)', linewidth=2)
-    plt.axvline(wc, color='r', linestyle='--', linewidth=1.5, label=rf'$\omega_c$ = {wc:.2e}')
-
-    plt.title("Filtro RC Passa-Alta — Fase")
-    plt.xlabel("ω [rad/s]")
-    plt.ylabel("Fase [graus]")
-    plt.grid(which='both', linestyle='--', alpha=0.6)
-    plt.legend()
-    plt.tight_layout()
-    plt.show()
+    if plotar:
+        import graficos   # matplotlib só é carregado quando há gráfico
+        graficos.plotar(resposta)
 
     # -----------------------------
     # Resumo
@@ -83,4 +34,8 @@ def main(R_pa, C_pa):
     print("Resumo:")
     print(f"  R = {R:.2e} Ω, C = {C:.2e} F")
     print(f"  ωc = {wc:.4e} rad/s")
-    print("Arquivos gerados: 'rc_highpass_diagram.svg' (diagrama).")
+    if desenhar:
+        print(f"Arquivos gerados: '{arquivo}' (diagrama).")
+
+def main(R_pa, C_pa):
+    renderizar(calcular(R_pa, C_pa))
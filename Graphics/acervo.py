@@ -0,0 +1,252 @@
+import os
+
+import numpy as np
+
+import calculo
+import perfil
+
+# Acervo de projetos em colunas: em vez de uma lista de dicionários (centenas
+# de bytes por projeto), cada projeto é uma linha de um vetor estruturado do
+# NumPy com tipo, R, C, L e as métricas de calculo.metricas_lote (73 bytes).
+# O acervo é salvo numa pasta como .npy e reaberto com memmap, então dezenas
+# de milhões de linhas não precisam caber na memória.
+#
+# Para consultas por faixa, cada campo indexado (ωc, ω0, Q por padrão) tem
+# um vetor de ordenação (argsort) e a cópia ordenada dos valores, também
+# salvos em .npy. Uma faixa vira duas buscas binárias na cópia ordenada (o
+# sorter do np.searchsorted percorreria o vetor inteiro a cada chamada); com
+# várias condições, a faixa indexada mais estreita escolhe os candidatos e
+# as demais só filtram esses candidatos.
+
+CAMPOS = ("R", "C", "L", "wc", "wc1", "wc2", "w0", "BW", "Q")
+METRICAS = CAMPOS[3:]
+INDICES = ("wc", "w0", "Q")
+DTYPE = np.dtype([("tipo", "u1")] + [(campo, "f8") for campo in CAMPOS])
+
+ARQUIVO_DADOS = "projetos.npy"
+
+
+def _arquivos_indice(pasta, campo):
+    return (os.path.join(pasta, f"ordem_{campo}.npy"),
+            os.path.join(pasta, f"ordenado_{campo}.npy"))
+
+
+def codigo_tipo(tipo):
+    """Código (0 a 3) guardado na coluna 'tipo': posição em calculo.TIPOS."""
+    return calculo.TIPOS.index(calculo.normalizar_tipo(tipo))
+
+
+def registros(tipo, R, C, L=None):
+    """Vetor estruturado (DTYPE) com componentes e métricas de cada projeto.
+
+    L e as métricas que não se aplicam ao tipo de filtro ficam como NaN.
+    """
+    tipo, R, C, L = calculo.componentes_lote(tipo, R, C, L)
+    dados = np.empty(R.size, dtype=DTYPE)
+    _preencher(dados, tipo, R, C, L, calculo.metricas_lote(tipo, R, C, L))
+    return dados
+
+
+def _preencher(dados, tipo, R, C, L, metricas):
+    dados["tipo"] = codigo_tipo(tipo)
+    dados["R"] = R
+    dados["C"] = C
+    dados["L"] = np.nan if L is None else L
+    for chave, valores in metricas.items():
+        dados[chave] = valores
+
+
+def perto(valor, tolerancia):
+    """Faixa [valor(1 - tolerancia), valor(1 + tolerancia)], para usar em consultar."""
+    return valor * (1.0 - tolerancia), valor * (1.0 + tolerancia)
+
+
+class Acervo:
+    """Projetos em colunas, com índices ordenados para consultas por faixa.
+
+    Uso::
+
+        acervo = Acervo.de_componentes("passa_faixa", R, C, L)
+        acervo.salvar("acervo")
+        acervo = Acervo.abrir("acervo")          # memmap, só lê o que a consulta toca
+        achados = acervo.consultar(w0=perto(1e4, 0.01), Q=(5, None))
+    """
+
+    def __init__(self, dados, indices=None):
+        if dados.dtype != DTYPE:
+            raise ValueError("Os dados do acervo precisam ter o dtype acervo.DTYPE.")
+        self.dados = dados
+        self.indices = dict(indices or {})    # campo -> (ordem, valores ordenados)
+
+    def __len__(self):
+        return self.dados.size
+
+    # -----------------------------
+    # Construção
+    # -----------------------------
+    @classmethod
+    def de_componentes(cls, tipo, R, C, L=None):
+        """Acervo em memória com os projetos dados (R, C, L como em calculo.componentes_lote)."""
+        return cls(registros(tipo, R, C, L))
+
+    @classmethod
+    def juntar(cls, acervos):
+        """Um acervo só com as linhas de vários (ex.: um por tipo de filtro)."""
+        return cls(np.concatenate([a.dados for a in acervos]))
+
+    @classmethod
+    def de_varredura(cls, varredura, pasta):
+        """Grava o resultado de uma varredura.Varredura direto num acervo em disco.
+
+        As linhas seguem o índice plano da grade; cada bloco é escrito no seu
+        lugar assim que termina, sem juntar a varredura inteira na memória.
+        Blocos já salvos no checkpoint da varredura são aproveitados.
+        """
+        os.makedirs(pasta, exist_ok=True)
+        dados = np.lib.format.open_memmap(os.path.join(pasta, ARQUIVO_DADOS), mode="w+",
+                                          dtype=DTYPE, shape=(varredura.total,))
+        for blocos in (varredura.carregar(), varredura.executar()):
+            for bloco in blocos:
+                trecho = dados[bloco["indice"][0]:bloco["indice"][-1] + 1]
+                _preencher(trecho, varredura.tipo, bloco["R"], bloco["C"], bloco.get("L"),
+                           {k: bloco[k] for k in METRICAS})
+        if varredura.progresso < 1.0:
+            raise RuntimeError("Varredura interrompida: o acervo em disco está incompleto.")
+        dados.flush()
+        acervo = cls(dados)
+        acervo.indexar()
+        acervo._salvar_indices(pasta)
+        return acervo
+
+    # -----------------------------
+    # Índices
+    # -----------------------------
+    @perfil.medir("acervo/indexar")
+    def indexar(self, campos=INDICES):
+        """Monta (ou refaz) o índice de cada campo. NaN fica no fim."""
+        for campo in campos:
+            valores = self.dados[campo]
+            ordem = np.argsort(valores, kind="stable")
+            self.indices[campo] = (ordem, valores[ordem])
+        return self
+
+    def _indice(self, campo):
+        if campo not in self.indices:
+            self.indexar((campo,))
+        return self.indices[campo]
+
+    def _faixa(self, campo, minimo, maximo):
+        # posições [i, j) no vetor de ordenação com minimo <= valor <= maximo
+        ordem, ordenado = self._indice(campo)
+        i = 0 if minimo is None else np.searchsorted(ordenado, minimo, side="left")
+        j = np.searchsorted(ordenado, np.inf if maximo is None else maximo, side="right")
+        return ordem, int(i), int(j)
+
+    # -----------------------------
+    # Consultas
+    # -----------------------------
+    @perfil.medir("acervo/consulta")
+    def linhas(self, tipo=None, **faixas):
+        """Índices (crescentes) das linhas que atendem a todas as condições.
+
+        Cada condição é campo=(mínimo, máximo), intervalo fechado; None deixa o
+        lado aberto. Ex.: linhas(w0=perto(1e4, 0.01), Q=(5, None)).
+        tipo restringe a um tipo de filtro.
+        """
+        for campo in faixas:
+            if campo not in CAMPOS:
+                raise ValueError(f"Campo desconhecido: {campo!r}")
+        faixas = {campo: tuple(faixa) for campo, faixa in faixas.items()}
+
+        indexadas = [c for c in faixas if c in self.indices or c in INDICES]
+        if indexadas:
+            # a faixa indexada com menos linhas define os candidatos
+            faixas_ordem = {c: self._faixa(c, *faixas[c]) for c in indexadas}
+            melhor = min(faixas_ordem, key=lambda c: faixas_ordem[c][2] - faixas_ordem[c][1])
+            ordem, i, j = faixas_ordem.pop(melhor)
+            candidatos = np.sort(ordem[i:j])
+            del faixas[melhor]
+        else:
+            candidatos = np.arange(self.dados.size)
+
+        manter = np.ones(candidatos.size, dtype=bool)
+        for campo, (minimo, maximo) in faixas.items():
+            valores = self.dados[campo][candidatos]
+            if minimo is not None:
+                manter &= valores >= minimo
+            if maximo is not None:
+                manter &= valores <= maximo
+        if tipo is not None:
+            manter &= self.dados["tipo"][candidatos] == codigo_tipo(tipo)
+        return candidatos[manter]
+
+    def consultar(self, tipo=None, **faixas):
+        """Linhas (vetor estruturado, cópia em memória) que atendem às condições de `linhas`."""
+        return self.dados[self.linhas(tipo, **faixas)]
+
+    def contar(self, tipo=None, **faixas):
+        return self.linhas(tipo, **faixas).size
+
+    # -----------------------------
+    # Disco
+    # -----------------------------
+    def _salvar_indices(self, pasta):
+        for campo, indice in self.indices.items():
+            for arquivo, vetor in zip(_arquivos_indice(pasta, campo), indice):
+                np.save(arquivo, vetor)
+
+    def salvar(self, pasta):
+        """Grava dados e índices em `pasta` (.npy), para reabrir com Acervo.abrir."""
+        os.makedirs(pasta, exist_ok=True)
+        for campo in INDICES:
+            self._indice(campo)
+        np.save(os.path.join(pasta, ARQUIVO_DADOS), self.dados)
+        self._salvar_indices(pasta)
+        return pasta
+
+    @classmethod
+    def abrir(cls, pasta, memmap=True):
+        """Reabre um acervo salvo. Com memmap, dados e índices ficam no disco e só
+        as páginas tocadas por cada consulta são lidas."""
+        modo = "r" if memmap else None
+        dados = np.load(os.path.join(pasta, ARQUIVO_DADOS), mmap_mode=modo)
+        indices = {}
+        for campo in CAMPOS:
+            arquivos = _arquivos_indice(pasta, campo)
+            if all(os.path.exists(a) for a in arquivos):
+                indices[campo] = tuple(np.load(a, mmap_mode=modo) for a in arquivos)
+        return cls(dados, indices)
+
+    def exportar_parquet(self, caminho, tamanho_bloco=1_000_000):
+        """Grava as colunas em Parquet (precisa do pyarrow), um row group por bloco."""
+        pa, pq = _pyarrow()
+        schema = pa.schema([("tipo", pa.string())] + [(campo, pa.float64()) for campo in CAMPOS])
+        nomes = np.array(calculo.TIPOS)
+        with pq.ParquetWriter(caminho, schema) as escritor:
+            for ini in range(0, self.dados.size, tamanho_bloco):
+                bloco = self.dados[ini:ini + tamanho_bloco]
+                colunas = [pa.array(nomes[bloco["tipo"]])] + [pa.array(bloco[c]) for c in CAMPOS]
+                escritor.write_table(pa.Table.from_arrays(colunas, schema=schema))
+        return caminho
+
+    @classmethod
+    def de_parquet(cls, caminho):
+        """Lê um acervo exportado com exportar_parquet (em memória; índices refeitos sob demanda)."""
+        _, pq = _pyarrow()
+        tabela = pq.read_table(caminho, columns=["tipo", *CAMPOS])
+        dados = np.empty(tabela.num_rows, dtype=DTYPE)
+        nomes = tabela.column("tipo").to_numpy(zero_copy_only=False)
+        for codigo, nome in enumerate(calculo.TIPOS):
+            dados["tipo"][nomes == nome] = codigo
+        for campo in CAMPOS:
+            dados[campo] = tabela.column(campo).to_numpy()
+        return cls(dados)
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet precisa do pacote pyarrow (pip install pyarrow).") from None
+    return pa, pq
@@ -0,0 +1,377 @@
+"""Benchmarks do caminho de cálculo de cada módulo de filtro.
+
+Roda sem interface gráfica (backend Agg) e grava os tempos em JSON, para
+comparar execuções entre commits:
+
+    python benchmark.py --saida bench.json
+    python benchmark.py --saida novo.json --comparar bench.json
+"""
+import argparse
+import importlib.util
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+from scipy.signal import TransferFunction, bode, lsim, lti
+
+import calculo
+import tempo
+
+# projeto de referência de cada tipo (mesmos valores padrão da interface)
+PROJETOS = {
+    "passa_baixa": calculo.FiltroSpec("passa_baixa", 100, 1e-6),
+    "passa_alta": calculo.FiltroSpec("passa_alta", 100, 1e-6),
+    "passa_faixa": calculo.FiltroSpec("passa_faixa", 100, 1e-6, 1e-3),
+    "rejeita_faixa": calculo.FiltroSpec("rejeita_faixa", 100, 1e-6, 1e-3),
+}
+
+BENCHMARKS = {}
+
+
+def benchmark(nome):
+    def registrar(funcao):
+        BENCHMARKS[nome] = funcao
+        return funcao
+    return registrar
+
+
+def medir(funcao, repeticoes=5):
+    """Tempo por chamada (s): mínimo e mediana de `repeticoes` rodadas."""
+    timer = timeit.Timer(funcao)
+    numero, _ = timer.autorange()
+    tempos = np.array(timer.repeat(repeat=repeticoes, number=numero)) / numero
+    return {"min": float(tempos.min()), "mediana": float(np.median(tempos)), "chamadas": numero}
+
+
+def _coeficientes(spec):
+    num, den = calculo.coeficientes_lote(spec.tipo, spec.R, spec.C, spec.L)
+    return num[0], den[0]
+
+
+# -----------------------------
+# Função de transferência
+# -----------------------------
+for _tipo, _spec in PROJETOS.items():
+    @benchmark(f"tf/scipy/{_tipo}")
+    def _(spec=_spec):
+        num, den = _coeficientes(spec)
+        return lambda: TransferFunction(num, den)
+
+    @benchmark(f"tf/calculo/{_tipo}")
+    def _(spec=_spec):
+        return lambda: calculo.coeficientes_lote(spec.tipo, spec.R, spec.C, spec.L)
+
+
+# -----------------------------
+# Resposta em frequência
+# -----------------------------
+for _n in (2000, 4000, 100000):
+    for _tipo, _spec in PROJETOS.items():
+        @benchmark(f"resposta/bode/{_tipo}/{_n}")
+        def _(spec=_spec, n=_n):
+            H = TransferFunction(*_coeficientes(spec))
+            w = np.logspace(1, 7, n)
+            return lambda: bode(H, w=w)
+
+        @benchmark(f"resposta/calculo/{_tipo}/{_n}")
+        def _(spec=_spec, n=_n):
+            w = np.logspace(1, 7, n)
+            return lambda: calculo.calcular(spec, w)
+
+
+@benchmark("resposta/lote/rejeita_faixa/10000x400")
+def _():
+    rng = np.random.default_rng(0)
+    R = rng.uniform(1, 1e3, 10000)
+    L = rng.uniform(1e-4, 1e-2, 10000)
+    C = rng.uniform(1e-9, 1e-6, 10000)
+    return lambda: calculo.resposta_lote("rejeita_faixa", R, C, L, n_pontos=400)
+
+
+@benchmark("resposta/lote/rejeita_faixa/10000x400/complex64")
+def _():
+    rng = np.random.default_rng(0)
+    R = rng.uniform(1, 1e3, 10000)
+    L = rng.uniform(1e-4, 1e-2, 10000)
+    C = rng.uniform(1e-9, 1e-6, 10000)
+    return lambda: calculo.resposta_lote("rejeita_faixa", R, C, L, n_pontos=400, dtype=np.complex64)
+
+
+@benchmark("resposta/lote/rejeita_faixa/10000x400/parasitas")
+def _():
+    rng = np.random.default_rng(0)
+    R = rng.uniform(1, 1e3, 10000)
+    L = rng.uniform(1e-4, 1e-2, 10000)
+    C = rng.uniform(1e-9, 1e-6, 10000)
+    p = calculo.Parasitas(R_L=rng.uniform(0, 10, 10000), R_C=rng.uniform(0, 1, 10000),
+                          R_fonte=50.0, R_carga=rng.uniform(1e3, 1e5, 10000))
+    return lambda: calculo.resposta_lote("rejeita_faixa", R, C, L, n_pontos=400, parasitas=p)
+
+
+for _dtype in (np.complex128, np.complex64):
+    @benchmark(f"resposta/horner/passa_faixa/1000x4000/{_dtype.__name__}")
+    def _(dtype=_dtype):
+        # grade compartilhada com jω pré-calculado (só Horner e |H|, fase)
+        rng = np.random.default_rng(0)
+        num, den = calculo.coeficientes_lote("passa_faixa", rng.uniform(1, 1e3, 1000),
+                                             rng.uniform(1e-9, 1e-6, 1000), rng.uniform(1e-4, 1e-2, 1000))
+        s = calculo.eixo_jw(np.logspace(1, 7, 4000), dtype)
+        return lambda: calculo.magnitude_fase(num, den, s, dtype)
+
+
+# -----------------------------
+# Ajuste incremental (um componente muda)
+# -----------------------------
+@benchmark("sintonia/passa_faixa/ajuste")
+def _():
+    sintonia = calculo.Sintonia(PROJETOS["passa_faixa"])
+    valores = itertools.cycle(np.linspace(80, 120, 1000))
+    return lambda: sintonia.ajustar(R=next(valores))
+
+
+@benchmark("sintonia/passa_faixa/quadro_blit")
+def _():
+    import graficos
+    sintonia = calculo.Sintonia(PROJETOS["passa_faixa"])
+    painel = graficos.PainelBode(blit=True)
+    painel.atualizar(sintonia.resposta)
+    painel.fig.canvas.draw()
+    valores = itertools.cycle(np.linspace(80, 120, 1000))
+
+    def quadro():
+        painel.atualizar(sintonia.ajustar(R=next(valores)))
+        painel.desenhar()
+    return quadro
+
+
+# -----------------------------
+# Frequências de corte do rejeita-faixa
+# -----------------------------
+@benchmark("cortes/rejeita_faixa/forma_fechada")
+def _():
+    spec = PROJETOS["rejeita_faixa"]
+    return lambda: calculo.metricas_lote(spec.tipo, spec.R, spec.C, spec.L)
+
+
+@benchmark("cortes/rejeita_faixa/brentq_bode")
+def _():
+    # caminho original do Rejeita_Faixa.py: brentq sobre |H| de uma chamada de bode() por ponto
+    from scipy.optimize import brentq
+    spec = PROJETOS["rejeita_faixa"]
+    w0 = 1.0 / np.sqrt(spec.L * spec.C)
+    H = TransferFunction(*_coeficientes(spec))
+
+    def H_abs(w):
+        # no próprio ω0 (zero do notch) bode() calcula log10(0)
+        with np.errstate(divide='ignore'):
+            _, mag_db, _ = bode(H, w=[w])
+        return 10**(mag_db[0] / 20.0)
+
+    def cortes():
+        alvo = H_abs(1e-6) / np.sqrt(2)
+        wc1 = brentq(lambda w: H_abs(w) - alvo, w0 / 10, w0)
+        wc2 = brentq(lambda w: H_abs(w) - alvo, w0, w0 * 10)
+        return wc1, wc2
+    return cortes
+
+
+# -----------------------------
+# Simulação no tempo (mesmo sinal de VinVout.py)
+# -----------------------------
+def _sinal_vinvout():
+    fs = 20000
+    t = np.arange(0, 0.5, 1 / fs)
+    vin = np.sin(2 * np.pi * 5 * t) + 0.5 * np.sin(2 * np.pi * 200 * t)
+    return fs, t, vin
+
+
+@benchmark("tempo/lsim/passa_alta")
+def _():
+    _, t, vin = _sinal_vinvout()
+    R, C = 1e5, 5.3e-9
+    sistema = lti([R * C, 0.0], [R * C, 1.0])
+    return lambda: lsim(sistema, U=vin, T=t)
+
+
+@benchmark("tempo/blocos/passa_alta")
+def _():
+    fs, _, vin = _sinal_vinvout()
+    filtro = tempo.FiltroDiscreto.de_spec(calculo.FiltroSpec("passa_alta", 1e5, 5.3e-9), fs)
+
+    def rodar():
+        filtro.reiniciar()
+        for bloco in tempo.em_blocos(vin, 4096):
+            filtro.processar(bloco)
+    return rodar
+
+
+@benchmark("tempo/degrau/scipy/passa_faixa")
+def _():
+    from scipy.signal import step
+    num, den = _coeficientes(PROJETOS["passa_faixa"])
+    t = np.linspace(0, 1e-3, 400)
+    return lambda: step((num, den), T=t)
+
+
+@benchmark("tempo/degrau/metricas/passa_faixa/100000x400")
+def _():
+    import transitorio
+    rng = np.random.default_rng(0)
+    R = rng.uniform(1, 1e3, 100000)
+    L = rng.uniform(1e-4, 1e-2, 100000)
+    C = rng.uniform(1e-9, 1e-6, 100000)
+    return lambda: transitorio.metricas_lote("passa_faixa", R, C, L, n_pontos=400)
+
+
+# -----------------------------
+# Acervo de projetos (consulta por faixa)
+# -----------------------------
+@benchmark("acervo/consulta/passa_faixa/2000000")
+def _():
+    import acervo
+    rng = np.random.default_rng(0)
+    n = 2_000_000
+    banco = acervo.Acervo.de_componentes("passa_faixa", rng.uniform(1, 1e3, n),
+                                         rng.uniform(1e-9, 1e-6, n), rng.uniform(1e-4, 1e-1, n))
+    banco.indexar()
+    return lambda: banco.linhas(w0=acervo.perto(1e4, 0.01), Q=(5, None))
+
+
+# -----------------------------
+# Serviço HTTP (micro-lotes)
+# -----------------------------
+@benchmark("servico/avaliar/100_conexoes_x10")
+def _():
+    import asyncio
+    import servico
+
+    corpo = json.dumps({"tipo": "rejeita_faixa", "R": 100, "C": 1e-6, "L": 1e-3,
+                        "frequencias": [1e3, 1e4]}).encode()
+    pedido = (f"POST /avaliar HTTP/1.1\r\nContent-Length: {len(corpo)}\r\n\r\n").encode() + corpo
+
+    async def cliente(porta):
+        reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+        for _ in range(10):
+            writer.write(pedido)
+            tamanho = 0
+            while (linha := await reader.readline()) != b"\r\n":
+                if linha.lower().startswith(b"content-length"):
+                    tamanho = int(linha.split(b":")[1])
+            await reader.readexactly(tamanho)
+        writer.close()
+
+    async def rodada():
+        s = servico.Servico(processos=0)
+        _, porta = await s.iniciar("127.0.0.1", 0)
+        await asyncio.gather(*(cliente(porta) for _ in range(100)))
+        await s.fechar()
+    return lambda: asyncio.run(rodada())
+
+
+# -----------------------------
+# Esquemáticos
+# -----------------------------
+for _tipo in PROJETOS:
+    @benchmark(f"esquematico/{_tipo}")
+    def _(tipo=_tipo):
+        import esquematicos
+        pasta = tempfile.mkdtemp()
+        spec = PROJETOS[tipo]
+        return lambda: esquematicos.desenhar(tipo, os.path.join(pasta, f"{tipo}.svg"),
+                                             R=spec.R, C=spec.C, L=spec.L)
+
+    @benchmark(f"esquematico/{_tipo}/sem_cache")
+    def _(tipo=_tipo):
+        import esquematicos
+
+        def renderizar():
+            esquematicos.modelo.cache_clear()
+            esquematicos.modelo(tipo)
+        return renderizar
+
+
+# -----------------------------
+# Inicialização (processo novo a cada chamada)
+# -----------------------------
+_PASTA = os.path.dirname(os.path.abspath(__file__))
+
+
+def _processo(*argumentos):
+    comando = [sys.executable, *argumentos]
+    return lambda: subprocess.run(comando, cwd=_PASTA, check=True, stdout=subprocess.DEVNULL)
+
+
+for _modulo in ("calculo", "cache", "lote", "graficos", "esquematicos", "Passa_faixa"):
+    @benchmark(f"inicio/{_modulo}")
+    def _(modulo=_modulo):
+        return _processo("-c", f"import {modulo}")
+
+
+# a janela só abre com Tk e uma tela disponíveis
+if importlib.util.find_spec("tkinter") and (os.name == "nt" or os.environ.get("DISPLAY")):
+    @benchmark("inicio/interface")
+    def _():
+        return _processo("interface.py", "--medir-inicio")
+
+
+# -----------------------------
+# Execução
+# -----------------------------
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar(filtro="", repeticoes=5):
+    resultados = {}
+    for nome, preparar in BENCHMARKS.items():
+        if filtro in nome:
+            resultados[nome] = medir(preparar(), repeticoes)
+            print(f"{nome:45s} {resultados[nome]['min'] * 1e3:10.4f} ms")
+    return {
+        "commit": _commit(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "maquina": platform.machine(),
+        "resultados": resultados,
+    }
+
+
+def comparar(atual, anterior):
+    print(f"\nComparação com {anterior.get('commit')}:")
+    for nome, r in atual["resultados"].items():
+        antes = anterior["resultados"].get(nome)
+        if antes:
+            razao = r["min"] / antes["min"]
+            print(f"{nome:45s} {razao:6.2f}x {'(mais lento)' if razao > 1.1 else ''}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filtro", default="", help="roda só os benchmarks cujo nome contém este texto")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--saida", help="arquivo JSON com os resultados")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior")
+    args = parser.parse_args()
+
+    relatorio = executar(args.filtro, args.repeticoes)
+    if args.saida:
+        with open(args.saida, "w") as f:
+            json.dump(relatorio, f, indent=2)
+    if args.comparar:
+        with open(args.comparar) as f:
+            comparar(relatorio, json.load(f))
@@ -0,0 +1,141 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import calculo
+import perfil
+
+# Cache de respostas já calculadas (função de transferência, resposta em
+# frequência e métricas), com despejo LRU limitado por número de entradas e
+# por bytes. Pode ser salvo em disco e recarregado na próxima sessão.
+
+
+def _normalizar(x):
+    # 12 algarismos significativos: 1e-6 e 1.0000000000001e-6 caem na mesma chave
+    return None if x is None else float(f"{float(x):.12g}")
+
+
+def chave(spec, w=None):
+    """Chave do cache: parâmetros normalizados do projeto + assinatura da grade."""
+    if w is None:
+        grade = None
+    else:
+        w = np.ascontiguousarray(w, dtype=float)
+        grade = (w.shape, hashlib.sha1(w.tobytes()).hexdigest())
+    parasitas = None if spec.parasitas is None else tuple(
+        _normalizar(getattr(spec.parasitas, k)) for k in ("R_L", "R_C", "R_fonte", "R_carga"))
+    return (spec.tipo, _normalizar(spec.R), _normalizar(spec.C), _normalizar(spec.L),
+            spec.n_pontos, spec.grade, _normalizar(spec.tol_db), parasitas, grade)
+
+
+def _tamanho(resposta):
+    return sum(a.nbytes for a in (resposta.w, resposta.mag, resposta.fase, resposta.num, resposta.den))
+
+
+class CacheRespostas:
+    """Cache LRU de `calculo.RespostaFiltro`.
+
+    Parâmetros
+    ----------
+    max_entradas : número máximo de respostas guardadas.
+    max_bytes : limite aproximado da memória ocupada pelos vetores.
+    arquivo : se informado, o cache é carregado dele (quando existe) e
+        `salvar()` grava nele.
+
+    As respostas devolvidas são compartilhadas: seus vetores ficam somente
+    leitura. `acertos` e `falhas` contam os usos desde a criação.
+    """
+
+    def __init__(self, max_entradas=256, max_bytes=256 * 2**20, arquivo=None):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.arquivo = arquivo
+        self.acertos = 0
+        self.falhas = 0
+        self.bytes = 0
+        self._dados = OrderedDict()
+        self._trava = threading.Lock()
+        if arquivo is not None and os.path.exists(arquivo):
+            self.carregar(arquivo)
+
+    def __len__(self):
+        return len(self._dados)
+
+    @property
+    def estatisticas(self):
+        total = self.acertos + self.falhas
+        return {"acertos": self.acertos, "falhas": self.falhas,
+                "taxa_acerto": self.acertos / total if total else 0.0,
+                "entradas": len(self._dados), "bytes": self.bytes}
+
+    def calcular(self, spec, w=None):
+        """Igual a calculo.calcular, mas devolve a resposta guardada quando existe."""
+        k = chave(spec, w)
+        with self._trava:
+            resposta = self._dados.get(k)
+            if resposta is not None:
+                self._dados.move_to_end(k)
+                self.acertos += 1
+                perfil.contar("cache/acertos")
+                return resposta
+            self.falhas += 1
+        perfil.contar("cache/falhas")
+
+        resposta = calculo.calcular(spec, w)
+        self.guardar(k, resposta)
+        return resposta
+
+    def guardar(self, k, resposta):
+        for a in (resposta.w, resposta.mag, resposta.fase, resposta.num, resposta.den):
+            a.flags.writeable = False
+        with self._trava:
+            if k in self._dados:
+                self.bytes -= _tamanho(self._dados.pop(k))
+            self._dados[k] = resposta
+            self.bytes += _tamanho(resposta)
+            self._despejar()
+
+    def _despejar(self):
+        # remove as menos usadas recentemente até caber nos limites
+        while self._dados and (len(self._dados) > self.max_entradas or self.bytes > self.max_bytes):
+            _, antiga = self._dados.popitem(last=False)
+            self.bytes -= _tamanho(antiga)
+
+    def limpar(self):
+        with self._trava:
+            self._dados.clear()
+            self.bytes = 0
+
+    # -----------------------------
+    # Persistência
+    # -----------------------------
+    def salvar(self, arquivo=None):
+        arquivo = arquivo or self.arquivo
+        if arquivo is None:
+            raise ValueError("Nenhum arquivo informado para salvar o cache.")
+        with self._trava:
+            dados = list(self._dados.items())
+        temporario = arquivo + ".tmp"
+        with open(temporario, "wb") as f:
+            pickle.dump(dados, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, arquivo)
+
+    def carregar(self, arquivo=None):
+        arquivo = arquivo or self.arquivo
+        with open(arquivo, "rb") as f:
+            dados = pickle.load(f)
+        for k, resposta in dados:
+            self.guardar(k, resposta)
+
+
+# cache padrão usado pelos módulos de filtro e pela interface; com a variável
+# de ambiente FILTROS_CACHE apontando para um arquivo, ele persiste entre sessões
+padrao = CacheRespostas(arquivo=os.environ.get("FILTROS_CACHE"))
+
+
+def calcular(spec, w=None):
+    return padrao.calcular(spec, w)
@@ -0,0 +1,801 @@
+import math
+import warnings
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+import numpy as np
+
+import perfil
+
+# Núcleo de cálculo dos filtros: só depende de NumPy e de perfil (sem
+# matplotlib, schemdraw, tkinter ou scipy), para poder ser importado por processos
+# de trabalho e serviços sem o custo da parte gráfica.
+
+# -----------------------------
+# Tipos de filtro suportados
+# -----------------------------
+TIPOS = ("passa_baixa", "passa_alta", "passa_faixa", "rejeita_faixa")
+
+# nomes usados na interface -> chave interna
+_NOMES = {
+    "Passa-Baixa": "passa_baixa",
+    "Passa-Alta": "passa_alta",
+    "Passa-Faixa": "passa_faixa",
+    "Rejeita-Faixa": "rejeita_faixa",
+}
+
+# filtros que precisam de L (RLC de 2ª ordem)
+TIPOS_RLC = ("passa_faixa", "rejeita_faixa")
+
+# grade padrão de cada módulo: (n_pontos, décadas abaixo, décadas acima)
+GRADE_PADRAO = {
+    "passa_baixa": (2000, 2, 2),
+    "passa_alta": (2000, 2, 2),
+    "passa_faixa": (4000, 3, 3),
+    "rejeita_faixa": (4000, 2, 2),
+}
+
+
+def normalizar_tipo(tipo):
+    """Aceita 'Passa-Faixa', 'passa_faixa' ou 'Passa_faixa' e devolve a chave interna."""
+    chave = _NOMES.get(tipo, str(tipo).strip().lower().replace("-", "_"))
+    if chave not in TIPOS:
+        raise ValueError(f"Tipo de filtro desconhecido: {tipo!r}")
+    return chave
+
+
+def componentes_lote(tipo, R, C, L=None):
+    """Converte R, C (e L) em vetores 1-D de mesmo tamanho (um elemento por projeto)."""
+    tipo = normalizar_tipo(tipo)
+    if tipo in TIPOS_RLC:
+        if L is None:
+            raise ValueError(f"O filtro {tipo} precisa do valor de L.")
+        R, L, C = np.broadcast_arrays(np.asarray(R, dtype=float),
+                                      np.asarray(L, dtype=float),
+                                      np.asarray(C, dtype=float))
+        L = L.ravel()
+    else:
+        R, C = np.broadcast_arrays(np.asarray(R, dtype=float),
+                                   np.asarray(C, dtype=float))
+        L = None
+    return tipo, R.ravel(), C.ravel(), L
+
+
+# -----------------------------
+# Componentes parasitas
+# -----------------------------
+@dataclass(frozen=True)
+class Parasitas:
+    """Resistências parasitas (Ω): série do indutor, ESR do capacitor, fonte e carga.
+
+    Cada campo pode ser escalar ou vetor (um valor por projeto). O padrão
+    (zeros e carga infinita) dá a mesma resposta do circuito ideal.
+    """
+    R_L: float = 0.0
+    R_C: float = 0.0
+    R_fonte: float = 0.0
+    R_carga: float = math.inf
+
+    def __post_init__(self):
+        for nome in ("R_L", "R_C", "R_fonte"):
+            if np.any(np.asarray(getattr(self, nome)) < 0):
+                raise ValueError(f"{nome} não pode ser negativa.")
+        if np.any(np.asarray(self.R_carga) <= 0):
+            raise ValueError("R_carga deve ser positiva.")
+
+
+def _produto(a, b):
+    # produto de polinômios linha a linha (um projeto por linha)
+    saida = np.zeros((a.shape[0], a.shape[1] + b.shape[1] - 1))
+    for i in range(a.shape[1]):
+        saida[:, i:i + b.shape[1]] += a[:, i:i + 1] * b
+    return saida
+
+
+def _soma(a, b):
+    # soma de polinômios de graus diferentes (alinhados pela potência 0)
+    n = max(a.shape[1], b.shape[1])
+    return (np.pad(a, ((0, 0), (n - a.shape[1], 0))) + np.pad(b, ((0, 0), (n - b.shape[1], 0))))
+
+
+def _coeficientes_parasitas(tipo, R, C, L, parasitas):
+    # Todos os filtros são um divisor: Z1 em série e Z2 em paralelo com a
+    # carga, alimentados por uma fonte com resistência R_fonte. Com Z = n/d
+    # e G = 1/R_carga:
+    #   H = n2 d1 / ((R_fonte d1 + n1)(G n2 + d2) + n2 d1)
+    n = R.size
+    um = np.ones(n)
+    zero = np.zeros(n)
+    R_L, R_C, R_fonte, R_carga = (np.broadcast_to(np.asarray(v, dtype=float), (n,))
+                                  for v in (parasitas.R_L, parasitas.R_C,
+                                            parasitas.R_fonte, parasitas.R_carga))
+    G = 1.0 / R_carga
+
+    resistor = (R[:, None], um[:, None])
+    capacitor = (np.stack([C * R_C, um], axis=1), np.stack([C, zero], axis=1))    # (sC R_C + 1)/sC
+    if tipo == "passa_baixa":
+        (n1, d1), (n2, d2) = resistor, capacitor
+    elif tipo == "passa_alta":
+        (n1, d1), (n2, d2) = capacitor, resistor
+    else:
+        # L e C em série, com as resistências dos dois: (s²LC + sC(R_L + R_C) + 1)/sC
+        lc = (np.stack([L * C, C * (R_L + R_C), um], axis=1), np.stack([C, zero], axis=1))
+        (n1, d1), (n2, d2) = (lc, resistor) if tipo == "passa_faixa" else (resistor, lc)
+
+    num = _produto(n2, d1)
+    den = _soma(_produto(_soma(R_fonte[:, None] * d1, n1), _soma(G[:, None] * n2, d2)), num)
+    if tipo in TIPOS_RLC:
+        # mônico, como no caso ideal
+        num /= den[:, :1]
+        den /= den[:, :1]
+    return num, den
+
+
+# -----------------------------
+# Função de transferência
+# -----------------------------
+@perfil.medir("funcao_transferencia")
+def coeficientes_lote(tipo, R, C, L=None, parasitas=None):
+    """Numerador e denominador (maior potência primeiro), um projeto por linha.
+
+    Mesmas formas usadas em Passa_baixa, Passa_alta, Passa_faixa e Rejeita_Faixa.
+    Com `parasitas` (Parasitas), inclui as resistências do indutor, do
+    capacitor, da fonte e da carga; o grau continua no máximo 2.
+    """
+    tipo, R, C, L = componentes_lote(tipo, R, C, L)
+    if parasitas is not None:
+        return _coeficientes_parasitas(tipo, R, C, L, parasitas)
+    n = R.size
+    um = np.ones(n)
+    zero = np.zeros(n)
+
+    if tipo == "passa_baixa":
+        num = np.stack([um], axis=1)                  # 1
+        den = np.stack([R * C, um], axis=1)           # sRC + 1
+    elif tipo == "passa_alta":
+        num = np.stack([R * C, zero], axis=1)         # sRC
+        den = np.stack([R * C, um], axis=1)           # sRC + 1
+    elif tipo == "passa_faixa":
+        num = np.stack([R / L, zero], axis=1)                 # s R/L
+        den = np.stack([um, R / L, 1.0 / (L * C)], axis=1)    # s² + s R/L + 1/LC
+    else:
+        w0_2 = 1.0 / (L * C)
+        num = np.stack([um, zero, w0_2], axis=1)              # s² + ω0²
+        den = np.stack([um, R / L, w0_2], axis=1)             # s² + s R/L + ω0²
+    return num, den
+
+
+# -----------------------------
+# Métricas (ωc, ω0, BW, Q)
+# -----------------------------
+def metricas_lote(tipo, R, C, L=None, parasitas=None):
+    """Frequências características de cada projeto, como vetores.
+
+    Chaves: 'wc' (1ª ordem), 'wc1', 'wc2', 'w0', 'BW', 'Q' (2ª ordem).
+    Valores que não se aplicam ao tipo de filtro ficam como NaN.
+    Com `parasitas`, ω0 e BW saem do denominador (s² + BW s + ω0²) e os
+    cortes são relativos ao maior ganho, que deixa de ser 1.
+    """
+    tipo, R, C, L = componentes_lote(tipo, R, C, L)
+    if parasitas is not None:
+        return _metricas_parasitas(tipo, *coeficientes_lote(tipo, R, C, L, parasitas))
+    if tipo not in TIPOS_RLC:
+        metricas = {k: np.full(R.size, np.nan) for k in ("wc1", "wc2", "w0", "BW", "Q")}
+        metricas["wc"] = 1.0 / (R * C)
+        return metricas
+
+    w0 = 1.0 / np.sqrt(L * C)
+    BW = R / L
+    Q = w0 / BW
+    # -3 dB onde |ω² - ω0²| = ω R/L (mesma condição para passa e rejeita-faixa):
+    # ω² - BW ω - ω0² = 0 resolvido direto em ω, exato para qualquer Q (a
+    # quadrática em ω² de cortes_3db perde precisão com Q alto)
+    wc2 = np.hypot(BW / 2.0, w0) + BW / 2.0
+    wc1 = w0**2 / wc2
+    return {"wc": np.full(R.size, np.nan), "wc1": wc1, "wc2": wc2, "w0": w0, "BW": BW, "Q": Q}
+
+
+def _metricas_parasitas(tipo, num, den):
+    n = den.shape[0]
+    nan = np.full(n, np.nan)
+    wc1, wc2 = cortes_3db(num, den)
+    if tipo not in TIPOS_RLC:
+        # ESR ou carga podem deixar um patamar acima de -3 dB: aí não há ωc (NaN)
+        return {"wc": wc1, "wc1": nan, "wc2": nan.copy(), "w0": nan.copy(), "BW": nan.copy(), "Q": nan.copy()}
+    w0 = np.sqrt(den[:, 2])
+    BW = den[:, 1]
+    return {"wc": nan, "wc1": wc1, "wc2": wc2, "w0": w0, "BW": BW, "Q": w0 / BW}
+
+
+def profundidade_notch(num, den):
+    """Atenuação (dB, positiva) em ω0 = sqrt(a0/a2) em relação ao maior ganho, por projeto.
+
+    Infinita no rejeita-faixa ideal; finita com resistências parasitas.
+    """
+    num = np.atleast_2d(num)
+    den = np.atleast_2d(den)
+    b2, _, b0 = _coeficientes_2a_ordem(den).T
+    w0 = np.sqrt(b0 / b2)
+    with np.errstate(divide='ignore'):
+        g_w0 = np.abs(avaliar_lote(num, den, w0[:, None])[:, 0])
+        return 20.0 * np.log10(ganho_maximo_biquad(num, den) / g_w0)
+
+
+def frequencia_referencia(tipo, metricas, den=None):
+    """ωc para filtros RC, ω0 para filtros RLC (centro da grade de frequências).
+
+    Parasitas podem tirar o cruzamento de -3 dB (ωc = NaN); com `den`, esses
+    projetos usam a média geométrica do módulo dos pólos, (a0/an)^(1/n).
+    """
+    w_ref = np.asarray(metricas["w0"] if normalizar_tipo(tipo) in TIPOS_RLC else metricas["wc"],
+                       dtype=float)
+    if den is not None:
+        den = np.atleast_2d(den)
+        polos = np.abs(den[:, -1] / den[:, 0])**(1.0 / (den.shape[1] - 1))
+        w_ref = np.where(np.isfinite(w_ref), w_ref, polos)
+    return w_ref
+
+
+# -----------------------------
+# Grade de frequências
+# -----------------------------
+def grade_lote(tipo, w_ref, n_pontos=None, decadas=None):
+    """Grade log por projeto, centrada em w_ref. Retorna matriz (n_projetos, n_pontos)."""
+    tipo = normalizar_tipo(tipo)
+    n_padrao, abaixo, acima = GRADE_PADRAO[tipo]
+    if n_pontos is None:
+        n_pontos = n_padrao
+    if decadas is not None:
+        abaixo, acima = decadas
+
+    w_ref = np.atleast_1d(np.asarray(w_ref, dtype=float))
+    w_min = w_ref * 10.0**(-abaixo)
+    if tipo == "passa_faixa":
+        w_min = np.maximum(1e-2, w_min)   # evita começar demasiado perto de 0
+    w_max = w_ref * 10.0**acima
+
+    u = np.linspace(0.0, 1.0, n_pontos)
+    log_min = np.log10(w_min)[:, None]
+    log_max = np.log10(w_max)[:, None]
+    return 10.0**(log_min + (log_max - log_min) * u[None, :])
+
+
+# -----------------------------
+# Resposta em frequência
+# -----------------------------
+def eixo_jw(w, dtype=np.complex128):
+    """jω como array complexo, para ser calculado uma vez e reaproveitado em avaliar_lote."""
+    return np.multiply(1j, np.asarray(w, dtype=float), dtype=np.complex128).astype(dtype, copy=False)
+
+
+def _horner(coef, s, formato):
+    # P(s) = (...(c0 s + c1) s + c2)..., operando no lugar para não alocar a cada passo
+    P = np.empty(formato, dtype=s.dtype)
+    P[...] = coef[:, 0, None]
+    for k in range(1, coef.shape[1]):
+        P *= s
+        P += coef[:, k, None]
+    return P
+
+
+@perfil.medir("resposta/horner")
+def avaliar_lote(num, den, w, dtype=np.complex128):
+    """H(jω) de todos os projetos de uma vez (Horner sobre os coeficientes).
+
+    num, den: (n_projetos, k); w: (n_pontos,) compartilhada ou (n_projetos, n_pontos).
+    w também pode ser o jω já calculado por eixo_jw (array complexo), o que
+    evita refazê-lo quando a mesma grade é usada várias vezes.
+    dtype=np.complex64 faz a conta em precisão simples: metade da memória e
+    da banda por ponto, erro relativo ~1e-6 (suficiente para gráficos e lotes).
+    """
+    s = np.asarray(w)
+    s = s.astype(dtype, copy=False) if np.iscomplexobj(s) else eixo_jw(s, dtype)
+    if s.ndim == 1:
+        s = s[None, :]
+    real = np.finfo(s.dtype).dtype
+    num = np.atleast_2d(num).astype(real, copy=False)
+    den = np.atleast_2d(den).astype(real, copy=False)
+
+    formato = np.broadcast_shapes((num.shape[0], 1), (den.shape[0], 1), s.shape)
+    H = _horner(num, s, formato)
+    H /= _horner(den, s, formato)
+    return H
+
+
+def magnitude_fase(num, den, w, dtype=np.complex128):
+    """|H(jω)| linear e fase em graus, direto de H (sem passar por dB)."""
+    H = avaliar_lote(num, den, w, dtype)
+    return np.abs(H), np.angle(H, deg=True)
+
+
+# -----------------------------
+# Frequências de corte (-3 dB)
+# -----------------------------
+def _coeficientes_2a_ordem(p):
+    # completa com zeros à esquerda: [c2, c1, c0] para cada projeto
+    p = np.atleast_2d(np.asarray(p, dtype=float))
+    if p.shape[1] > 3:
+        raise ValueError("Forma fechada só vale para polinômios de grau <= 2.")
+    return np.pad(p, ((0, 0), (3 - p.shape[1], 0)))
+
+
+def _ganhos_extremos(num, den):
+    # |H| em ω = 0 e ω -> ∞ (razão dos coeficientes do maior grau presente)
+    a2, a1, a0 = _coeficientes_2a_ordem(num).T
+    b2, b1, b0 = _coeficientes_2a_ordem(den).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        g_dc = np.abs(a0 / b0)
+        g_inf = np.select([b2 != 0, a2 != 0, b1 != 0, a1 != 0],
+                          [np.abs(a2 / b2), np.inf, np.abs(a1 / b1), np.inf], g_dc)
+    return g_dc, g_inf
+
+
+def ganho_maximo_biquad(num, den):
+    """Maior |H| entre ω = 0, ω = ω0 (= sqrt(b0/b2)) e ω -> ∞, por projeto."""
+    b2, _, b0 = _coeficientes_2a_ordem(den).T
+    g_dc, g_inf = _ganhos_extremos(num, den)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        w0 = np.where(b2 != 0, np.sqrt(b0 / b2), np.nan)
+        g_w0 = np.abs(avaliar_lote(num, den, np.nan_to_num(w0, nan=1.0)[:, None])[:, 0])
+        g_w0 = np.where(np.isfinite(w0), g_w0, np.nan)
+    return np.nanmax(np.stack([g_dc, g_inf, g_w0]), axis=0)
+
+
+def _ganho_minimo_biquad(num, den):
+    # Menor |H| em ω >= 0, exato: com x = ω², |H|² = P(x)/Q(x) e P, Q de 2º
+    # grau; P'Q - PQ' = 0 também é do 2º grau (o termo x³ se cancela), então
+    # os extremos são ω = 0, ω -> ∞ e até duas raízes positivas dessa equação
+    a2, a1, a0 = _coeficientes_2a_ordem(num).T
+    b2, b1, b0 = _coeficientes_2a_ordem(den).T
+    p2, p1, p0 = a2**2, a1**2 - 2.0 * a0 * a2, a0**2
+    q2, q1, q0 = b2**2, b1**2 - 2.0 * b0 * b2, b0**2
+    A = p2 * q1 - p1 * q2
+    B = 2.0 * (p2 * q0 - p0 * q2)
+    Cq = p1 * q0 - p0 * q1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = B**2 - 4.0 * A * Cq
+        q = -0.5 * (B + np.copysign(np.sqrt(np.maximum(disc, 0.0)), B))
+        x = np.stack([np.where(A != 0, q / A, -Cq / B), np.where(A != 0, Cq / q, np.nan)], axis=1)
+        x = np.where((disc >= 0)[:, None] & (x > 0) & np.isfinite(x), x, np.nan)
+        g_x = np.abs(avaliar_lote(num, den, np.sqrt(np.nan_to_num(x, nan=1.0))))
+    g_x = np.where(np.isnan(x), np.nan, g_x)
+    return np.nanmin(np.column_stack([*_ganhos_extremos(num, den), g_x]), axis=1)
+
+
+def cortes_biquad(num, den, ganho_max=None):
+    """Pontos de -3 dB de funções de transferência de até 2ª ordem, em forma fechada.
+
+    |N(jω)|² = g² |D(jω)|², com g = ganho_max/√2, é uma equação do 2º grau em
+    x = ω², resolvida para todos os projetos de uma vez. Retorna (wc1, wc2) com
+    wc1 <= wc2; se só existir um corte (1ª ordem) ele fica em wc1 e wc2 é NaN.
+    """
+    a2, a1, a0 = _coeficientes_2a_ordem(num).T
+    b2, b1, b0 = _coeficientes_2a_ordem(den).T
+    if ganho_max is None:
+        ganho_max = ganho_maximo_biquad(num, den)
+    g2 = np.asarray(ganho_max, dtype=float)**2 / 2.0
+
+    A = a2**2 - g2 * b2**2
+    B = (a1**2 - 2.0 * a0 * a2) - g2 * (b1**2 - 2.0 * b0 * b2)
+    Cq = a0**2 - g2 * b0**2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        disc = B**2 - 4.0 * A * Cq
+        # fórmula estável: q = -(B + sinal(B)·√Δ)/2, x1 = q/A, x2 = Cq/q
+        q = -0.5 * (B + np.copysign(np.sqrt(np.maximum(disc, 0.0)), B))
+        x1 = np.where(A != 0, q / A, np.nan)
+        x2 = np.where(q != 0, Cq / q, np.nan)
+        # A = 0: equação de 1º grau B x + Cq = 0
+        x_lin = np.where(B != 0, -Cq / B, np.nan)
+        x1 = np.where(A == 0, x_lin, x1)
+        x2 = np.where(A == 0, np.nan, x2)
+
+    raizes = np.stack([x1, x2], axis=1)
+    valida = ((disc >= 0) | (A == 0))[:, None] & (raizes > 0)
+    raizes = np.where(valida, raizes, np.nan)
+    w = np.sort(np.sqrt(raizes), axis=1)   # NaN vai para o fim
+    return w[:, 0], w[:, 1]
+
+
+def _modulos_raizes(p):
+    # |raízes| de cada linha, NaN onde não há raiz (ou ela é 0); grau <= 2 em
+    # forma fechada, graus maiores com np.roots linha a linha
+    p = np.atleast_2d(p)
+    if p.shape[1] > 3:
+        saida = np.full((p.shape[0], p.shape[1] - 1), np.nan)
+        for i, linha in enumerate(p):
+            r = np.abs(np.roots(linha))
+            saida[i, :r.size] = r
+    else:
+        c2, c1, c0 = _coeficientes_2a_ordem(p).T
+        with np.errstate(divide='ignore', invalid='ignore'):
+            disc = c1**2 - 4.0 * c2 * c0
+            q = -0.5 * (c1 + np.copysign(np.sqrt(np.maximum(disc, 0.0)), c1))
+            r1 = np.where(disc >= 0, np.abs(q / c2), np.sqrt(c0 / c2))   # par complexo: |r| = √(c0/c2)
+            r2 = np.where(disc >= 0, np.abs(c0 / q), r1)
+            r1 = np.where(c2 == 0, np.abs(c0 / c1), r1)
+            r2 = np.where(c2 == 0, np.nan, r2)
+        saida = np.stack([r1, r2], axis=1)
+    return np.where(np.isfinite(saida) & (saida > 0), saida, np.nan)
+
+
+@perfil.medir("cortes/numerico")
+def cortes_numericos(num, den, ganho_max, w, tamanho_bloco=4096):
+    """Pontos de -3 dB (wc1, wc2) por busca numérica (brentq), para qualquer H(s).
+
+    w é a grade de busca de cada projeto, (n_projetos, n_pontos) em ordem
+    crescente (NaN é ignorado). |H(jω)| - ganho_max/√2 é avaliado na grade de
+    todos os projetos de uma vez; projetos sem mudança de sinal ficam NaN sem
+    passar pelo brentq, que só refina o primeiro e o último cruzamento.
+    Com um só cruzamento, ele fica em wc1 e wc2 é NaN.
+    """
+    from scipy.optimize import brentq
+
+    num = np.atleast_2d(num)
+    den = np.atleast_2d(den)
+    alvo = np.asarray(ganho_max, dtype=float) / np.sqrt(2.0)
+    wc1 = np.full(w.shape[0], np.nan)
+    wc2 = np.full(w.shape[0], np.nan)
+    for ini in range(0, w.shape[0], tamanho_bloco):
+        trecho = slice(ini, ini + tamanho_bloco)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f = np.abs(avaliar_lote(num[trecho], den[trecho], w[trecho])) - alvo[trecho, None]
+        muda = np.sign(f[:, :-1]) * np.sign(f[:, 1:]) < 0
+        for i in np.flatnonzero(muda.any(axis=1)):
+            k = ini + i
+            cruzamentos = np.flatnonzero(muda[i])
+
+            def H_abs(x):
+                return np.abs(avaliar_lote(num[k:k + 1], den[k:k + 1], [x]))[0, 0] - alvo[k]
+
+            wc1[k] = brentq(H_abs, w[k, cruzamentos[0]], w[k, cruzamentos[0] + 1])
+            if cruzamentos.size > 1:
+                wc2[k] = brentq(H_abs, w[k, cruzamentos[-1]], w[k, cruzamentos[-1] + 1])
+    return wc1, wc2
+
+
+def _grade_busca(num, den, n_busca=400):
+    # grade log de ±4 décadas em volta de √(menor·maior |pólo|), mais pontos em
+    # volta do módulo de pólos e zeros com afastamentos relativos de 1e-12 a 1:
+    # a grade log sozinha não enxerga uma banda estreita (Q alto)
+    afastamentos = np.logspace(-12, 0, 61)
+    polos = _modulos_raizes(den)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)     # linha sem pólos: w_ref = 1
+        w_ref = np.nan_to_num(np.sqrt(np.nanmin(polos, axis=1) * np.nanmax(polos, axis=1)), nan=1.0)
+    raizes = np.concatenate([polos, _modulos_raizes(num)], axis=1)[:, :, None]
+    extras = np.concatenate([raizes * (1.0 - afastamentos[:-1]), raizes * (1.0 + afastamentos)], axis=2)
+    w = np.concatenate([w_ref[:, None] * np.logspace(-4, 4, n_busca),
+                        extras.reshape(extras.shape[0], -1)], axis=1)
+    return np.sort(w, axis=1)     # NaN vai para o fim
+
+
+@perfil.medir("cortes")
+def cortes_3db(num, den, ganho_max=None, rtol=1e-6):
+    """Pontos de -3 dB (wc1, wc2) de vários projetos.
+
+    Usa a forma fechada para polinômios de até 2ª ordem e confere o resultado
+    em |H(jωc)|; projetos que não passam na conferência (ou ordens maiores)
+    caem na busca numérica de `cortes_numericos`.
+    """
+    num = np.atleast_2d(np.asarray(num, dtype=float))
+    den = np.atleast_2d(np.asarray(den, dtype=float))
+    n = max(num.shape[0], den.shape[0])
+    num = np.broadcast_to(num, (n, num.shape[1]))
+    den = np.broadcast_to(den, (n, den.shape[1]))
+
+    if num.shape[1] <= 3 and den.shape[1] <= 3:
+        if ganho_max is None:
+            ganho_max = ganho_maximo_biquad(num, den)
+        ganho_max = np.broadcast_to(np.asarray(ganho_max, dtype=float), (n,))
+        wc1, wc2 = cortes_biquad(num, den, ganho_max)
+
+        # conferência: |H(jωc)| deve ser ganho_max/√2
+        w = np.stack([wc1, wc2], axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            erro = np.abs(np.abs(avaliar_lote(num, den, np.nan_to_num(w, nan=1.0)))
+                          * np.sqrt(2.0) / ganho_max[:, None] - 1.0)
+        falhou = np.any(np.isfinite(w) & ~(erro <= rtol), axis=1) | np.isnan(wc1)
+        if not np.any(falhou):
+            return wc1, wc2
+    else:
+        if ganho_max is None:
+            raise ValueError("Informe ganho_max para funções de ordem maior que 2.")
+        ganho_max = np.broadcast_to(np.asarray(ganho_max, dtype=float), (n,))
+        wc1 = np.full(n, np.nan)
+        wc2 = np.full(n, np.nan)
+        falhou = np.ones(n, dtype=bool)
+
+    # fallback numérico: só os projetos que falharam, todos de uma vez. Quem
+    # não cruza ganho_max/√2 (notch raso, patamar deixado pelo ESR) fica NaN
+    # direto: no biquad pelo ganho mínimo exato, nos demais pela grade
+    falhos = np.flatnonzero(falhou)
+    if num.shape[1] <= 3 and den.shape[1] <= 3:
+        cruza = _ganho_minimo_biquad(num[falhos], den[falhos]) < ganho_max[falhos] / np.sqrt(2.0)
+    else:
+        cruza = np.ones(falhos.size, dtype=bool)
+    busca = falhos[cruza]
+    achado1 = np.full(falhos.size, np.nan)
+    achado2 = np.full(falhos.size, np.nan)
+    if busca.size:
+        achado1[cruza], achado2[cruza] = cortes_numericos(num[busca], den[busca], ganho_max[busca],
+                                                          _grade_busca(num[busca], den[busca]))
+    sem_corte = falhos[np.isnan(achado1) & np.isfinite(wc1[falhos])]
+    wc1[falhos] = achado1
+    wc2[falhos] = achado2
+    if sem_corte.size:
+        warnings.warn(f"cortes_3db: {sem_corte.size} projeto(s) com corte em forma fechada não "
+                      f"confirmado pela busca numérica (ex.: índice {sem_corte[0]}); ficaram NaN.",
+                      RuntimeWarning, stacklevel=2)
+    return wc1, wc2
+
+
+@perfil.medir("resposta")
+def resposta_lote(tipo, R, C, L=None, w=None, n_pontos=None, dtype=np.complex128, parasitas=None):
+    """Avalia |H(jω)| e fase de vários projetos num único broadcast NumPy.
+
+    Parâmetros
+    ----------
+    tipo : 'passa_baixa', 'passa_alta', 'passa_faixa' ou 'rejeita_faixa'
+        (os nomes da interface, como 'Passa-Faixa', também são aceitos).
+    R, C, L : escalares ou vetores (broadcast entre si); L só para filtros RLC.
+    w : grade em rad/s compartilhada por todos os projetos (1-D). Se omitida,
+        cada projeto usa a grade log padrão do seu módulo, centrada em ωc/ω0.
+    n_pontos : número de pontos da grade padrão.
+    dtype : np.complex64 avalia em precisão simples (mag e fase em float32).
+    parasitas : Parasitas (resistências do indutor, do capacitor, da fonte e da carga).
+
+    Retorna um dicionário com 'w', 'mag' (linear), 'fase' (graus), matrizes
+    (n_projetos, n_pontos), e as métricas de `metricas_lote` como vetores.
+    """
+    tipo, R, C, L = componentes_lote(tipo, R, C, L)
+    num, den = coeficientes_lote(tipo, R, C, L, parasitas)
+    if parasitas is None:
+        metricas = metricas_lote(tipo, R, C, L)
+    else:
+        metricas = _metricas_parasitas(tipo, num, den)
+
+    if w is None:
+        w = grade_lote(tipo, frequencia_referencia(tipo, metricas, den), n_pontos)
+    else:
+        w = np.asarray(w, dtype=float)
+        if w.ndim == 1:
+            w = np.broadcast_to(w, (R.size, w.size))
+
+    mag, fase = magnitude_fase(num, den, w, dtype)
+    resultado = {"w": w, "mag": mag, "fase": fase}
+    resultado.update(metricas)
+    return resultado
+
+
+# -----------------------------
+# Grade adaptativa
+# -----------------------------
+# orçamento padrão de pontos da grade adaptativa
+N_MAX_ADAPTATIVA = 1000
+
+def _curva(H, piso_db):
+    # magnitude em dB (com piso, para zeros exatos no eixo jω) e fase em graus
+    mag_db = 20.0 * np.log10(np.maximum(np.abs(H), 10.0**(piso_db / 20.0)))
+    return mag_db, np.angle(H, deg=True)
+
+
+@perfil.medir("resposta/adaptativa")
+def grade_adaptativa(num, den, w_min, w_max, tol_db=0.05, tol_fase=0.5, n_max=N_MAX_ADAPTATIVA,
+                     n_inicial=32, pontos=(), piso_db=-300.0, largura_min=1e-9):
+    """Grade log refinada onde a resposta varia, para um único projeto.
+
+    Começa com n_inicial pontos entre w_min e w_max mais os pontos críticos
+    (módulos de pólos e zeros e as frequências em `pontos`, como ωc/ω0) e
+    divide ao meio (em log ω) cada intervalo cuja interpolação linear erra o
+    ponto médio em mais de tol_db (magnitude) ou tol_fase (graus). Para quando
+    todos os intervalos passam ou quando a grade atinge n_max pontos.
+
+    Retorna (w, H) ordenados.
+    """
+    num = np.trim_zeros(np.ravel(np.asarray(num, dtype=float)), 'f')
+    den = np.trim_zeros(np.ravel(np.asarray(den, dtype=float)), 'f')
+
+    criticos = [np.abs(np.roots(num)) if num.size > 1 else [],
+                np.abs(np.roots(den)) if den.size > 1 else [],
+                np.asarray(pontos, dtype=float)]
+    criticos = np.concatenate([np.ravel(c) for c in criticos])
+    criticos = criticos[np.isfinite(criticos) & (criticos > w_min) & (criticos < w_max)]
+
+    u = np.concatenate([np.linspace(np.log10(w_min), np.log10(w_max), n_inicial),
+                        np.log10(criticos)])
+    u = np.unique(u)
+    H = avaliar_lote(num, den, 10.0**u)[0]
+    mag_db, fase = _curva(H, piso_db)
+    ativo = np.ones(u.size - 1, dtype=bool)   # intervalos ainda não conferidos
+
+    while np.any(ativo) and u.size < n_max:
+        i = np.flatnonzero(ativo & (np.diff(u) > largura_min))
+        if i.size == 0:
+            break
+        u_meio = 0.5 * (u[i] + u[i + 1])
+        H_meio = avaliar_lote(num, den, 10.0**u_meio)[0]
+        mag_meio, fase_meio = _curva(H_meio, piso_db)
+
+        erro_mag = np.abs(mag_meio - 0.5 * (mag_db[i] + mag_db[i + 1]))
+        # diferença de fase "enrolada" em (-180, 180]
+        erro_fase = np.abs((fase_meio - 0.5 * (fase[i] + fase[i + 1]) + 180.0) % 360.0 - 180.0)
+        excesso = np.maximum(erro_mag / tol_db, erro_fase / tol_fase)
+
+        dividir = np.flatnonzero(excesso > 1.0)
+        vagas = n_max - u.size
+        if dividir.size > vagas:
+            # orçamento: refina primeiro os intervalos com maior erro
+            dividir = dividir[np.argsort(excesso[dividir])[::-1][:vagas]]
+            dividir.sort()
+
+        ativo[:] = False
+        if dividir.size == 0:
+            break
+        pos = i[dividir] + 1
+        u = np.insert(u, pos, u_meio[dividir])
+        H = np.insert(H, pos, H_meio[dividir])
+        mag_db = np.insert(mag_db, pos, mag_meio[dividir])
+        fase = np.insert(fase, pos, fase_meio[dividir])
+        # as duas metades de cada intervalo dividido voltam a ser conferidas
+        ativo = np.insert(ativo, pos, True)
+        ativo[pos + np.arange(pos.size) - 1] = True
+
+    return 10.0**u, H
+
+
+# -----------------------------
+# Um projeto por vez
+# -----------------------------
+@dataclass(frozen=True)
+class FiltroSpec:
+    """Especificação de um filtro: tipo e valores de componentes (Ω, H, F)."""
+    tipo: str
+    R: float
+    C: float
+    L: Optional[float] = None
+    n_pontos: Optional[int] = None
+    # "fixa": logspace com n_pontos; "adaptativa": refina até tol_db, com
+    # no máximo n_pontos (padrão N_MAX_ADAPTATIVA) avaliações
+    grade: str = "fixa"
+    tol_db: float = 0.05
+    # None: componentes ideais
+    parasitas: Optional[Parasitas] = None
+
+    def __post_init__(self):
+        object.__setattr__(self, "tipo", normalizar_tipo(self.tipo))
+        if self.tipo in TIPOS_RLC and self.L is None:
+            raise ValueError(f"O filtro {self.tipo} precisa do valor de L.")
+        if self.grade not in ("fixa", "adaptativa"):
+            raise ValueError(f"Grade desconhecida: {self.grade!r}")
+
+
+@dataclass(frozen=True)
+class Metricas:
+    """Frequências características (rad/s); NaN quando não se aplicam."""
+    wc: float
+    wc1: float
+    wc2: float
+    w0: float
+    BW: float
+    Q: float
+
+
+@dataclass
+class RespostaFiltro:
+    """Resultado do cálculo: resposta em frequência e métricas de um filtro."""
+    spec: FiltroSpec
+    w: np.ndarray
+    mag: np.ndarray
+    fase: np.ndarray
+    metricas: Metricas
+    num: np.ndarray = field(repr=False)
+    den: np.ndarray = field(repr=False)
+
+    @property
+    def mag_norm(self):
+        # magnitude normalizada (máx = 1) na grade calculada
+        return self.mag / np.max(self.mag)
+
+
+def calcular(spec, w=None):
+    """Calcula resposta em frequência e métricas de um FiltroSpec."""
+    num, den = coeficientes_lote(spec.tipo, spec.R, spec.C, spec.L, spec.parasitas)
+    if w is None and spec.grade == "adaptativa":
+        m = metricas_lote(spec.tipo, spec.R, spec.C, spec.L, spec.parasitas)
+        extremos = grade_lote(spec.tipo, frequencia_referencia(spec.tipo, m, den), n_pontos=2)[0]
+        w, H = grade_adaptativa(num[0], den[0], extremos[0], extremos[-1], tol_db=spec.tol_db,
+                                n_max=spec.n_pontos or N_MAX_ADAPTATIVA,
+                                pontos=[m[k][0] for k in ("wc", "wc1", "wc2", "w0")])
+        r = dict(m, w=w[None, :], mag=np.abs(H)[None, :], fase=np.angle(H, deg=True)[None, :])
+    else:
+        r = resposta_lote(spec.tipo, spec.R, spec.C, spec.L, w=w, n_pontos=spec.n_pontos,
+                          parasitas=spec.parasitas)
+    metricas = Metricas(**{k: float(r[k][0]) for k in ("wc", "wc1", "wc2", "w0", "BW", "Q")})
+    return RespostaFiltro(spec=spec, w=r["w"][0], mag=r["mag"][0], fase=r["fase"][0],
+                          metricas=metricas, num=num[0], den=den[0])
+
+
+# -----------------------------
+# Recalculo incremental (ajuste de um componente)
+# -----------------------------
+class Sintonia:
+    """Resposta de um projeto refeita aos poucos quando R, L ou C mudam.
+
+    A grade de frequências e as potências de jω (s², s, 1) são calculadas uma
+    vez. A cada ajuste só os coeficientes são refeitos, e N(jω) ou D(jω) só
+    é reavaliado se os seus coeficientes mudaram (ex.: R no passa-baixa só
+    muda o denominador). A mesma grade (o mesmo array w) é devolvida enquanto
+    ωc/ω0 não sai da década central dela, o que permite ao PainelBode trocar
+    só os valores das curvas. Com `w` fixo a grade nunca muda.
+
+    Uso::
+
+        s = Sintonia(FiltroSpec("passa_faixa", 100, 1e-6, 1e-3))
+        resposta = s.ajustar(R=120)
+    """
+
+    def __init__(self, spec, w=None):
+        self.spec = spec
+        self._w_fixa = w is not None
+        self._preparar_grade(w)
+        self.resposta = self._calcular()
+
+    def _preparar_grade(self, w=None, w_ref=None):
+        if w is None:
+            if w_ref is None:
+                spec = self.spec
+                m = metricas_lote(spec.tipo, spec.R, spec.C, spec.L, spec.parasitas)
+                _, den = coeficientes_lote(spec.tipo, spec.R, spec.C, spec.L, spec.parasitas)
+                w_ref = frequencia_referencia(spec.tipo, m, den)
+            w = grade_lote(self.spec.tipo, w_ref, self.spec.n_pontos)[0]
+        self.w = np.asarray(w, dtype=float)
+        s = eixo_jw(self.w)
+        self._potencias = np.stack([s * s, s, np.ones_like(s)])
+        self._num = self._den = self._N = self._D = None
+
+    def _avaliar(self, coef, anterior, valores):
+        # reaproveita P(jω) se os coeficientes não mudaram
+        if valores is not None and np.array_equal(coef, anterior):
+            return valores
+        return coef @ self._potencias
+
+    def _metricas(self):
+        # as mesmas formas fechadas de metricas_lote, em escalares (um projeto só);
+        # no RLC os cortes -3 dB são as raízes de ω² ∓ BW ω - ω0² = 0
+        R, C, L = self.spec.R, self.spec.C, self.spec.L
+        if self.spec.parasitas is not None:
+            m = metricas_lote(self.spec.tipo, R, C, L, self.spec.parasitas)
+            return Metricas(**{k: float(v[0]) for k, v in m.items()})
+        nan = float("nan")
+        if self.spec.tipo not in TIPOS_RLC:
+            return Metricas(wc=1.0 / (R * C), wc1=nan, wc2=nan, w0=nan, BW=nan, Q=nan)
+        w0 = 1.0 / math.sqrt(L * C)
+        BW = R / L
+        wc2 = math.hypot(BW / 2.0, w0) + BW / 2.0
+        return Metricas(wc=nan, wc1=w0**2 / wc2, wc2=wc2, w0=w0, BW=BW, Q=w0 / BW)
+
+    def _calcular(self):
+        spec = self.spec
+        num, den = coeficientes_lote(spec.tipo, spec.R, spec.C, spec.L, spec.parasitas)
+        metricas = self._metricas()
+        w_ref = float(frequencia_referencia(spec.tipo, {"wc": metricas.wc, "w0": metricas.w0}, den)[0])
+        if not self._w_fixa and not self.w[0] * 10.0 <= w_ref <= self.w[-1] / 10.0:
+            self._preparar_grade(w_ref=w_ref)
+
+        num3 = np.concatenate([np.zeros(3 - num.shape[1]), num[0]])
+        den3 = np.concatenate([np.zeros(3 - den.shape[1]), den[0]])
+        self._N = self._avaliar(num3, self._num, self._N)
+        self._D = self._avaliar(den3, self._den, self._D)
+        self._num, self._den = num3, den3
+
+        H = self._N / self._D
+        self.resposta = RespostaFiltro(spec=spec, w=self.w, mag=np.abs(H), fase=np.angle(H, deg=True),
+                                       metricas=metricas, num=num[0], den=den[0])
+        return self.resposta
+
+    def ajustar(self, R=None, C=None, L=None):
+        """Troca os componentes informados e devolve a nova RespostaFiltro."""
+        mudancas = {k: v for k, v in (("R", R), ("C", C), ("L", L)) if v is not None}
+        self.spec = replace(self.spec, **mudancas)
+        return self._calcular()
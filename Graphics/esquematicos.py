@@ -0,0 +1,129 @@
+import functools
+
+import perfil
+from calculo import normalizar_tipo
+
+# A topologia de cada filtro não muda: o circuito é desenhado uma única vez
+# (backend SVG do schemdraw, com rótulos-modelo como '{R}') e guardado em
+# memória. A cada uso só os rótulos são trocados pelo texto dos valores.
+
+# arquivo gerado por cada tipo de filtro
+ARQUIVOS = {
+    "passa_baixa": 'rc_lowpass_diagram.svg',
+    "passa_alta": 'rc_highpass_diagram.svg',
+    "passa_faixa": 'rlc_user_diagram_fixed.svg',
+    "rejeita_faixa": 'rlc_notch_diagram.svg',
+}
+
+
+def _passa_baixa(d, elm):
+    # Fonte senoidal
+    d.add(elm.SourceSin().label('Vin', loc='left'))
+    # Resistor em série
+    r = d.add(elm.Resistor().right().label('{R}'))
+    # Nó de saída +
+    d.add(elm.Dot(open=True).at(r.end).label('Vout+', loc='right'))
+    # Capacitor para o terra
+    c = d.add(elm.Capacitor().down().label('{C}'))
+    d.add(elm.Dot(open=True).at(c.end).label('Vout-', loc='right'))
+    d.add(elm.Line().left())
+
+
+def _passa_alta(d, elm):
+    # Fonte senoidal
+    d.add(elm.SourceSin().label('Vin', loc='left'))
+    # Capacitor em série
+    c = d.add(elm.Capacitor().right().label('{C}'))
+    # Nó de saída +
+    d.add(elm.Dot(open=True).at(c.end).label('Vout+', loc='right'))
+    # Resistor para o terra
+    r = d.add(elm.Resistor().down().label('{R}'))
+    d.add(elm.Dot(open=True).at(r.end).label('Vout-', loc='right'))
+    d.add(elm.Line().left())
+
+
+def _passa_faixa(d, elm):
+    # Fonte senoidal
+    d.add(elm.SourceSin().label('Vin', loc='left')) #Talvez mudança aqui.
+    #Nó de entrada
+    d.add(elm.Dot(open=True).label('Vout+', loc='left'))
+    # Resistor
+    r = d.add(elm.Resistor().right().label('{R}'))
+    # Nó de saída
+    d.add(elm.Dot(open=True).at(r.end).label('Vout-', loc='right'))
+    # Indutor
+    d.add(elm.Inductor().down().label('{L}'))
+    # Capacitor
+    d.add(elm.Capacitor().left().label('{C}'))
+
+
+def _rejeita_faixa(d, elm):
+    # Fonte senoidal
+    d.add(elm.SourceSin().label('Vin', loc='right')) #Talvez mudança aqui.
+    # Resistor
+    r = d.add(elm.Resistor().right().label('{R}'))
+    # Nó de entrada
+    d.add(elm.Dot(open=True).at(r.end).label('Vout+', loc='right'))
+    # Indutor
+    d.add(elm.Inductor().down().label('{L}'))
+    # Capacitor
+    c = d.add(elm.Capacitor().left().label('{C}'))
+    #Nó de saída
+    d.add(elm.Dot(open=True).at(c.end).label('Vout-', loc='left'))
+
+
+_CIRCUITOS = {
+    "passa_baixa": _passa_baixa,
+    "passa_alta": _passa_alta,
+    "passa_faixa": _passa_faixa,
+    "rejeita_faixa": _rejeita_faixa,
+}
+
+
+@functools.lru_cache(maxsize=None)
+@perfil.medir("esquematico/schemdraw")
+def modelo(tipo):
+    """SVG do circuito com os rótulos '{R}', '{L}', '{C}' (renderizado uma vez por tipo)."""
+    tipo = normalizar_tipo(tipo)
+    # schemdraw só é importado aqui: depois do primeiro uso o SVG vem do cache
+    import schemdraw
+    import schemdraw.elements as elm
+
+    d = schemdraw.Drawing(canvas='svg', show=False)
+    d.config(unit=3)
+    _CIRCUITOS[tipo](d, elm)
+    return d.get_imagedata('svg').decode('utf-8')
+
+
+_PREFIXOS = [(1e9, 'G'), (1e6, 'M'), (1e3, 'k'), (1.0, ''), (1e-3, 'm'),
+             (1e-6, 'µ'), (1e-9, 'n'), (1e-12, 'p')]
+
+
+def formatar(valor, unidade):
+    """100 -> '100 Ω', 1e-6 -> '1 µF' (prefixos SI, 3 algarismos)."""
+    # arredonda antes de escolher o prefixo: 999.99 vira 1000 e sai '1 kΩ'
+    valor = float(f"{valor:.3g}")
+    for fator, prefixo in _PREFIXOS:
+        if abs(valor) >= fator:
+            break
+    return f"{valor / fator:.3g} {prefixo}{unidade}"
+
+
+def svg(tipo, R=None, C=None, L=None):
+    """SVG do circuito com os valores dos componentes nos rótulos."""
+    texto = modelo(tipo)
+    for nome, valor, unidade in (('R', R, 'Ω'), ('L', L, 'H'), ('C', C, 'F')):
+        rotulo = nome if valor is None else f"{nome} = {formatar(valor, unidade)}"
+        texto = texto.replace('{' + nome + '}', rotulo)
+    return texto
+
+
+@perfil.medir("esquematico")
+def desenhar(tipo, arquivo=None, R=None, C=None, L=None):
+    """Salva o circuito do filtro em SVG. Retorna o nome do arquivo."""
+    tipo = normalizar_tipo(tipo)
+    if arquivo is None:
+        arquivo = ARQUIVOS[tipo]
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        f.write(svg(tipo, R, C, L))
+    return arquivo
@@ -0,0 +1,365 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import NullLocator
+# pyplot (que escolhe e carrega o backend de janela) só é importado nas
+# funções que abrem janelas; PainelBode e renderizar_lote não precisam dele
+
+import calculo
+import perfil
+
+TITULOS = {
+    "passa_baixa": "Filtro RC Passa-Baixa",
+    "passa_alta": "Filtro RC Passa-Alta",
+    "passa_faixa": "Filtro Passa-Faixa RLC",
+    "rejeita_faixa": "Filtro Rejeita-Faixa RLC",
+}
+
+
+# -----------------------------
+# Marcações de cada tipo de filtro
+# -----------------------------
+def _magnitude_rc(ax, m):
+    # linha de corte
+    ax.axvline(m.wc, color='r', linestyle='--', linewidth=1.5, label=rf'$\omega_c$ = {m.wc:.2e}')
+
+
+def _fase_rc(ax, m, fase):
+    ax.axvline(m.wc, color='r', linestyle='--', linewidth=1.5, label=rf'$\omega_c$ = {m.wc:.2e}')
+
+
+def _magnitude_faixa(ax, m):
+    # linhas verticais
+    ax.axvline(m.wc1, color='g', linestyle='--', linewidth=1.5, label=rf'$\omega_{{c1}}$ = {m.wc1:.2e} rad/s')
+    ax.axvline(m.wc2, color='b', linestyle='--', linewidth=1.5, label=rf'$\omega_{{c2}}$ = {m.wc2:.2e} rad/s')
+    ax.axvline(m.w0,  color='r', linestyle='-',  linewidth=1.5, label=rf'$\omega_0$   = {m.w0:.2e} rad/s')
+
+    # segmento roxo mostrando a banda
+    y_bw = 0.707  # nível de -3 dB na curva normalizada
+    ax.hlines(y_bw, m.wc1, m.wc2, colors='m', linewidth=2)
+
+    # linhas invisíveis só para legenda
+    ax.plot([], [], color='m', linestyle='-', linewidth=2,
+            label=rf'$BW$ = {m.BW:.2e} rad/s')
+    ax.plot([], [], ' ', label=rf'$Q$ = {m.Q:.2f}')   # fator de qualidade
+    ax.set_ylim(-0.05, 1.05)
+
+
+def _fase_faixa(ax, m, fase):
+    # assíntotas horizontais (aproximações didáticas)
+    ax.axhline(90,  color='gray', linestyle='--', linewidth=0.8, alpha=0.7)
+    ax.axhline(0,   color='gray', linestyle='--', linewidth=0.8, alpha=0.7)
+    ax.axhline(-90, color='gray', linestyle='--', linewidth=0.8, alpha=0.7)
+
+    # linhas verticais de referência
+    ax.axvline(m.wc1, color='g', linestyle='--', linewidth=1.2, label=rf'$\omega_{{c1}}$ = {m.wc1:.2e} rad/s')
+    ax.axvline(m.wc2, color='b', linestyle='--', linewidth=1.2, label=rf'$\omega_{{c2}}$ = {m.wc2:.2e} rad/s')
+    ax.axvline(m.w0,  color='r', linestyle='-',  linewidth=1.2, label=rf'$\omega_0$   = {m.w0:.2e} rad/s')
+
+    # valores iniciais e finais da fase
+    fase_ini = - np.round(np.min(fase), 1)
+    fase_fim = - np.round(np.max(fase), 1)
+
+    # handle invisível para valores de fase
+    ax.plot([], [], ' ', label=rf'Fase inicial = {fase_ini:.1f}°')
+    ax.plot([], [], ' ', label=rf'Fase final   = {fase_fim:.1f}°')
+    ax.set_ylim(-120, 120)
+
+
+def _magnitude_rejeita(ax, m):
+    # linhas verticais
+    ax.axvline(m.wc1, color='g', linestyle='--', linewidth=1.5, label=rf'$\omega_{{c1}}$ = {m.wc1:.2e}')
+    ax.axvline(m.wc2, color='b', linestyle='--', linewidth=1.5, label=rf'$\omega_{{c2}}$ = {m.wc2:.2e}')
+    ax.axvline(m.w0,  color='r', linestyle='-',  linewidth=1.5, label=rf'$\omega_0$ = {m.w0:.2e}')
+
+    # adiciona Q e BW na legenda
+    ax.plot([], [], ' ', label=rf'$Q$ = {m.Q:.2f}')
+    ax.plot([], [], ' ', label=rf'$BW$ = {m.BW:.2e} rad/s')
+
+    # linha para largura de banda
+    y_pos = (1/np.sqrt(2))
+    ax.hlines(y=y_pos, xmin=m.wc1, xmax=m.wc2, colors='purple', linestyles='-', linewidth=2)
+    ax.text(np.sqrt(m.wc1*m.wc2), y_pos*1.05, 'BW', color='purple',
+            ha='center', va='bottom', fontsize=12)
+
+
+def _fase_rejeita(ax, m, fase):
+    ax.axvline(m.w0, color='r', linestyle='--', linewidth=1.2, label=rf'$\omega_0$ = {m.w0:.2e}')
+
+
+_MARCAS = {
+    "passa_baixa": (_magnitude_rc, _fase_rc),
+    "passa_alta": (_magnitude_rc, _fase_rc),
+    "passa_faixa": (_magnitude_faixa, _fase_faixa),
+    "rejeita_faixa": (_magnitude_rejeita, _fase_rejeita),
+}
+
+
+def _finalizar(ax, resposta):
+    if resposta.spec.tipo == "passa_faixa":
+        ax.set_xlim(resposta.w[0], resposta.w[-1])
+    ax.grid(which='both', linestyle='--', alpha=0.6)
+    ax.legend()
+    ax.figure.tight_layout()
+
+
+# -----------------------------
+# Figuras
+# -----------------------------
+def figura_magnitude(resposta):
+    """PLOT 1 — Magnitude normalizada."""
+    import matplotlib.pyplot as plt
+
+    tipo = resposta.spec.tipo
+    fig, ax = plt.subplots(figsize=(12, 6))
+    ax.semilogx(resposta.w, resposta.mag_norm, label='|H(jω)| normalizado', linewidth=2)
+    _MARCAS[tipo][0](ax, resposta.metricas)
+
+    ax.set_title(f"{TITULOS[tipo]} — Magnitude normalizada")
+    ax.set_xlabel("ω [rad/s]")
+    ax.set_ylabel("|H(jω)| (normalizado)")
+    _finalizar(ax, resposta)
+    return fig
+
+
+def figura_fase(resposta):
+    """PLOT 2 — Fase."""
+    import matplotlib.pyplot as plt
+
+    tipo = resposta.spec.tipo
+    fig, ax = plt.subplots(figsize=(12, 6))
+    rotulo = '∠H(jω) (real)' if tipo == "passa_faixa" else '∠H(jω)'
+    ax.semilogx(resposta.w, resposta.fase, label=rotulo, linewidth=2)
+    _MARCAS[tipo][1](ax, resposta.metricas, resposta.fase)
+
+    titulo = "Fase (com assíntotas)" if tipo == "passa_faixa" else "Fase"
+    ax.set_title(f"{TITULOS[tipo]} — {titulo}")
+    ax.set_xlabel("ω [rad/s]")
+    ax.set_ylabel("Fase [graus]")
+    _finalizar(ax, resposta)
+    return fig
+
+
+@perfil.medir("grafico")
+def plotar(resposta, mostrar=True):
+    """Gera os gráficos de magnitude e fase; com mostrar=True abre cada janela."""
+    import matplotlib.pyplot as plt
+
+    figuras = []
+    for construir in (figura_magnitude, figura_fase):
+        fig = construir(resposta)
+        figuras.append(fig)
+        if mostrar:
+            plt.show()
+    return figuras
+
+
+# -----------------------------
+# Painel reutilizável
+# -----------------------------
+class PainelBode:
+    """Uma figura com magnitude e fase, atualizada no lugar a cada resposta.
+
+    As curvas são mudadas com set_data e só as marcações (ωc, ω0, BW, legenda)
+    são refeitas, sem criar figuras novas. Usa matplotlib.figure.Figure
+    (sem pyplot) com canvas Agg, então funciona sem tela e também pode ser
+    embutido num FigureCanvasTkAgg. Com leve=True não desenha legenda nem a
+    grade secundária, que são a maior parte do custo de cada quadro.
+
+    Com blit=True (uso interativo) curvas, marcações e legendas são
+    "animadas": depois de um desenho completo o fundo (eixos, grade, rótulos)
+    é guardado, e em atualizações incrementais desenhar() só redesenha os
+    artistas que mudaram por cima dele.
+    """
+
+    def __init__(self, figsize=(9, 7), dpi=100, leve=False, blit=False):
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.leve = leve
+        self.ax_mag, self.ax_fase = self.fig.subplots(2, 1, sharex=True)
+        for ax in (self.ax_mag, self.ax_fase):
+            ax.set_xscale('log')
+            if leve:
+                ax.xaxis.set_minor_locator(NullLocator())
+        self.linha_mag, = self.ax_mag.plot([], [], label='|H(jω)| normalizado', linewidth=2)
+        self.linha_fase, = self.ax_fase.plot([], [], label='∠H(jω)', linewidth=2)
+        self.ax_mag.set_ylabel("|H(jω)| (normalizado)")
+        self.ax_fase.set_xlabel("ω [rad/s]")
+        self.ax_fase.set_ylabel("Fase [graus]")
+        self._tipo = None
+        self._w = None
+        self._incremental = False
+        self.blit = blit
+        self._fundo = None
+        self._animados = False
+        if blit:
+            self.fig.canvas.mpl_connect('draw_event', self._apos_desenho)
+
+    def _limpar_marcas(self):
+        for ax, linha in ((self.ax_mag, self.linha_mag), (self.ax_fase, self.linha_fase)):
+            for artista in list(ax.lines) + list(ax.collections) + list(ax.texts):
+                if artista is not linha:
+                    artista.remove()
+
+    def _variaveis(self):
+        # artistas que mudam a cada atualização: curvas, marcações e legendas
+        for ax in (self.ax_mag, self.ax_fase):
+            yield from ax.lines
+            yield from ax.collections
+            yield from ax.texts
+            if ax.get_legend() is not None:
+                yield ax.get_legend()
+
+    def _animar(self, animado):
+        self._animados = animado
+        for artista in self._variaveis():
+            artista.set_animated(animado)
+
+    def _apos_desenho(self, evento):
+        # após um desenho completo (inclusive ao redimensionar a janela): guarda o
+        # fundo, que não inclui os artistas animados, e desenha-os por cima
+        if not self._animados:
+            return
+        self._fundo = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for artista in self._variaveis():
+            self.fig.draw_artist(artista)
+
+    @staticmethod
+    def _atualizar_legenda(ax):
+        # troca só os textos que mudaram; refaz a legenda se o número de entradas mudou
+        legenda = ax.get_legend()
+        if legenda is None:
+            return
+        _, rotulos = ax.get_legend_handles_labels()
+        textos = legenda.get_texts()
+        if len(textos) != len(rotulos):
+            ax.legend(fontsize='small')
+            return
+        for texto, rotulo in zip(textos, rotulos):
+            if texto.get_text() != rotulo:
+                texto.set_text(rotulo)
+
+    @perfil.medir("grafico/painel")
+    def atualizar(self, resposta):
+        """Troca os dados das curvas e refaz as marcações para `resposta`.
+
+        Se o tipo e a grade de frequências são os da chamada anterior (só um
+        componente mudou, ver calculo.Sintonia), só os valores das curvas, as
+        marcações e os textos da legenda que mudaram são atualizados.
+        """
+        tipo = resposta.spec.tipo
+        incremental = tipo == self._tipo and self._w is not None and (
+            resposta.w is self._w or np.array_equal(resposta.w, self._w))
+        if incremental:
+            self.linha_mag.set_ydata(resposta.mag_norm)
+            self.linha_fase.set_ydata(resposta.fase)
+        else:
+            self.linha_mag.set_data(resposta.w, resposta.mag_norm)
+            self.linha_fase.set_data(resposta.w, resposta.fase)
+            self.linha_fase.set_label('∠H(jω) (real)' if tipo == "passa_faixa" else '∠H(jω)')
+        self._w = resposta.w
+        self._incremental = incremental
+        self._limpar_marcas()
+
+        limites = [ax.get_ylim() for ax in (self.ax_mag, self.ax_fase)]
+        for ax, y, (y_min, y_max) in ((self.ax_mag, resposta.mag_norm, limites[0]),
+                                      (self.ax_fase, resposta.fase, limites[1])):
+            # no modo incremental a escala só muda se a curva sair dela
+            if not incremental or np.nanmin(y) < y_min or np.nanmax(y) > y_max:
+                ax.relim()
+                ax.autoscale_view(scalex=not incremental)
+        marca_mag, marca_fase = _MARCAS[tipo]
+        marca_mag(self.ax_mag, resposta.metricas)
+        marca_fase(self.ax_fase, resposta.metricas, resposta.fase)
+        if incremental:
+            for ax in (self.ax_mag, self.ax_fase):
+                self._atualizar_legenda(ax)
+            if self.blit:
+                self._animar(True)
+                if limites != [ax.get_ylim() for ax in (self.ax_mag, self.ax_fase)]:
+                    self._fundo = None   # a escala mudou: o fundo guardado não vale mais
+            return self.fig
+
+        self.ax_mag.set_title(f"{TITULOS[tipo]} — Magnitude normalizada")
+        self.ax_fase.set_title("Fase")
+        self.ax_mag.set_xlim(resposta.w[0], resposta.w[-1])
+        for ax in (self.ax_mag, self.ax_fase):
+            ax.grid(which='major' if self.leve else 'both', linestyle='--', alpha=0.6)
+            if not self.leve:
+                ax.legend(fontsize='small')
+        if tipo != self._tipo:
+            # tight_layout é caro; só refaz quando muda o tipo (títulos/rótulos)
+            self.fig.tight_layout()
+            self._tipo = tipo
+        if self.blit:
+            self._animar(True)
+            self._fundo = None
+        return self.fig
+
+    def desenhar(self):
+        """Mostra a última atualização no canvas da figura.
+
+        Com blit=True e fundo válido (atualização incremental sem mudança de
+        escala), restaura o fundo e redesenha só curvas, marcações e legendas;
+        senão pede um desenho completo (draw_idle).
+        """
+        canvas = self.fig.canvas
+        if self.blit and self._incremental and self._fundo is not None:
+            canvas.restore_region(self._fundo)
+            for artista in self._variaveis():
+                self.fig.draw_artist(artista)
+            canvas.blit(self.fig.bbox)
+        else:
+            canvas.draw_idle()
+
+    @perfil.medir("grafico/salvar")
+    def salvar(self, arquivo):
+        """Grava a figura atual (PNG direto pelo canvas Agg, com um único desenho)."""
+        # artistas animados não saem no arquivo: desliga durante a gravação
+        self._animar(False)
+        try:
+            if arquivo.endswith(".png"):
+                self.fig.canvas.print_png(arquivo)
+            else:
+                self.fig.savefig(arquivo)
+        finally:
+            self._animar(self.blit)
+            self._fundo = None
+        return arquivo
+
+
+# -----------------------------
+# Gráficos em lote (sem tela)
+# -----------------------------
+def _renderizar_bloco(itens, pasta, formato, inicio, opcoes):
+    # um painel por processo, reaproveitado para todos os itens do bloco
+    painel = PainelBode(**opcoes)
+    arquivos = []
+    for i, item in enumerate(itens, start=inicio):
+        resposta = calculo.calcular(item) if isinstance(item, calculo.FiltroSpec) else item
+        painel.atualizar(resposta)
+        arquivos.append(painel.salvar(os.path.join(pasta, f"{i:06d}_{resposta.spec.tipo}.{formato}")))
+    return arquivos
+
+
+def renderizar_lote(itens, pasta, formato="png", processos=1, figsize=(8, 6), dpi=72, leve=True):
+    """Salva o gráfico de Bode de cada item (FiltroSpec ou RespostaFiltro) em `pasta`.
+
+    Usa uma única figura por processo (PainelBode) e só troca os dados das
+    curvas. Com processos > 1 os itens são divididos entre um pool de
+    processos. Retorna a lista de arquivos, na ordem dos itens.
+    """
+    os.makedirs(pasta, exist_ok=True)
+    itens = list(itens)
+    opcoes = {"figsize": figsize, "dpi": dpi, "leve": leve}
+    if processos <= 1 or len(itens) < 2:
+        return _renderizar_bloco(itens, pasta, formato, 0, opcoes)
+
+    tamanho = -(-len(itens) // processos)
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        futuros = [pool.submit(_renderizar_bloco, itens[ini:ini + tamanho], pasta, formato, ini, opcoes)
+                   for ini in range(0, len(itens), tamanho)]
+        return [arquivo for futuro in futuros for arquivo in futuro.result()]
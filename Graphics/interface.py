@@ -1,67 +1,230 @@
+import queue
+import sys
+import time
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
 
-# importa os arquivos
-import Passa_baixa
-import Passa_alta
-import Passa_faixa
-import Rejeita_Faixa
+INICIO = time.perf_counter()
+
+# O cálculo roda numa thread de trabalho; o resultado volta para a thread do
+# Tk por uma fila, lida periodicamente com root.after. Os gráficos ficam
+# embutidos na janela e são atualizados no lugar (graficos.PainelBode).
+#
+# Para a janela abrir rápido, numpy, matplotlib e schemdraw não são
+# importados no início: logo depois que a janela aparece, a thread de
+# trabalho importa tudo (aquecer) e o painel de gráficos é criado quando
+# o primeiro resultado chega.
+#
+# Os controles deslizantes ao lado de R, L e C multiplicam o valor digitado
+# por até 10× para cima ou para baixo. Esse ajuste roda direto na thread do
+# Tk pelo caminho incremental: calculo.Sintonia reaproveita a grade e as
+# potências de jω, e o PainelBode redesenha só curvas e marcações (blit).
+
+ATRASO_MS = 40          # espera após a última tecla antes de recalcular
+INTERVALO_FILA_MS = 15  # período de leitura da fila de resultados
+
+executor = ThreadPoolExecutor(max_workers=1)
+resultados = queue.Queue()
+pedido_atual = 0        # só o resultado do pedido mais recente é desenhado
+agendado = None
+painel = canvas = None
+sintonia = None         # calculo.Sintonia do último resultado (controles deslizantes)
+
+def aquecer():
+    # roda na thread de trabalho, antes do primeiro cálculo
+    import cache
+    import calculo
+    import esquematicos
+    import graficos
+    from matplotlib.backends import backend_tkagg
+
+def calcular_em_segundo_plano(pedido, tipo, R, C, L, salvar_diagrama):
+    # roda na thread de trabalho: nada de Tk aqui
+    try:
+        import cache
+        import calculo
+        import esquematicos
+
+        spec = calculo.FiltroSpec(tipo, R, C, L)
+        resposta = cache.calcular(spec)
+        arquivo = None
+        if salvar_diagrama:
+            arquivo = esquematicos.desenhar(spec.tipo, R=spec.R, C=spec.C, L=spec.L)
+        resultados.put((pedido, resposta, arquivo, None))
+    except Exception as erro:
+        resultados.put((pedido, None, None, erro))
 
 def rodar_filtro():
+    global pedido_atual, agendado
+    agendado = None
     tipo = combo_tipo.get()
     try:
         R = float(entry_R.get())
         C = float(entry_C.get())
+        L = None
 
         if tipo in ["Passa-Faixa", "Rejeita-Faixa"]:
             L = float(entry_L.get())
+    except ValueError:
+        label_status.config(text="Erro: Digite valores numéricos válidos.")
+        return
+
+    pedido_atual += 1
+    label_status.config(text="Calculando...")
+    executor.submit(calcular_em_segundo_plano, pedido_atual, tipo, R, C, L, var_diagrama.get())
+
+def agendar_calculo(event=None):
+    # agrupa várias teclas seguidas num único cálculo
+    global agendado
+    if agendado is not None:
+        root.after_cancel(agendado)
+    agendado = root.after(ATRASO_MS, rodar_filtro)
+
+def texto_resumo(resposta):
+    m = resposta.metricas
+    if resposta.spec.L is not None:
+        return (f"ω0 = {m.w0:.4e} rad/s   ωc1 = {m.wc1:.4e} rad/s   ωc2 = {m.wc2:.4e} rad/s\n"
+                f"BW = {m.BW:.4e} rad/s   Q = {m.Q:.4f}")
+    return f"ωc = {m.wc:.4e} rad/s"
+
+def criar_painel():
+    # só na thread do Tk; os módulos já foram importados pela thread de trabalho
+    global painel, canvas
+    import graficos
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
-        if tipo == "Passa-Baixa":
-            Passa_baixa.main(R, C)
-        elif tipo == "Passa-Alta":
-            Passa_alta.main(R, C)
-        elif tipo == "Passa-Faixa":
-            Passa_faixa.main(R, L, C)
-        elif tipo == "Rejeita-Faixa":
-            Rejeita_Faixa.main(R, L, C)
+    painel = graficos.PainelBode(blit=True)
+    canvas = FigureCanvasTkAgg(painel.fig, master=root)
+    canvas.get_tk_widget().grid(row=0, column=1, sticky="nsew")
+
+def ajustar_componente(nome, posicao):
+    # controle deslizante: valor digitado × 10**posicao
+    if sintonia is None:
+        return
+    try:
+        valor = float(entradas[nome].get()) * 10.0**float(posicao)
     except ValueError:
-        print("Erro: Digite valores numéricos válidos.")
+        return
+    if valor == getattr(sintonia.spec, nome):
+        return
+    resposta = sintonia.ajustar(**{nome: valor})
+    painel.atualizar(resposta)
+    painel.desenhar()
+    label_status.config(text=f"{texto_resumo(resposta)}\n{nome} = {valor:.4g}")
+
+def verificar_resultados():
+    # descarta resultados antigos e desenha só o mais recente
+    global sintonia
+    ultimo = None
+    while True:
+        try:
+            ultimo = resultados.get_nowait()
+        except queue.Empty:
+            break
+    if ultimo is not None and ultimo[0] == pedido_atual:
+        _, resposta, arquivo, erro = ultimo
+        if erro is not None:
+            label_status.config(text=f"Erro: {erro}")
+        else:
+            if painel is None:
+                criar_painel()
+            painel.atualizar(resposta)
+            painel.desenhar()
+            # novo ponto de partida dos controles deslizantes, na mesma grade
+            import calculo
+            sintonia = calculo.Sintonia(resposta.spec, resposta.w)
+            for escala in escalas.values():
+                escala.set(0.0)
+            texto = texto_resumo(resposta)
+            if arquivo is not None:
+                texto += f"\nDiagrama salvo em '{arquivo}'"
+            label_status.config(text=texto)
+    root.after(INTERVALO_FILA_MS, verificar_resultados)
 
 def atualizar_campos(event):
     tipo = combo_tipo.get()
     if tipo in ["Passa-Faixa", "Rejeita-Faixa"]:
         label_L.grid(row=2, column=0, sticky="w")
         entry_L.grid(row=2, column=1)
+        escalas["L"].grid(row=2, column=2)
     else:
         label_L.grid_remove()
         entry_L.grid_remove()
+        escalas["L"].grid_remove()
+    agendar_calculo()
 
 # --- Interface Tkinter ---
 root = tk.Tk()
 root.title("Simulador de Filtros RLC/RC")
 
-tk.Label(root, text="Tipo de filtro:").grid(row=0, column=0, sticky="w")
-combo_tipo = ttk.Combobox(root, values=["Passa-Baixa", "Passa-Alta", "Passa-Faixa", "Rejeita-Faixa"])
+controles = tk.Frame(root)
+controles.grid(row=0, column=0, sticky="nw", padx=5, pady=5)
+
+tk.Label(controles, text="Tipo de filtro:").grid(row=0, column=0, sticky="w")
+combo_tipo = ttk.Combobox(controles, values=["Passa-Baixa", "Passa-Alta", "Passa-Faixa", "Rejeita-Faixa"])
 combo_tipo.grid(row=0, column=1)
 combo_tipo.bind("<<ComboboxSelected>>", atualizar_campos)
 
-tk.Label(root, text="R [Ω]:").grid(row=1, column=0, sticky="w")
-entry_R = tk.Entry(root)
+tk.Label(controles, text="R [Ω]:").grid(row=1, column=0, sticky="w")
+entry_R = tk.Entry(controles)
 entry_R.insert(0, "100")
 entry_R.grid(row=1, column=1)
 
-label_L = tk.Label(root, text="L [H]:")
-entry_L = tk.Entry(root)
+label_L = tk.Label(controles, text="L [H]:")
+entry_L = tk.Entry(controles)
 entry_L.insert(0, "1e-3")
 label_L.grid_remove()
 entry_L.grid_remove()
 
-tk.Label(root, text="C [F]:").grid(row=3, column=0, sticky="w")
-entry_C = tk.Entry(root)
+tk.Label(controles, text="C [F]:").grid(row=3, column=0, sticky="w")
+entry_C = tk.Entry(controles)
 entry_C.insert(0, "1e-6")
 entry_C.grid(row=3, column=1)
 
-btn = tk.Button(root, text="Rodar", command=rodar_filtro)
-btn.grid(row=4, column=0, columnspan=2, pady=10)
+for entry in (entry_R, entry_L, entry_C):
+    entry.bind("<KeyRelease>", agendar_calculo)
+
+entradas = {"R": entry_R, "L": entry_L, "C": entry_C}
+escalas = {}
+for nome, linha in (("R", 1), ("L", 2), ("C", 3)):
+    escalas[nome] = tk.Scale(controles, from_=-1.0, to=1.0, resolution=0.01, orient="horizontal",
+                             showvalue=False, length=120,
+                             command=lambda posicao, nome=nome: ajustar_componente(nome, posicao))
+    escalas[nome].grid(row=linha, column=2)
+escalas["L"].grid_remove()
+
+var_diagrama = tk.BooleanVar(value=False)
+tk.Checkbutton(controles, text="Salvar diagrama (SVG)", variable=var_diagrama).grid(
+    row=4, column=0, columnspan=3, sticky="w")
+
+btn = tk.Button(controles, text="Rodar", command=rodar_filtro)
+btn.grid(row=5, column=0, columnspan=3, pady=10)
+
+label_status = tk.Label(controles, text="", justify="left", anchor="w")
+label_status.grid(row=6, column=0, columnspan=3, sticky="w")
+
+# gráficos embutidos (criados no primeiro resultado, ver criar_painel)
+root.columnconfigure(1, weight=1)
+root.rowconfigure(0, weight=1)
+
+def fechar():
+    # guarda o cache em disco (se FILTROS_CACHE estiver definido) antes de sair
+    cache = sys.modules.get("cache")
+    if cache is not None and cache.padrao.arquivo is not None:
+        cache.padrao.salvar()
+    executor.shutdown(wait=False, cancel_futures=True)
+    root.destroy()
+
+def medir_inicio():
+    # usado pelo benchmark de inicialização: janela pronta -> sai
+    print(f"janela pronta em {time.perf_counter() - INICIO:.3f} s")
+    fechar()
 
+root.protocol("WM_DELETE_WINDOW", fechar)
+root.after(INTERVALO_FILA_MS, verificar_resultados)
+# importações pesadas em segundo plano, depois que a janela aparece
+root.after_idle(executor.submit, aquecer)
+if "--medir-inicio" in sys.argv:
+    root.after_idle(medir_inicio)
 root.mainloop()
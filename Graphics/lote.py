@@ -0,0 +1,256 @@
+"""Avalia em lote os projetos de um arquivo CSV/JSON e grava uma tabela de resultados.
+
+Cada linha de entrada tem 'tipo', 'R', 'C' e, para passa/rejeita-faixa, 'L';
+as colunas opcionais R_L, R_C, R_fonte e R_carga (resistências parasitas,
+ver calculo.Parasitas) entram no cálculo quando presentes.
+A saída repete tipo, R, C, L e as resistências parasitas e acrescenta wc,
+wc1, wc2, w0, BW, Q e, opcionalmente, |H| (dB) e fase em frequências
+escolhidas:
+
+    python lote.py projetos.csv resultados.csv
+    python lote.py projetos.jsonl resultados.parquet --frequencias 1e3 1e4 1e5
+
+Entrada e saída são lidas e escritas em fluxo, em blocos de linhas, então a
+memória não depende do tamanho do arquivo. Parquet precisa do pyarrow.
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from itertools import islice
+
+import numpy as np
+
+import calculo
+
+METRICAS = ("wc", "wc1", "wc2", "w0", "BW", "Q")
+FORMATOS = ("csv", "jsonl", "parquet")
+PARASITAS = ("R_L", "R_C", "R_fonte", "R_carga")
+
+
+# -----------------------------
+# Entrada
+# -----------------------------
+def _formato(caminho, formato=None):
+    if formato is not None:
+        return formato
+    extensao = os.path.splitext(caminho)[1].lower().lstrip(".")
+    return {"json": "json", "jsonl": "jsonl", "ndjson": "jsonl", "parquet": "parquet"}.get(extensao, "csv")
+
+
+def _abrir_texto(caminho, modo):
+    if caminho == "-":
+        return sys.stdin if "r" in modo else sys.stdout
+    return open(caminho, modo, newline="", encoding="utf-8")
+
+
+def ler_projetos(caminho, formato=None):
+    """Gera um dicionário por projeto, lendo o arquivo aos poucos ('-' = stdin).
+
+    CSV e JSON Lines são lidos linha a linha. Um arquivo .json com uma lista
+    de objetos é carregado inteiro (prefira JSON Lines para arquivos grandes).
+    """
+    formato = _formato(caminho, formato)
+    f = _abrir_texto(caminho, "r")
+    try:
+        if formato == "csv":
+            yield from csv.DictReader(f)
+        elif formato == "jsonl":
+            for linha in f:
+                if linha.strip():
+                    yield json.loads(linha)
+        elif formato == "json":
+            yield from json.load(f)
+        else:
+            raise ValueError(f"Formato de entrada não suportado: {formato!r}")
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def _numero(valor, nome="valor"):
+    if valor is None or valor == "":
+        return None
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"{nome} não é um número: {valor!r}") from None
+
+
+def _componente(linha, nome):
+    # R, C e L: obrigatórios, finitos e positivos
+    valor = _numero(linha.get(nome), nome)
+    if valor is None:
+        raise ValueError(f"Falta o valor de {nome}.")
+    if not math.isfinite(valor) or valor <= 0:
+        raise ValueError(f"{nome} deve ser um número positivo, não {valor!r}.")
+    return valor
+
+
+# -----------------------------
+# Avaliação
+# -----------------------------
+def colunas(frequencias=()):
+    nomes = ["tipo", "R", "C", "L", *PARASITAS, *METRICAS]
+    for w in frequencias:
+        nomes += [f"mag_db@{w:g}", f"fase@{w:g}"]
+    return nomes + ["erro"]
+
+
+def avaliar_linhas(linhas, frequencias=()):
+    """Avalia um bloco de projetos; devolve uma lista de dicionários de resultado.
+
+    Os projetos válidos são agrupados por tipo e avaliados de uma vez
+    (calculo.metricas_lote); linhas inválidas saem com a coluna 'erro'.
+    """
+    frequencias = np.asarray(frequencias, dtype=float)
+    saida = []
+    grupos = {}
+    parasitas = {}      # índice da linha -> calculo.Parasitas (só linhas que têm alguma)
+    for linha in linhas:
+        resultado = dict.fromkeys(colunas(frequencias))
+        try:
+            tipo = calculo.normalizar_tipo(linha.get("tipo"))
+            R, C = _componente(linha, "R"), _componente(linha, "C")
+            L = _componente(linha, "L") if tipo in calculo.TIPOS_RLC else _numero(linha.get("L"), "L")
+            lidos = {k: _numero(linha.get(k), k) for k in PARASITAS}
+            extras = {k: v for k, v in lidos.items() if v is not None}
+            if extras:
+                parasitas[len(saida)] = calculo.Parasitas(**extras)
+            resultado.update(tipo=tipo, R=R, C=C, L=L, **lidos)
+            grupos.setdefault(tipo, []).append(len(saida))
+        except (TypeError, ValueError) as erro:
+            resultado.update(tipo=linha.get("tipo"), erro=str(erro))
+        saida.append(resultado)
+
+    for tipo, indices in grupos.items():
+        R = np.array([saida[i]["R"] for i in indices])
+        C = np.array([saida[i]["C"] for i in indices])
+        L = np.array([saida[i]["L"] for i in indices]) if tipo in calculo.TIPOS_RLC else None
+        p = None
+        if any(i in parasitas for i in indices):
+            # um vetor por resistência; linhas sem ela ficam com o valor ideal
+            ideal = calculo.Parasitas()
+            p = calculo.Parasitas(**{k: np.array([getattr(parasitas.get(i, ideal), k) for i in indices])
+                                     for k in PARASITAS})
+        metricas = calculo.metricas_lote(tipo, R, C, L, p)
+        if frequencias.size:
+            num, den = calculo.coeficientes_lote(tipo, R, C, L, p)
+            H = calculo.avaliar_lote(num, den, frequencias)
+            with np.errstate(divide='ignore'):
+                mag_db = 20.0 * np.log10(np.abs(H))
+            fase = np.degrees(np.angle(H))
+        for j, i in enumerate(indices):
+            for k in METRICAS:
+                saida[i][k] = float(metricas[k][j])
+            for n, w in enumerate(frequencias):
+                saida[i][f"mag_db@{w:g}"] = float(mag_db[j, n])
+                saida[i][f"fase@{w:g}"] = float(fase[j, n])
+    return saida
+
+
+# -----------------------------
+# Saída
+# -----------------------------
+def _finito(valor):
+    # só floats podem ser NaN/±inf; textos e None passam
+    return not isinstance(valor, float) or math.isfinite(valor)
+
+
+class EscritorCSV:
+    def __init__(self, caminho, nomes):
+        self.arquivo = _abrir_texto(caminho, "w")
+        self.escritor = csv.DictWriter(self.arquivo, fieldnames=nomes)
+        self.escritor.writeheader()
+
+    def escrever(self, linhas):
+        # NaN, ±inf e None viram campo vazio
+        self.escritor.writerows({k: ("" if v is None or not _finito(v) else v)
+                                 for k, v in linha.items()} for linha in linhas)
+
+    def fechar(self):
+        if self.arquivo is not sys.stdout:
+            self.arquivo.close()
+
+
+class EscritorJSONL:
+    def __init__(self, caminho, nomes):
+        self.arquivo = _abrir_texto(caminho, "w")
+
+    def escrever(self, linhas):
+        for linha in linhas:
+            # NaN e ±inf não são JSON válido: viram null
+            limpa = {k: (v if _finito(v) else None) for k, v in linha.items()}
+            self.arquivo.write(json.dumps(limpa, ensure_ascii=False, allow_nan=False) + "\n")
+
+    def fechar(self):
+        if self.arquivo is not sys.stdout:
+            self.arquivo.close()
+
+
+class EscritorParquet:
+    def __init__(self, caminho, nomes):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Saída em Parquet precisa do pacote pyarrow (pip install pyarrow).") from None
+        self._pa = pa
+        self.schema = pa.schema([(k, pa.string() if k in ("tipo", "erro") else pa.float64())
+                                 for k in nomes])
+        # cada bloco vira um row group
+        self.escritor = pq.ParquetWriter(caminho, self.schema)
+
+    def escrever(self, linhas):
+        if linhas:
+            self.escritor.write_table(self._pa.Table.from_pylist(linhas, schema=self.schema))
+
+    def fechar(self):
+        self.escritor.close()
+
+
+_ESCRITORES = {"csv": EscritorCSV, "jsonl": EscritorJSONL, "parquet": EscritorParquet}
+
+
+def processar(entrada, saida, frequencias=(), tamanho_bloco=10000,
+              formato_entrada=None, formato_saida=None):
+    """Lê os projetos de `entrada`, avalia e grava em `saida`. Retorna (linhas, erros)."""
+    formato_saida = _formato(saida, formato_saida)
+    if formato_saida not in _ESCRITORES:
+        raise ValueError(f"Formato de saída não suportado: {formato_saida!r}")
+    linhas = ler_projetos(entrada, formato_entrada)
+    escritor = _ESCRITORES[formato_saida](saida, colunas(frequencias))
+    total = erros = 0
+    try:
+        while True:
+            bloco = list(islice(linhas, tamanho_bloco))
+            if not bloco:
+                break
+            resultados = avaliar_linhas(bloco, frequencias)
+            escritor.escrever(resultados)
+            total += len(resultados)
+            erros += sum(r["erro"] is not None for r in resultados)
+    finally:
+        escritor.fechar()
+    return total, erros
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("entrada", help="arquivo .csv, .json ou .jsonl ('-' = stdin, CSV)")
+    parser.add_argument("saida", help="arquivo .csv, .jsonl ou .parquet ('-' = stdout, CSV)")
+    parser.add_argument("--frequencias", type=float, nargs="*", default=(),
+                        help="frequências (rad/s) em que |H| e a fase são amostradas")
+    parser.add_argument("--bloco", type=int, default=10000, help="linhas avaliadas de cada vez")
+    parser.add_argument("--formato-entrada", choices=("csv", "json", "jsonl"))
+    parser.add_argument("--formato-saida", choices=FORMATOS)
+    args = parser.parse_args()
+
+    try:
+        total, erros = processar(args.entrada, args.saida, args.frequencias, args.bloco,
+                                 args.formato_entrada, args.formato_saida)
+    except (OSError, RuntimeError, ValueError) as erro:
+        sys.exit(f"Erro: {erro}")
+    print(f"{total} projetos avaliados, {erros} com erro.", file=sys.stderr)
@@ -0,0 +1,164 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+# Instrumentação das etapas do programa (esquemático, função de transferência,
+# resposta, cortes, simulação no tempo, gráficos). Desligada, cada ponto
+# instrumentado custa só a leitura de uma variável global. Ligada, guarda
+# tempo total/mínimo/máximo e número de chamadas por etapa, contadores e os
+# eventos individuais, exportáveis em JSON ou no formato de trace do Chrome
+# (chrome://tracing ou ui.perfetto.dev).
+#
+# Liga com FILTROS_PERFIL=1, ou perfil.ativar(). Com FILTROS_PERFIL=arquivo.json
+# o relatório é gravado ao sair; se o nome terminar em .trace.json, grava o trace.
+
+MAX_EVENTOS = 1_000_000     # eventos guardados para o trace (as somas continuam depois disso)
+
+_config = os.environ.get("FILTROS_PERFIL", "")
+_ativo = _config not in ("", "0")
+
+_trava = threading.Lock()
+_etapas = {}        # nome -> [chamadas, total, mínimo, máximo]
+_contadores = {}
+_eventos = []       # (nome, início, duração, thread)
+_origem = time.perf_counter()
+
+
+def ativar(ligado=True):
+    """Liga ou desliga a coleta (não apaga o que já foi coletado)."""
+    global _ativo
+    _ativo = bool(ligado)
+
+
+def ativo():
+    return _ativo
+
+
+def limpar():
+    """Apaga tempos, contadores e eventos."""
+    global _origem
+    with _trava:
+        _etapas.clear()
+        _contadores.clear()
+        _eventos.clear()
+        _origem = time.perf_counter()
+
+
+def _registrar(nome, inicio, duracao):
+    with _trava:
+        e = _etapas.get(nome)
+        if e is None:
+            _etapas[nome] = [1, duracao, duracao, duracao]
+        else:
+            e[0] += 1
+            e[1] += duracao
+            e[2] = min(e[2], duracao)
+            e[3] = max(e[3], duracao)
+        if len(_eventos) < MAX_EVENTOS:
+            _eventos.append((nome, inicio, duracao, threading.get_ident()))
+
+
+class _Etapa:
+    __slots__ = ("nome", "inicio")
+
+    def __init__(self, nome):
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        _registrar(self.nome, self.inicio, time.perf_counter() - self.inicio)
+        return False
+
+
+class _Nula:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULA = _Nula()
+
+
+def etapa(nome):
+    """Bloco cronometrado: `with perfil.etapa("grafico"): ...`."""
+    return _Etapa(nome) if _ativo else _NULA
+
+
+def medir(nome):
+    """Decorador que cronometra cada chamada da função como a etapa `nome`."""
+    def decorar(funcao):
+        @functools.wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not _ativo:
+                return funcao(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                _registrar(nome, inicio, time.perf_counter() - inicio)
+        return envolvida
+    return decorar
+
+
+def contar(nome, n=1):
+    """Soma n ao contador `nome` (só quando ativo)."""
+    if _ativo:
+        with _trava:
+            _contadores[nome] = _contadores.get(nome, 0) + n
+
+
+# -----------------------------
+# Relatórios
+# -----------------------------
+def relatorio():
+    """Dicionário com, por etapa, chamadas e tempos (s), e os contadores."""
+    with _trava:
+        etapas = {nome: {"chamadas": n, "total": total, "media": total / n, "min": minimo, "max": maximo}
+                  for nome, (n, total, minimo, maximo) in _etapas.items()}
+        return {"etapas": dict(sorted(etapas.items(), key=lambda kv: -kv[1]["total"])),
+                "contadores": dict(_contadores)}
+
+
+def resumo():
+    """Relatório em texto, etapas da mais para a menos custosa."""
+    r = relatorio()
+    linhas = [f"{'etapa':32s} {'chamadas':>9s} {'total (ms)':>11s} {'média (µs)':>11s}"]
+    for nome, e in r["etapas"].items():
+        linhas.append(f"{nome:32s} {e['chamadas']:9d} {e['total'] * 1e3:11.3f} {e['media'] * 1e6:11.1f}")
+    for nome, n in r["contadores"].items():
+        linhas.append(f"{nome:32s} {n:9d}")
+    return "\n".join(linhas)
+
+
+def trace():
+    """Eventos no formato de trace do Chrome (eventos completos 'X', tempos em µs)."""
+    pid = os.getpid()
+    with _trava:
+        eventos = [{"name": nome, "cat": nome.split("/")[0], "ph": "X", "pid": pid, "tid": tid,
+                    "ts": (inicio - _origem) * 1e6, "dur": duracao * 1e6}
+                   for nome, inicio, duracao, tid in _eventos]
+        contadores = [{"name": nome, "ph": "C", "pid": pid, "ts": 0, "args": {"valor": n}}
+                      for nome, n in _contadores.items()]
+    return {"traceEvents": eventos + contadores, "displayTimeUnit": "ms"}
+
+
+def salvar(caminho):
+    """Grava o relatório em JSON; arquivos terminados em .trace.json recebem o trace do Chrome."""
+    dados = trace() if caminho.endswith(".trace.json") else relatorio()
+    with open(caminho, "w") as f:
+        json.dump(dados, f, indent=None if "traceEvents" in dados else 2)
+    return caminho
+
+
+if _ativo and _config != "1":
+    atexit.register(salvar, _config)
@@ -0,0 +1,143 @@
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+import calculo
+
+# Projeto inverso: dado o alvo (ωc para Passa_baixa/Passa_alta, ω0 e Q ou BW
+# para Passa_faixa/Rejeita_Faixa), procura valores comerciais das séries E.
+# Em vez de enumerar todas as combinações, guarda tabelas ordenadas dos
+# produtos R·C e L·C e usa busca binária (np.searchsorted) nelas.
+
+# mantissas das séries E (IEC 60063), uma década
+SERIES = {
+    "E12": [1.0, 1.2, 1.5, 1.8, 2.2, 2.7, 3.3, 3.9, 4.7, 5.6, 6.8, 8.2],
+    "E24": [1.0, 1.1, 1.2, 1.3, 1.5, 1.6, 1.8, 2.0, 2.2, 2.4, 2.7, 3.0,
+            3.3, 3.6, 3.9, 4.3, 4.7, 5.1, 5.6, 6.2, 6.8, 7.5, 8.2, 9.1],
+    "E96": [1.00, 1.02, 1.05, 1.07, 1.10, 1.13, 1.15, 1.18, 1.21, 1.24, 1.27, 1.30,
+            1.33, 1.37, 1.40, 1.43, 1.47, 1.50, 1.54, 1.58, 1.62, 1.65, 1.69, 1.74,
+            1.78, 1.82, 1.87, 1.91, 1.96, 2.00, 2.05, 2.10, 2.15, 2.21, 2.26, 2.32,
+            2.37, 2.43, 2.49, 2.55, 2.61, 2.67, 2.74, 2.80, 2.87, 2.94, 3.01, 3.09,
+            3.16, 3.24, 3.32, 3.40, 3.48, 3.57, 3.65, 3.74, 3.83, 3.92, 4.02, 4.12,
+            4.22, 4.32, 4.42, 4.53, 4.64, 4.75, 4.87, 4.99, 5.11, 5.23, 5.36, 5.49,
+            5.62, 5.76, 5.90, 6.04, 6.19, 6.34, 6.49, 6.65, 6.81, 6.98, 7.15, 7.32,
+            7.50, 7.68, 7.87, 8.06, 8.25, 8.45, 8.66, 8.87, 9.09, 9.31, 9.53, 9.76],
+}
+SERIES["E48"] = SERIES["E96"][::2]
+
+# faixas padrão de cada componente
+FAIXA_R = (1.0, 1e6)       # Ω
+FAIXA_L = (1e-6, 1.0)      # H
+FAIXA_C = (1e-12, 1e-5)    # F
+
+
+@functools.lru_cache(maxsize=None)
+def valores_serie(serie, minimo, maximo):
+    """Todos os valores da série entre minimo e maximo, em ordem crescente."""
+    if serie not in SERIES:
+        raise ValueError(f"Série desconhecida: {serie!r}")
+    mantissas = np.array(SERIES[serie])
+    decadas = np.arange(np.floor(np.log10(minimo)), np.ceil(np.log10(maximo)) + 1)
+    valores = (mantissas[None, :] * 10.0**decadas[:, None]).ravel()
+    # arredonda para tirar o ruído de 10**k (ex.: 4.7e-9 em vez de 4.7000000000000004e-9)
+    valores = np.array([float(f"{v:.3g}") for v in valores])
+    valores = valores[(valores >= minimo * (1 - 1e-9)) & (valores <= maximo * (1 + 1e-9))]
+    valores.flags.writeable = False
+    return valores
+
+
+@dataclass(frozen=True)
+class TabelaProdutos:
+    """Produtos a·b de duas listas de valores, ordenados, com os índices de origem."""
+    a: np.ndarray
+    b: np.ndarray
+    produtos: np.ndarray
+    ia: np.ndarray
+    ib: np.ndarray
+
+    def vizinhos(self, alvo, k):
+        """Os k produtos mais próximos de `alvo` (em escala log), por busca binária."""
+        i = np.searchsorted(self.produtos, alvo)
+        ini = max(0, i - k)
+        fim = min(self.produtos.size, i + k)
+        janela = np.arange(ini, fim)
+        ordem = np.argsort(np.abs(np.log(self.produtos[janela] / alvo)))[:k]
+        return janela[ordem]
+
+
+@functools.lru_cache(maxsize=None)
+def tabela_produtos(serie, faixa_a, faixa_b):
+    a = valores_serie(serie, *faixa_a)
+    b = valores_serie(serie, *faixa_b)
+    produtos = np.multiply.outer(a, b).ravel()
+    ordem = np.argsort(produtos, kind="stable")
+    ia, ib = np.divmod(ordem, b.size)
+    return TabelaProdutos(a, b, produtos[ordem], ia, ib)
+
+
+def _mais_proximos(valores, alvos):
+    # para cada alvo, os dois vizinhos na lista ordenada (busca binária)
+    i = np.clip(np.searchsorted(valores, alvos), 1, valores.size - 1)
+    return np.stack([valores[i - 1], valores[i]], axis=-1)
+
+
+@dataclass(frozen=True)
+class Candidato:
+    """Uma combinação de valores comerciais e as métricas que ela produz."""
+    R: float
+    C: float
+    L: float
+    wc: float
+    w0: float
+    BW: float
+    Q: float
+    erro: float     # erro relativo combinado em relação ao alvo
+
+
+def projetar(tipo, wc=None, w0=None, Q=None, BW=None, serie="E24", n=10,
+             faixa_R=FAIXA_R, faixa_L=FAIXA_L, faixa_C=FAIXA_C, janela=None):
+    """Procura os `n` melhores conjuntos de componentes da série para o alvo.
+
+    Passa-baixa/passa-alta: informe wc (rad/s); o erro é |ωc/wc - 1|.
+    Passa-faixa/rejeita-faixa: informe w0 e Q ou BW (rad/s); o erro combina
+    os erros relativos de ω0 e de Q (ou BW). Para cada um dos `janela` produtos
+    L·C mais próximos de 1/ω0², o R ideal é procurado por busca binária na série.
+    Retorna a lista de Candidato, do menor para o maior erro.
+    """
+    tipo = calculo.normalizar_tipo(tipo)
+    janela = janela or 20 * n
+
+    if tipo not in calculo.TIPOS_RLC:
+        if wc is None:
+            raise ValueError(f"O filtro {tipo} precisa de wc.")
+        tabela = tabela_produtos(serie, tuple(faixa_R), tuple(faixa_C))
+        idx = tabela.vizinhos(1.0 / wc, janela)
+        R, C, L = tabela.a[tabela.ia[idx]], tabela.b[tabela.ib[idx]], None
+        m = calculo.metricas_lote(tipo, R, C)
+        erro = np.abs(m["wc"] / wc - 1.0)
+    else:
+        if w0 is None or (Q is None) == (BW is None):
+            raise ValueError(f"O filtro {tipo} precisa de w0 e de Q ou BW (só um dos dois).")
+        tabela = tabela_produtos(serie, tuple(faixa_L), tuple(faixa_C))
+        idx = tabela.vizinhos(1.0 / w0**2, janela)
+        L, C = tabela.a[tabela.ia[idx]], tabela.b[tabela.ib[idx]]
+
+        # BW = R/L e Q = ω0 L / R -> R ideal para cada par (L, C)
+        w0_lc = 1.0 / np.sqrt(L * C)
+        R_ideal = BW * L if BW is not None else w0_lc * L / Q
+        R = _mais_proximos(valores_serie(serie, *faixa_R), R_ideal)
+        L = np.repeat(L, 2)
+        C = np.repeat(C, 2)
+        R = R.ravel()
+
+        m = calculo.metricas_lote(tipo, R, C, L)
+        erro_w0 = m["w0"] / w0 - 1.0
+        erro_2 = m["BW"] / BW - 1.0 if BW is not None else m["Q"] / Q - 1.0
+        erro = np.hypot(erro_w0, erro_2)
+
+    melhores = np.argsort(erro, kind="stable")[:n]
+    return [Candidato(R=float(R[i]), C=float(C[i]), L=None if L is None else float(L[i]),
+                      wc=float(m["wc"][i]), w0=float(m["w0"][i]), BW=float(m["BW"][i]),
+                      Q=float(m["Q"][i]), erro=float(erro[i]))
+            for i in melhores]
@@ -0,0 +1,336 @@
+"""Serviço HTTP/JSON local que avalia filtros sem a interface gráfica.
+
+    python servico.py --porta 8350 --processos 2
+
+    POST /avaliar    {"tipo": "passa_faixa", "R": 100, "C": 1e-6, "L": 1e-3, "frequencias": [1e4]}
+                     ou {"projetos": [{...}, ...], "frequencias": [...]}
+    GET  /metricas   latência (p50/p99), vazão e tamanho médio dos lotes
+
+A resposta tem as mesmas colunas do lote.py (métricas, |H| em dB e fase nas
+frequências pedidas e 'erro' para projetos inválidos); NaN vira null.
+"""
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import lote
+
+# Requisições que chegam juntas são agrupadas em micro-lotes: cada pedido
+# entra numa fila e espera até `espera` segundos (ou até a fila somar
+# `tamanho_lote` projetos); o lote inteiro é avaliado de uma vez por
+# lote.avaliar_linhas, que agrupa por tipo e usa as funções vetorizadas do
+# calculo.py. Lotes grandes vão para um pool de processos, para o laço de
+# eventos continuar atendendo conexões enquanto o NumPy trabalha; lotes
+# pequenos custam menos que o envio ao pool e rodam no próprio laço.
+# Pedidos com frequências diferentes formam lotes separados; se um lote
+# falha, cada pedido dele é refeito sozinho, e só o culpado recebe o erro.
+#
+# Os processos do pool não podem nascer de um fork do servidor: herdariam
+# os sockets das conexões abertas naquele momento, e um cliente com
+# "Connection: close" nunca veria o fim da resposta. O pool usa forkserver
+# (spawn onde não houver) e é aquecido em iniciar(), antes de aceitar conexões.
+
+MAX_CORPO = 16 << 20        # bytes por requisição
+_STATUS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class ErroRequisicao(Exception):
+    def __init__(self, status, mensagem):
+        super().__init__(mensagem)
+        self.status = status
+
+
+# -----------------------------
+# Métricas do serviço
+# -----------------------------
+class Estatisticas:
+    """Latência e instante de cada requisição num vetor circular, e totais por lote."""
+
+    def __init__(self, historico=1 << 16):
+        self.latencias = np.zeros(int(historico))
+        self.instantes = np.zeros(int(historico))
+        self.requisicoes = 0
+        self.projetos = 0
+        self.lotes = 0
+        self.projetos_em_lote = 0
+        self.inicio = time.perf_counter()
+
+    def registrar(self, inicio, n_projetos):
+        agora = time.perf_counter()
+        i = self.requisicoes % self.latencias.size
+        self.latencias[i] = agora - inicio
+        self.instantes[i] = agora
+        self.requisicoes += 1
+        self.projetos += n_projetos
+
+    def registrar_lote(self, n_projetos):
+        self.lotes += 1
+        self.projetos_em_lote += n_projetos
+
+    def resumo(self):
+        """Latências em ms; vazão (req/s) sobre as requisições guardadas no histórico."""
+        n = min(self.requisicoes, self.latencias.size)
+        resumo = {
+            "requisicoes": self.requisicoes,
+            "projetos": self.projetos,
+            "lotes": self.lotes,
+            "projetos_por_lote": self.projetos_em_lote / self.lotes if self.lotes else 0.0,
+            "tempo_ativo": time.perf_counter() - self.inicio,
+        }
+        if n:
+            latencias = self.latencias[:n]
+            p50, p99 = np.percentile(latencias, [50, 99]) * 1e3
+            janela = time.perf_counter() - self.instantes[:n].min()
+            resumo.update(latencia_p50_ms=float(p50), latencia_p99_ms=float(p99),
+                          latencia_max_ms=float(latencias.max() * 1e3),
+                          vazao_req_s=n / janela if janela > 0 else 0.0)
+        return resumo
+
+
+# -----------------------------
+# Micro-lotes
+# -----------------------------
+class Agrupador:
+    """Junta pedidos concorrentes em lotes avaliados por lote.avaliar_linhas.
+
+    Parâmetros
+    ----------
+    espera : tempo máximo (s) que um pedido aguarda outros para formar o lote.
+    tamanho_lote : projetos que disparam o lote antes do fim da espera.
+    pool : executor para os lotes grandes (None: tudo no laço de eventos).
+    limiar_pool : lotes com menos projetos que isso rodam no laço de eventos.
+    """
+
+    def __init__(self, espera=0.002, tamanho_lote=4096, pool=None, limiar_pool=256,
+                 estatisticas=None):
+        self.espera = espera
+        self.tamanho_lote = tamanho_lote
+        self.pool = pool
+        self.limiar_pool = limiar_pool
+        self.estatisticas = estatisticas
+        self._pendentes = {}        # frequências -> [(projetos, futuro)]
+        self._n_pendentes = 0
+        self._temporizador = None
+        self._tarefas = set()       # referências aos lotes em execução
+
+    async def avaliar(self, projetos, frequencias=()):
+        """Resultados (lista de dicionários, um por projeto) quando o lote do pedido terminar."""
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._pendentes.setdefault(tuple(frequencias), []).append((projetos, futuro))
+        self._n_pendentes += len(projetos)
+        if self._n_pendentes >= self.tamanho_lote:
+            self._despachar()
+        elif self._temporizador is None:
+            self._temporizador = loop.call_later(self.espera, self._despachar)
+        return await futuro
+
+    def _despachar(self):
+        if self._temporizador is not None:
+            self._temporizador.cancel()
+            self._temporizador = None
+        pendentes, self._pendentes, self._n_pendentes = self._pendentes, {}, 0
+        for frequencias, pedidos in pendentes.items():
+            tarefa = asyncio.ensure_future(self._executar(frequencias, pedidos))
+            self._tarefas.add(tarefa)
+            tarefa.add_done_callback(self._tarefas.discard)
+
+    async def _executar(self, frequencias, pedidos):
+        linhas = [projeto for projetos, _ in pedidos for projeto in projetos]
+        if self.estatisticas is not None:
+            self.estatisticas.registrar_lote(len(linhas))
+        try:
+            resultados = await self._rodar(linhas, frequencias)
+        except Exception as erro:
+            if len(pedidos) == 1:
+                _, futuro = pedidos[0]
+                if not futuro.done():
+                    futuro.set_exception(erro)
+                return
+            # refaz pedido a pedido: o erro vai só para quem o causou
+            await asyncio.gather(*(self._executar(frequencias, [pedido]) for pedido in pedidos))
+            return
+        # devolve a cada pedido a sua fatia do lote
+        ini = 0
+        for projetos, futuro in pedidos:
+            if not futuro.done():
+                futuro.set_result(resultados[ini:ini + len(projetos)])
+            ini += len(projetos)
+
+    async def _rodar(self, linhas, frequencias):
+        if self.pool is None or len(linhas) < self.limiar_pool:
+            return lote.avaliar_linhas(linhas, frequencias)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, lote.avaliar_linhas, linhas, frequencias)
+
+
+# -----------------------------
+# HTTP
+# -----------------------------
+def _json(dados):
+    # NaN e ±inf não são JSON válido: viram null (como no lote.py)
+    if isinstance(dados, float) and not math.isfinite(dados):
+        return None
+    if isinstance(dados, dict):
+        return {k: _json(v) for k, v in dados.items()}
+    if isinstance(dados, list):
+        return [_json(v) for v in dados]
+    return dados
+
+
+def _pedido(corpo):
+    # corpo JSON -> (projetos, frequências, veio em lista?)
+    try:
+        pedido = json.loads(corpo)
+    except (UnicodeDecodeError, ValueError) as erro:
+        raise ErroRequisicao(400, f"JSON inválido: {erro}") from None
+    if not isinstance(pedido, dict):
+        raise ErroRequisicao(400, "O corpo deve ser um objeto JSON.")
+    try:
+        frequencias = [float(w) for w in pedido.get("frequencias") or ()]
+    except (TypeError, ValueError):
+        raise ErroRequisicao(400, "'frequencias' deve ser uma lista de números.") from None
+
+    em_lista = "projetos" in pedido
+    projetos = pedido["projetos"] if em_lista else [pedido]
+    if not isinstance(projetos, list) or not all(isinstance(p, dict) for p in projetos):
+        raise ErroRequisicao(400, "'projetos' deve ser uma lista de objetos.")
+    return projetos, frequencias, em_lista
+
+
+class Servico:
+    """Servidor asyncio: uma corrotina por conexão, conexões persistentes (HTTP/1.1)."""
+
+    def __init__(self, processos=None, espera=0.002, tamanho_lote=4096, limiar_pool=256):
+        if processos is None:
+            processos = os.cpu_count() or 1
+        self.pool = None
+        if processos > 0:
+            metodo = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self.pool = ProcessPoolExecutor(max_workers=processos,
+                                            mp_context=multiprocessing.get_context(metodo))
+        self.estatisticas = Estatisticas()
+        self.agrupador = Agrupador(espera, tamanho_lote, self.pool, limiar_pool, self.estatisticas)
+        self.servidor = None
+        self._conexoes = set()
+
+    async def iniciar(self, host="127.0.0.1", porta=8350):
+        if self.pool is not None:
+            # sobe os processos (e importa o NumPy neles) antes da primeira conexão
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(self.pool, lote.avaliar_linhas, [], ())
+                                   for _ in range(self.pool._max_workers)))
+        self.servidor = await asyncio.start_server(self._conexao, host, porta)
+        return self.servidor.sockets[0].getsockname()[:2]
+
+    async def fechar(self):
+        if self.servidor is not None:
+            self.servidor.close()
+            # conexões persistentes ociosas: fecha e deixa cada corrotina ver o fim do fluxo
+            for writer in list(self._conexoes):
+                writer.close()
+            while self._conexoes:
+                await asyncio.sleep(0.01)
+            await self.servidor.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def _conexao(self, reader, writer):
+        self._conexoes.add(writer)
+        try:
+            while True:
+                linha = await reader.readline()
+                if not linha:
+                    break
+                inicio = time.perf_counter()
+                metodo, caminho, versao = (linha.decode("latin-1").split() + ["", "", ""])[:3]
+                cabecalhos = {}
+                while True:
+                    linha = await reader.readline()
+                    if linha in (b"\r\n", b"\n", b""):
+                        break
+                    chave, _, valor = linha.decode("latin-1").partition(":")
+                    cabecalhos[chave.strip().lower()] = valor.strip()
+
+                manter = (cabecalhos.get("connection", "").lower() != "close"
+                          and (versao == "HTTP/1.1" or cabecalhos.get("connection", "").lower() == "keep-alive"))
+                try:
+                    tamanho = int(cabecalhos.get("content-length", 0))
+                    if tamanho > MAX_CORPO:
+                        manter = False
+                        raise ErroRequisicao(413, f"Corpo maior que {MAX_CORPO} bytes.")
+                    corpo = await reader.readexactly(tamanho) if tamanho > 0 else b""
+                    status, resposta = await self._responder(metodo, caminho.split("?")[0], corpo, inicio)
+                except ErroRequisicao as erro:
+                    status, resposta = erro.status, {"erro": str(erro)}
+                except ValueError:
+                    status, resposta, manter = 400, {"erro": "Content-Length inválido."}, False
+
+                dados = json.dumps(_json(resposta), ensure_ascii=False, allow_nan=False).encode()
+                writer.write(f"HTTP/1.1 {status} {_STATUS[status]}\r\n"
+                             f"Content-Type: application/json; charset=utf-8\r\n"
+                             f"Content-Length: {len(dados)}\r\n"
+                             f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode() + dados)
+                await writer.drain()
+                if not manter:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._conexoes.discard(writer)
+            writer.close()
+
+    async def _responder(self, metodo, caminho, corpo, inicio):
+        if caminho == "/metricas":
+            if metodo != "GET":
+                raise ErroRequisicao(405, "Use GET em /metricas.")
+            return 200, self.estatisticas.resumo()
+        if caminho != "/avaliar":
+            raise ErroRequisicao(404, f"Caminho desconhecido: {caminho}")
+        if metodo != "POST":
+            raise ErroRequisicao(405, "Use POST em /avaliar.")
+
+        projetos, frequencias, em_lista = _pedido(corpo)
+        try:
+            resultados = await self.agrupador.avaliar(projetos, frequencias)
+        except Exception as erro:
+            return 500, {"erro": f"Falha ao avaliar: {erro}"}
+        self.estatisticas.registrar(inicio, len(projetos))
+        return 200, {"resultados": resultados} if em_lista else resultados[0]
+
+
+async def servir(host, porta, **opcoes):
+    servico = Servico(**opcoes)
+    endereco = await servico.iniciar(host, porta)
+    print(f"Servindo em http://{endereco[0]}:{endereco[1]}", file=sys.stderr)
+    try:
+        await servico.servidor.serve_forever()
+    finally:
+        await servico.fechar()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8350)
+    parser.add_argument("--processos", type=int, help="tamanho do pool (0: sem pool; padrão: nº de CPUs)")
+    parser.add_argument("--espera", type=float, default=0.002, help="espera máxima (s) para formar um lote")
+    parser.add_argument("--lote", type=int, default=4096, help="projetos que disparam um lote na hora")
+    parser.add_argument("--limiar-pool", type=int, default=256,
+                        help="lotes menores que isso rodam sem o pool de processos")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(servir(args.host, args.porta, processos=args.processos, espera=args.espera,
+                           tamanho_lote=args.lote, limiar_pool=args.limiar_pool))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+import calculo
+
+# Síntese de filtros de ordem maior (Butterworth, Chebyshev tipo I, Bessel)
+# como cascata das seções que o projeto já modela: RC de 1ª ordem e o RLC
+# série, com a saída no R (passa-faixa, forma de Passa_faixa), no L+C
+# (rejeita-faixa, forma de Rejeita_Faixa), no C (passa-baixa de 2ª ordem) ou
+# no L (passa-alta de 2ª ordem). As seções são supostas isoladas entre si
+# (com buffer), e a resposta é o produto das respostas de cada seção, sem
+# expandir um polinômio de grau alto.
+
+APROXIMACOES = ("butterworth", "chebyshev", "bessel")
+
+
+# -----------------------------
+# Protótipos passa-baixa normalizados (corte em 1 rad/s)
+# -----------------------------
+def prototipo(ordem, aproximacao="butterworth", ripple_db=1.0):
+    """Pólos do protótipo e ganho em ω = 0 (|H(0)|)."""
+    if ordem < 1:
+        raise ValueError("A ordem deve ser >= 1.")
+    n = int(ordem)
+    k = np.arange(1, n + 1)
+
+    if aproximacao == "butterworth":
+        polos = np.exp(1j * np.pi * (2 * k + n - 1) / (2 * n))
+        return polos, 1.0
+    if aproximacao == "chebyshev":
+        eps = np.sqrt(10.0**(ripple_db / 10.0) - 1.0)
+        mu = np.arcsinh(1.0 / eps) / n
+        theta = np.pi * (2 * k - 1) / (2 * n)
+        polos = -np.sinh(mu) * np.sin(theta) + 1j * np.cosh(mu) * np.cos(theta)
+        # ordem par começa no fundo da ondulação
+        return polos, (1.0 / np.sqrt(1.0 + eps**2) if n % 2 == 0 else 1.0)
+    if aproximacao == "bessel":
+        from scipy.signal import besselap
+        _, polos, _ = besselap(n, norm='mag')   # -3 dB em 1 rad/s
+        return np.asarray(polos), 1.0
+    raise ValueError(f"Aproximação desconhecida: {aproximacao!r}")
+
+
+def _pares(polos):
+    # separa pólos reais e um representante de cada par complexo conjugado
+    polos = np.asarray(polos, dtype=complex)
+    reais = polos[np.abs(polos.imag) <= 1e-9 * np.abs(polos)].real
+    complexos = polos[polos.imag > 1e-9 * np.abs(polos)]
+    return reais, complexos
+
+
+# -----------------------------
+# Seções
+# -----------------------------
+@dataclass(frozen=True)
+class Secao:
+    """Um estágio da cascata: forma, componentes e coeficientes (maior potência primeiro)."""
+    forma: str          # 'rc_passa_baixa', 'rc_passa_alta', 'rlc_passa_baixa', 'rlc_passa_alta',
+                        # 'passa_faixa' ou 'rejeita_faixa'
+    R: float
+    C: float
+    L: float
+    num: tuple
+    den: tuple
+
+
+def _secao_rc(forma, polo, R):
+    RC = -1.0 / polo
+    num = (1.0,) if forma == "rc_passa_baixa" else (RC, 0.0)
+    return Secao(forma, R, RC / R, None, num, (RC, 1.0))
+
+
+def _secao_rlc(forma, a, w2, R, w_zero=None):
+    # denominador s² + a s + ω² do RLC série: R/L = a, 1/LC = ω²
+    L = R / a
+    C = 1.0 / (L * w2)
+    if forma in calculo.TIPOS_RLC:
+        # mesmas fórmulas de Passa_faixa (saída no R) e Rejeita_Faixa (saída no L+C)
+        num, den = calculo.coeficientes_lote(forma, R, C, L)
+        num = list(num[0])
+        if forma == "rejeita_faixa" and w_zero is not None:
+            num[-1] = w_zero**2      # zeros em ω0, não na frequência dos pólos
+        return Secao(forma, R, C, L, tuple(num), tuple(den[0]))
+
+    num = (0.0, 0.0, w2) if forma == "rlc_passa_baixa" else (1.0, 0.0, 0.0)   # saída no C / no L
+    return Secao(forma, R, C, L, num, (1.0, a, w2))
+
+
+def _secao_par(forma, polo, R, w_zero=None):
+    # par complexo conjugado p, p* -> s² - 2 Re(p) s + |p|²
+    return _secao_rlc(forma, -2.0 * polo.real, abs(polo)**2, R, w_zero)
+
+
+# -----------------------------
+# Cascata
+# -----------------------------
+@dataclass
+class Cascata:
+    """Filtro sintetizado: seções em cascata e um ganho total."""
+    tipo: str
+    aproximacao: str
+    ordem: int
+    secoes: list
+    ganho: float = 1.0
+
+    def coeficientes(self):
+        """num, den das seções como matrizes (n_secoes, 3)."""
+        num = np.array([np.pad(s.num, (3 - len(s.num), 0)) for s in self.secoes])
+        den = np.array([np.pad(s.den, (3 - len(s.den), 0)) for s in self.secoes])
+        return num, den
+
+    def avaliar(self, w):
+        """H(jω) como produto das seções (estável mesmo em ordem alta)."""
+        num, den = self.coeficientes()
+        return self.ganho * np.prod(calculo.avaliar_lote(num, den, np.atleast_1d(w)), axis=0)
+
+    def resposta(self, w):
+        H = self.avaliar(w)
+        return np.abs(H), np.degrees(np.unwrap(np.angle(H)))
+
+    def cortes(self, w_min, w_max, ganho_max=None, n_busca=2000):
+        """Frequências de -3 dB entre w_min e w_max (busca numérica sobre a cascata)."""
+        from scipy.optimize import brentq
+
+        w = np.logspace(np.log10(w_min), np.log10(w_max), n_busca)
+        mag = np.abs(self.avaliar(w))
+        if ganho_max is None:
+            ganho_max = mag.max()
+        f = mag - ganho_max / np.sqrt(2.0)
+        cortes = []
+        for i in np.flatnonzero(np.sign(f[:-1]) * np.sign(f[1:]) < 0):
+            cortes.append(brentq(lambda x: abs(self.avaliar(x)[0]) - ganho_max / np.sqrt(2.0),
+                                 w[i], w[i + 1]))
+        return cortes
+
+
+def sintetizar(tipo, ordem, aproximacao="butterworth", wc=None, w0=None, BW=None,
+               ripple_db=1.0, R=1e3):
+    """Sintetiza um filtro de ordem `ordem` como cascata de seções RC/RLC.
+
+    Parâmetros
+    ----------
+    tipo : 'passa_baixa', 'passa_alta', 'passa_faixa' ou 'rejeita_faixa'.
+    ordem : ordem do protótipo passa-baixa (passa/rejeita-faixa ficam com o dobro).
+    aproximacao : 'butterworth', 'chebyshev' (tipo I) ou 'bessel'.
+    wc : corte em rad/s (passa-baixa e passa-alta; fim da ondulação no Chebyshev).
+    w0, BW : centro e largura de banda em rad/s (passa e rejeita-faixa).
+    ripple_db : ondulação na banda de passagem do Chebyshev.
+    R : resistor usado em todas as seções; L e C saem dele.
+
+    Nas seções de rejeita-faixa de ordem > 1 os zeros ficam em ω0 e os pólos
+    em outras frequências; o RLC série de Rejeita_Faixa só realiza zeros e
+    pólos na mesma frequência, então R, L e C dessas seções descrevem os pólos.
+    """
+    tipo = calculo.normalizar_tipo(tipo)
+    if aproximacao not in APROXIMACOES:
+        raise ValueError(f"Aproximação desconhecida: {aproximacao!r}")
+    if tipo in calculo.TIPOS_RLC:
+        if w0 is None or BW is None:
+            raise ValueError(f"O filtro {tipo} precisa de w0 e BW.")
+    elif wc is None:
+        raise ValueError(f"O filtro {tipo} precisa de wc.")
+
+    polos, ganho_ref = prototipo(ordem, aproximacao, ripple_db)
+    reais, complexos = _pares(polos)
+    secoes = []
+
+    if tipo == "passa_baixa":
+        secoes += [_secao_rc("rc_passa_baixa", p * wc, R) for p in reais]
+        secoes += [_secao_par("rlc_passa_baixa", p * wc, R) for p in complexos]
+        w_ref = 0.0
+    elif tipo == "passa_alta":
+        secoes += [_secao_rc("rc_passa_alta", wc / p, R) for p in reais]
+        secoes += [_secao_par("rlc_passa_alta", wc / p, R) for p in complexos]
+        w_ref = np.inf
+    else:
+        # cada pólo p do protótipo vira as raízes de s² - c s + ω0² = 0, com
+        # c = p BW (passa-faixa) ou c = BW / p (rejeita-faixa)
+        forma = tipo
+        for p in np.concatenate([reais, complexos]):
+            c = p * BW if tipo == "passa_faixa" else BW / p
+            r1, r2 = np.roots([1.0, -c, w0**2])
+            if abs(p.imag) <= 1e-9 * abs(p):
+                # pólo real -> uma seção com os dois pólos (conjugados ou reais)
+                secoes.append(_secao_rlc(forma, -(r1 + r2).real, (r1 * r2).real, R, w0))
+            else:
+                # pólo complexo: o conjugado de p gera os conjugados de r1 e r2
+                secoes += [_secao_par(forma, r, R, w0) for r in (r1, r2)]
+        w_ref = w0 if tipo == "passa_faixa" else 0.0
+
+    cascata = Cascata(tipo, aproximacao, int(ordem), secoes)
+    # ajusta o ganho total para reproduzir o do protótipo na banda de passagem
+    if np.isinf(w_ref):
+        H_ref = np.prod([s.num[0] / s.den[0] for s in secoes])
+    elif w_ref == 0.0:
+        H_ref = np.prod([s.num[-1] / s.den[-1] for s in secoes])
+    else:
+        H_ref = cascata.avaliar(w_ref)[0]
+    cascata.ganho = ganho_ref / abs(H_ref)
+    return cascata
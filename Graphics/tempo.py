@@ -0,0 +1,124 @@
+import os
+
+import numpy as np
+from scipy.signal import cont2discrete, sosfilt, sosfilt_zi, tf2sos
+
+import calculo
+import perfil
+
+# Filtragem no tempo em blocos: o filtro analógico é discretizado uma única vez
+# (bilinear ou ZOH) em seções de 2ª ordem, e cada bloco de entrada é filtrado
+# continuando do estado deixado pelo bloco anterior. A memória usada não
+# depende do tamanho do sinal.
+
+METODOS = ("bilinear", "zoh")
+
+
+@perfil.medir("tempo/discretizar")
+def discretizar(num, den, fs, metodo="bilinear"):
+    """H(s) -> seções de 2ª ordem (sos) de H(z) na taxa fs (Hz)."""
+    if metodo not in METODOS:
+        raise ValueError(f"Método de discretização desconhecido: {metodo!r}")
+    num_d, den_d, _ = cont2discrete((np.ravel(num), np.ravel(den)), 1.0 / fs, method=metodo)
+    num_d = np.ravel(num_d)
+    # ZOH deixa coeficientes iniciais ~1e-17 no numerador; zera antes do tf2sos
+    num_d[np.abs(num_d) < 1e-12 * np.max(np.abs(num_d))] = 0.0
+    # Em z⁻¹ os zeros iniciais são atraso (uma amostra no ZOH), mas o tf2sos
+    # os descarta; o atraso volta empurrando o numerador das seções que têm
+    # b2 = 0 (b0 + b1 z⁻¹ -> b0 z⁻¹ + b1 z⁻²)
+    aparado = np.trim_zeros(num_d, 'f')
+    atraso = num_d.size - aparado.size
+    sos = tf2sos(aparado, np.ravel(den_d))
+    for secao in sos:
+        while atraso and secao[2] == 0.0:
+            secao[:3] = np.roll(secao[:3], 1)
+            atraso -= 1
+    return sos
+
+
+class FiltroDiscreto:
+    """Filtro discretizado que processa o sinal em blocos, mantendo o estado.
+
+    Uso::
+
+        f = FiltroDiscreto.de_spec(calculo.FiltroSpec("passa_alta", 1e5, 5.3e-9), fs=20000)
+        for bloco in blocos:
+            saida = f.processar(bloco)
+    """
+
+    def __init__(self, num, den, fs, metodo="bilinear", dtype=np.float64):
+        self.fs = float(fs)
+        self.metodo = metodo
+        # dtype vale para as amostras de saída (e arquivos): float32 reduz pela
+        # metade a memória e a banda de E/S. Coeficientes e estado ficam em
+        # float64: a recursão em float32 erra dezenas de % em passa-faixas
+        # estreitos de baixa frequência
+        self.dtype = np.dtype(dtype)
+        self.sos = discretizar(num, den, fs, metodo)
+        self.reiniciar()
+
+    @classmethod
+    def de_spec(cls, spec, fs, metodo="bilinear", dtype=np.float64):
+        num, den = calculo.coeficientes_lote(spec.tipo, spec.R, spec.C, spec.L, spec.parasitas)
+        return cls(num[0], den[0], fs, metodo, dtype)
+
+    def reiniciar(self, regime=False, valor=0.0):
+        """Zera o estado; com regime=True parte do regime permanente para entrada constante `valor`."""
+        if regime:
+            self.zi = sosfilt_zi(self.sos) * valor
+        else:
+            self.zi = np.zeros((self.sos.shape[0], 2))
+
+    @perfil.medir("tempo/processar")
+    def processar(self, bloco):
+        """Filtra um bloco e guarda o estado final para o próximo."""
+        saida, self.zi = sosfilt(self.sos, np.asarray(bloco, dtype=np.float64), zi=self.zi)
+        return saida.astype(self.dtype, copy=False)
+
+
+def filtrar_fluxo(blocos, filtro):
+    """Gera a saída de cada bloco de um iterável de blocos (sinal longo ou ao vivo)."""
+    for bloco in blocos:
+        yield filtro.processar(bloco)
+
+
+def em_blocos(sinal, tamanho_bloco):
+    """Divide um vetor (ou memmap) em blocos consecutivos de tamanho_bloco amostras."""
+    for ini in range(0, len(sinal), tamanho_bloco):
+        yield sinal[ini:ini + tamanho_bloco]
+
+
+# -----------------------------
+# Arquivos mapeados em memória
+# -----------------------------
+def abrir_sinal(caminho, dtype=np.float64):
+    """Abre um sinal em disco sem carregá-lo: .npy (dtype vem do cabeçalho)
+    ou binário cru de amostras `dtype` (float32/float64)."""
+    if os.path.splitext(caminho)[1] == ".npy":
+        return np.load(caminho, mmap_mode='r')
+    return np.memmap(caminho, dtype=dtype, mode='r')
+
+
+def criar_saida(caminho, n_amostras, dtype=np.float64):
+    """Cria o arquivo de saída (.npy ou binário cru) mapeado em memória."""
+    if os.path.splitext(caminho)[1] == ".npy":
+        return np.lib.format.open_memmap(caminho, mode='w+', dtype=dtype, shape=(n_amostras,))
+    return np.memmap(caminho, dtype=dtype, mode='w+', shape=(n_amostras,))
+
+
+def filtrar_arquivo(entrada, saida, filtro, tamanho_bloco=1 << 20, dtype=None):
+    """Filtra o sinal do arquivo `entrada` para o arquivo `saida`, bloco a bloco.
+
+    Os dois arquivos são mapeados em memória, então só um bloco por vez passa
+    pela RAM e o cache de páginas do sistema cuida da E/S. `dtype` vale para
+    arquivos crus (o padrão é o dtype do filtro); .npy usa o do cabeçalho.
+    Retorna o número de amostras processadas.
+    """
+    dtype = filtro.dtype if dtype is None else np.dtype(dtype)
+    vin = abrir_sinal(entrada, dtype)
+    vout = criar_saida(saida, len(vin), filtro.dtype)
+    for ini in range(0, len(vin), tamanho_bloco):
+        fim = min(ini + tamanho_bloco, len(vin))
+        vout[ini:fim] = filtro.processar(vin[ini:fim])
+    vout.flush()
+    return len(vin)
@@ -0,0 +1,210 @@
+"""Filtragem em tempo real de um fluxo de amostras (ex.: áudio a 48 kHz).
+
+Lê amostras float32 cruas da entrada (arquivo ou pipe, no lugar da placa de
+som), filtra em buffers de tamanho fixo e escreve na saída:
+
+    python tempo_real.py passa_faixa 100 1e-6 1e-3 --fs 48000 < entrada.raw > saida.raw
+
+Ao final, o tempo de processamento por buffer e as perdas de prazo vão para stderr.
+"""
+import argparse
+import sys
+import threading
+import time
+import warnings
+from dataclasses import replace
+
+import numpy as np
+
+import calculo
+import tempo
+
+# O filtro é a versão discretizada (tempo.FiltroDiscreto) do mesmo H(s) dos
+# módulos de filtro. Trocar R, L ou C no meio do fluxo monta o novo filtro
+# fora do laço de áudio; na fronteira do buffer seguinte ele é "aquecido"
+# com o último buffer de entrada e a saída passa do filtro antigo para o
+# novo por uma rampa linear (crossfade), sem degrau audível. A troca passa
+# por uma vaga única protegida por trava: o laço de áudio só segura a trava
+# para pegar o filtro pronto, nunca durante a discretização.
+
+
+class ProcessadorTempoReal:
+    """Laço de processamento em buffers de tamanho fixo, com medição de tempo.
+
+    Parâmetros
+    ----------
+    spec : calculo.FiltroSpec inicial.
+    fs : taxa de amostragem (Hz).
+    tamanho_buffer : amostras por buffer; o prazo de cada buffer é tamanho_buffer/fs.
+    transicao : amostras da rampa ao trocar de filtro (padrão: um buffer).
+    historico : quantos tempos de buffer guardar para as estatísticas.
+    dtype : tipo das amostras de saída; o filtro calcula sempre em float64
+        (executar_fluxo lê e escreve float32 cru, como a placa de som).
+    """
+
+    def __init__(self, spec, fs=48000, tamanho_buffer=256, metodo="bilinear",
+                 dtype=np.float64, transicao=None, historico=1 << 16):
+        self.fs = float(fs)
+        self.tamanho_buffer = int(tamanho_buffer)
+        self.metodo = metodo
+        self.dtype = np.dtype(dtype)
+        self.transicao = int(transicao or tamanho_buffer)
+        self.prazo = self.tamanho_buffer / self.fs
+
+        self.spec = spec
+        self.filtro = tempo.FiltroDiscreto.de_spec(spec, fs, metodo, self.dtype)
+        self._pendente = None       # filtro novo, trocado na próxima fronteira de buffer
+        self._trava = threading.Lock()           # protege _pendente
+        self._trava_ajuste = threading.Lock()    # ajustes seguidos, um de cada vez
+        self._alvo = spec                        # último spec pedido por ajustar
+        self._anterior = None       # filtro antigo, enquanto durar a rampa
+        self._posicao_rampa = 0
+        self._ultimo_bloco = np.zeros(self.tamanho_buffer, dtype=self.dtype)
+
+        # tempos por buffer num vetor circular pré-alocado
+        self.tempos = np.zeros(int(historico))
+        self.n_buffers = 0
+        self.perdas = 0
+
+    # -----------------------------
+    # Troca de componentes
+    # -----------------------------
+    def ajustar(self, R=None, C=None, L=None):
+        """Troca R, C e/ou L. Pode ser chamado de outra thread (ex.: a interface)."""
+        with self._trava_ajuste:
+            # parte do último pedido, não do filtro em uso: ajustar(R) seguido de
+            # ajustar(C) antes da troca não perde o R; replace mantém as parasitas
+            mudancas = {k: v for k, v in (("R", R), ("C", C), ("L", L)) if v is not None}
+            spec = replace(self._alvo, **mudancas)
+            # discretização (scipy) feita aqui, fora do laço de áudio
+            novo = tempo.FiltroDiscreto.de_spec(spec, self.fs, self.metodo, self.dtype)
+            self._alvo = spec
+            with self._trava:
+                self._pendente = (spec, novo)
+
+    def _trocar_filtro(self):
+        # pega e esvazia a vaga numa operação só: um ajuste que chegue agora
+        # fica para a próxima fronteira de buffer, em vez de ser apagado
+        with self._trava:
+            pendente, self._pendente = self._pendente, None
+        if pendente is None:
+            return
+        spec, novo = pendente
+        # aquece o novo filtro com o último buffer para não partir do estado zero
+        novo.processar(self._ultimo_bloco)
+        self._anterior = self.filtro
+        self.filtro = novo
+        self.spec = spec
+        self._posicao_rampa = 0
+
+    # -----------------------------
+    # Processamento
+    # -----------------------------
+    def processar(self, bloco):
+        """Filtra um buffer (até tamanho_buffer amostras) e registra o tempo gasto."""
+        inicio = time.perf_counter()
+        bloco = np.asarray(bloco, dtype=self.dtype)
+        if bloco.size == 0:
+            return bloco
+        if self._pendente is not None:
+            self._trocar_filtro()
+
+        saida = self.filtro.processar(bloco)
+        if self._anterior is not None:
+            antiga = self._anterior.processar(bloco)
+            rampa = (self._posicao_rampa + np.arange(1, bloco.size + 1, dtype=self.dtype)) / self.transicao
+            np.minimum(rampa, 1.0, out=rampa)
+            saida = antiga + rampa * (saida - antiga)
+            self._posicao_rampa += bloco.size
+            if self._posicao_rampa >= self.transicao:
+                self._anterior = None
+
+        n = bloco.size
+        self._ultimo_bloco[:-n or None] = self._ultimo_bloco[n:]
+        self._ultimo_bloco[-n:] = bloco[-self.tamanho_buffer:]
+
+        decorrido = time.perf_counter() - inicio
+        self.tempos[self.n_buffers % self.tempos.size] = decorrido
+        self.n_buffers += 1
+        if decorrido > self.prazo:
+            self.perdas += 1
+        return saida
+
+    def estatisticas(self):
+        """Tempos por buffer (s), carga (tempo / duração do buffer) e perdas de prazo."""
+        tempos = self.tempos[:min(self.n_buffers, self.tempos.size)]
+        if tempos.size == 0:
+            return {"buffers": 0, "perdas": 0}
+        p50, p99 = np.percentile(tempos, [50, 99])
+        return {
+            "buffers": self.n_buffers,
+            "prazo": self.prazo,
+            "mediana": float(p50),
+            "p99": float(p99),
+            "maximo": float(tempos.max()),
+            "carga_media": float(tempos.mean() / self.prazo),
+            "carga_p99": float(p99 / self.prazo),
+            "perdas": self.perdas,
+        }
+
+
+def executar_fluxo(processador, entrada, saida, ritmo=False):
+    """Lê buffers de float32 cru de `entrada`, filtra e escreve em `saida` (arquivos binários).
+
+    Com ritmo=True, espera o tempo real de cada buffer, como uma placa de som.
+    Retorna o número de amostras processadas; bytes finais que não completam
+    uma amostra são descartados com um RuntimeWarning.
+    """
+    buffer = np.empty(processador.tamanho_buffer, dtype=np.float32)
+    vista = memoryview(buffer).cast("B")
+    total = 0
+    proximo = time.perf_counter()
+    while True:
+        lidos = entrada.readinto(vista)
+        if not lidos:
+            break
+        # leituras de pipe podem vir curtas: completa até o fim do buffer ou da entrada
+        while lidos < vista.nbytes:
+            mais = entrada.readinto(vista[lidos:])
+            if not mais:
+                break
+            lidos += mais
+        n, resto = divmod(lidos, buffer.itemsize)
+        if n:
+            saida.write(processador.processar(buffer[:n]).astype(np.float32, copy=False).tobytes())
+            total += n
+        if resto:
+            # o buffer só fica incompleto no fim da entrada: sobra parte de uma amostra
+            warnings.warn(f"executar_fluxo: a entrada terminou com {resto} byte(s) que não formam "
+                          f"uma amostra float32; foram descartados.", RuntimeWarning, stacklevel=2)
+            break
+        if ritmo:
+            proximo += processador.prazo
+            espera = proximo - time.perf_counter()
+            if espera > 0:
+                time.sleep(espera)
+    saida.flush()
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tipo", choices=calculo.TIPOS)
+    parser.add_argument("R", type=float)
+    parser.add_argument("C", type=float)
+    parser.add_argument("L", type=float, nargs="?")
+    parser.add_argument("--fs", type=float, default=48000)
+    parser.add_argument("--buffer", type=int, default=256, help="amostras por buffer")
+    parser.add_argument("--metodo", choices=tempo.METODOS, default="bilinear")
+    parser.add_argument("--ritmo", action="store_true", help="processa no ritmo do relógio (simula a placa de som)")
+    args = parser.parse_args()
+
+    processador = ProcessadorTempoReal(calculo.FiltroSpec(args.tipo, args.R, args.C, args.L),
+                                       args.fs, args.buffer, args.metodo)
+    executar_fluxo(processador, sys.stdin.buffer, sys.stdout.buffer, args.ritmo)
+    e = processador.estatisticas()
+    if e["buffers"]:
+        print(f"{e['buffers']} buffers de {processador.tamanho_buffer} amostras "
+              f"(prazo {e['prazo'] * 1e3:.3f} ms): mediana {e['mediana'] * 1e6:.1f} µs, "
+              f"p99 {e['p99'] * 1e6:.1f} µs, carga média {100 * e['carga_media']:.2f}%, "
+              f"{e['perdas']} perdas de prazo", file=sys.stderr)
@@ -0,0 +1,8 @@
+import os
+import sys
+
+import matplotlib
+
+# os módulos do projeto ficam soltos em Graphics/ e se importam pelo nome
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+matplotlib.use("Agg")
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+import acervo
+import calculo
+import varredura
+
+RNG = np.random.default_rng(0)
+N = 3000
+
+
+@pytest.fixture(scope="module")
+def misto():
+    # um acervo com os quatro tipos: wc é NaN nas linhas RLC e w0/Q nas RC
+    partes = []
+    for tipo in calculo.TIPOS:
+        R = RNG.uniform(10, 1e3, N)
+        C = RNG.uniform(1e-9, 1e-6, N)
+        L = RNG.uniform(1e-4, 1e-2, N) if tipo in calculo.TIPOS_RLC else None
+        partes.append(acervo.Acervo.de_componentes(tipo, R, C, L))
+    return acervo.Acervo.juntar(partes)
+
+
+def _iguais(a, b):
+    # campo a campo: registros com NaN nunca são iguais como um todo
+    assert a.shape == b.shape
+    for campo in acervo.DTYPE.names:
+        np.testing.assert_array_equal(a[campo], b[campo])
+
+
+def _forca_bruta(dados, tipo=None, **faixas):
+    manter = np.ones(dados.size, dtype=bool)
+    for campo, (minimo, maximo) in faixas.items():
+        if minimo is not None:
+            manter &= dados[campo] >= minimo
+        if maximo is not None:
+            manter &= dados[campo] <= maximo
+    if tipo is not None:
+        manter &= dados["tipo"] == acervo.codigo_tipo(tipo)
+    return np.flatnonzero(manter)
+
+
+def test_registros_iguais_a_metricas_lote():
+    R, C, L = RNG.uniform(10, 1e3, 50), RNG.uniform(1e-9, 1e-6, 50), RNG.uniform(1e-4, 1e-2, 50)
+    dados = acervo.registros("rejeita_faixa", R, C, L)
+    assert dados.dtype == acervo.DTYPE and np.all(dados["tipo"] == 3)
+    np.testing.assert_array_equal(dados["L"], L)
+    for k, v in calculo.metricas_lote("rejeita_faixa", R, C, L).items():
+        np.testing.assert_array_equal(dados[k], v)
+    assert np.all(np.isnan(acervo.registros("passa_baixa", R, C)["L"]))
+
+
+@pytest.mark.parametrize("consulta", [
+    {"w0": acervo.perto(1e5, 0.2)},
+    {"w0": (None, 3e4), "Q": (2.0, None)},
+    {"wc": (1e4, 1e5), "R": (100.0, 500.0)},
+    {"Q": (0.5, 5.0), "tipo": "passa_faixa"},
+    {"C": (None, 1e-7), "tipo": "passa_alta"},       # só campos sem índice
+    {"wc": (1e9, None)},                             # nenhuma linha
+])
+def test_consulta_igual_forca_bruta(misto, consulta):
+    esperado = _forca_bruta(misto.dados, **consulta)
+    np.testing.assert_array_equal(misto.linhas(**consulta), esperado)
+    assert misto.contar(**consulta) == esperado.size
+    _iguais(misto.consultar(**consulta), misto.dados[esperado])
+
+
+def test_campo_desconhecido(misto):
+    with pytest.raises(ValueError):
+        misto.linhas(frequencia=(1, 2))
+    with pytest.raises(ValueError):
+        acervo.Acervo(np.zeros(3))
+
+
+@pytest.mark.parametrize("memmap", [True, False])
+def test_salvar_e_abrir(misto, tmp_path, memmap):
+    misto.salvar(str(tmp_path))
+    aberto = acervo.Acervo.abrir(str(tmp_path), memmap=memmap)
+    assert isinstance(aberto.dados, np.memmap) == memmap
+    assert set(aberto.indices) == set(acervo.INDICES)
+    _iguais(aberto.dados, misto.dados)
+    consulta = {"w0": (None, 3e4), "Q": (2.0, None)}
+    np.testing.assert_array_equal(aberto.linhas(**consulta), misto.linhas(**consulta))
+
+
+def test_de_varredura(tmp_path):
+    R, L, C = np.geomspace(10, 1e3, 9), np.geomspace(1e-4, 1e-2, 7), np.geomspace(1e-9, 1e-6, 8)
+    v = varredura.Varredura("passa_faixa", R, C, L, tamanho_bloco=100, processos=1)
+    a = acervo.Acervo.de_varredura(v, str(tmp_path))
+
+    r, l, c = (x.ravel() for x in np.meshgrid(R, L, C, indexing="ij"))
+    _iguais(a.dados, acervo.registros("passa_faixa", r, c, l))
+    aberto = acervo.Acervo.abrir(str(tmp_path))
+    np.testing.assert_array_equal(aberto.linhas(Q=(1.0, 10.0)), _forca_bruta(a.dados, Q=(1.0, 10.0)))
+
+
+def test_parquet(misto, tmp_path):
+    pytest.importorskip("pyarrow")
+    caminho = str(tmp_path / "acervo.parquet")
+    misto.exportar_parquet(caminho, tamanho_bloco=1000)
+    _iguais(acervo.Acervo.de_parquet(caminho).dados, misto.dados)
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+import cache
+import calculo
+
+
+def _spec(R=100.0, **opcoes):
+    return calculo.FiltroSpec("passa_baixa", R, 1e-6, n_pontos=opcoes.pop("n_pontos", 200), **opcoes)
+
+
+def test_acerto_devolve_a_mesma_resposta():
+    c = cache.CacheRespostas()
+    primeira = c.calcular(_spec())
+    # diferença abaixo de 12 algarismos cai na mesma chave
+    assert c.calcular(_spec(R=100.0 * (1 + 1e-14))) is primeira
+    assert (c.acertos, c.falhas) == (1, 1)
+
+    ref = calculo.calcular(_spec())
+    np.testing.assert_array_equal(primeira.mag, ref.mag)
+    np.testing.assert_array_equal(list(vars(primeira.metricas).values()), list(vars(ref.metricas).values()))
+    with pytest.raises(ValueError):
+        primeira.mag[0] = 0.0        # compartilhada: somente leitura
+
+
+def test_chaves_distintas():
+    specs = [_spec(), _spec(R=101.0), _spec(n_pontos=300), _spec(grade="adaptativa"),
+             _spec(parasitas=calculo.Parasitas(R_C=1.0))]
+    assert len({cache.chave(s) for s in specs}) == len(specs)
+    w = np.logspace(2, 6, 50)
+    assert cache.chave(_spec(), w) != cache.chave(_spec())
+    assert cache.chave(_spec(), w) == cache.chave(_spec(), w.copy())
+
+
+def test_lru_por_entradas():
+    c = cache.CacheRespostas(max_entradas=2)
+    a, b = c.calcular(_spec(R=1.0)), c.calcular(_spec(R=2.0))
+    c.calcular(_spec(R=1.0))                 # a passa a ser a mais recente
+    c.calcular(_spec(R=3.0))                 # despeja b
+    assert len(c) == 2
+    assert c.calcular(_spec(R=1.0)) is a
+    assert c.calcular(_spec(R=2.0)) is not b
+
+
+def test_lru_por_bytes():
+    tamanho = cache._tamanho(calculo.calcular(_spec()))
+    c = cache.CacheRespostas(max_bytes=int(2.5 * tamanho))
+    for R in (1.0, 2.0, 3.0):
+        c.calcular(_spec(R=R))
+    assert len(c) == 2 and c.bytes == 2 * tamanho <= c.max_bytes
+    falhas = c.falhas
+    c.calcular(_spec(R=1.0))                 # a mais antiga foi a despejada
+    assert c.falhas == falhas + 1
+    c.limpar()
+    assert len(c) == 0 and c.bytes == 0
+
+
+def test_salvar_e_carregar(tmp_path):
+    arquivo = str(tmp_path / "cache.pkl")
+    c = cache.CacheRespostas(arquivo=arquivo)
+    specs = [_spec(R=R) for R in (1.0, 2.0, 3.0)]
+    originais = [c.calcular(s) for s in specs]
+    c.salvar()
+    assert not (tmp_path / "cache.pkl.tmp").exists()
+
+    novo = cache.CacheRespostas(arquivo=arquivo)
+    assert len(novo) == 3 and novo.bytes == c.bytes
+    for spec, original in zip(specs, originais):
+        resposta = novo.calcular(spec)
+        np.testing.assert_array_equal(resposta.w, original.w)
+        np.testing.assert_array_equal(resposta.fase, original.fase)
+        assert resposta.spec == spec and not resposta.mag.flags.writeable
+    assert (novo.acertos, novo.falhas) == (3, 0)
+
+    # a ordem LRU também volta do disco
+    novo.max_entradas = 2
+    novo.calcular(_spec(R=4.0))
+    assert cache.chave(specs[0]) not in novo._dados
@@ -0,0 +1,172 @@
+import numpy as np
+import pytest
+from scipy.signal import bode
+
+import calculo
+
+# projetos de referência de cada tipo (mesmos valores padrão da interface) e
+# uma grade que não passa exatamente por ω0 (onde o notch tem |H| = 0)
+PROJETOS = {
+    "passa_baixa": (100.0, 1e-6, None),
+    "passa_alta": (100.0, 1e-6, None),
+    "passa_faixa": (100.0, 1e-6, 1e-3),
+    "rejeita_faixa": (100.0, 1e-6, 1e-3),
+}
+W = np.logspace(1, 7, 2001)
+
+# erro admitido em |H| (relativo ao maior ganho) e na fase (graus) por precisão
+TOLERANCIAS = {np.complex128: (1e-10, 1e-8), np.complex64: (1e-5, 1e-2)}
+
+
+def _bode(num, den):
+    _, mag_db, fase = bode((num, den), w=W)
+    return 10**(mag_db / 20.0), fase
+
+
+def _diferenca_angular(a, b):
+    # bode() desenrola a fase; compara módulo 360°
+    return np.abs((a - b + 180.0) % 360.0 - 180.0)
+
+
+@pytest.mark.parametrize("dtype", list(TOLERANCIAS), ids=lambda d: d.__name__)
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_magnitude_fase_igual_ao_bode(tipo, dtype):
+    R, C, L = PROJETOS[tipo]
+    num, den = calculo.coeficientes_lote(tipo, R, C, L)
+    mag_ref, fase_ref = _bode(num[0], den[0])
+
+    mag, fase = calculo.magnitude_fase(num, den, W, dtype)
+    tol_mag, tol_fase = TOLERANCIAS[dtype]
+    assert mag.dtype == np.finfo(dtype).dtype
+    assert np.max(np.abs(mag[0] - mag_ref)) <= tol_mag * mag_ref.max()
+    # perto do zero do notch a fase não é bem definida
+    definida = mag_ref > 1e-3 * mag_ref.max()
+    assert np.max(_diferenca_angular(fase[0], fase_ref)[definida]) <= tol_fase
+
+
+@pytest.mark.parametrize("dtype", list(TOLERANCIAS), ids=lambda d: d.__name__)
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_avaliar_lote_varios_projetos(tipo, dtype):
+    rng = np.random.default_rng(0)
+    R = rng.uniform(1, 1e3, 8)
+    C = rng.uniform(1e-9, 1e-6, 8)
+    L = rng.uniform(1e-4, 1e-2, 8) if tipo in calculo.TIPOS_RLC else None
+    num, den = calculo.coeficientes_lote(tipo, R, C, L)
+
+    H = calculo.avaliar_lote(num, den, calculo.eixo_jw(W, dtype), dtype)
+    assert H.shape == (8, W.size) and H.dtype == dtype
+    tol_mag, _ = TOLERANCIAS[dtype]
+    for i in range(8):
+        mag_ref, _ = _bode(num[i], den[i])
+        assert np.max(np.abs(np.abs(H[i]) - mag_ref)) <= tol_mag * mag_ref.max()
+
+
+# -----------------------------
+# Resistências parasitas
+# -----------------------------
+def _divisor(tipo, R, C, L, p, w):
+    # H direto das impedâncias: Z1 em série, Z2 em paralelo com a carga
+    s = 1j * w
+    capacitor = p.R_C + 1.0 / (s * C)
+    resistor = np.full_like(s, R)
+    if tipo == "passa_baixa":
+        Z1, Z2 = resistor, capacitor
+    elif tipo == "passa_alta":
+        Z1, Z2 = capacitor, resistor
+    else:
+        lc = s * L + p.R_L + capacitor
+        Z1, Z2 = (lc, resistor) if tipo == "passa_faixa" else (resistor, lc)
+    Z2 = Z2 * p.R_carga / (Z2 + p.R_carga)
+    return Z2 / (p.R_fonte + Z1 + Z2)
+
+
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_parasitas_igual_ao_divisor(tipo):
+    R, C, L = PROJETOS[tipo]
+    p = calculo.Parasitas(R_L=7.0, R_C=0.5, R_fonte=50.0, R_carga=2e3)
+    num, den = calculo.coeficientes_lote(tipo, R, C, L, p)
+
+    H = calculo.avaliar_lote(num, den, W)[0]
+    H_ref = _divisor(tipo, R, C, L, p, W)
+    assert np.max(np.abs(H - H_ref)) <= 1e-10 * np.abs(H_ref).max()
+
+
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_parasitas_padrao_igual_ao_ideal(tipo):
+    R, C, L = PROJETOS[tipo]
+    H = calculo.avaliar_lote(*calculo.coeficientes_lote(tipo, R, C, L, calculo.Parasitas()), W)
+    H_ideal = calculo.avaliar_lote(*calculo.coeficientes_lote(tipo, R, C, L), W)
+    assert np.max(np.abs(H - H_ideal)) <= 1e-12
+
+    metricas = calculo.metricas_lote(tipo, R, C, L, calculo.Parasitas())
+    for chave, ideal in calculo.metricas_lote(tipo, R, C, L).items():
+        np.testing.assert_allclose(metricas[chave], ideal, rtol=1e-9)
+
+
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_cortes_com_parasitas_em_menos_3db(tipo):
+    rng = np.random.default_rng(1)
+    R = rng.uniform(10, 1e3, 50)
+    C = rng.uniform(1e-9, 1e-6, 50)
+    L = rng.uniform(1e-4, 1e-2, 50) if tipo in calculo.TIPOS_RLC else None
+    p = calculo.Parasitas(R_L=rng.uniform(0, 5, 50), R_C=rng.uniform(0, 1, 50),
+                          R_fonte=rng.uniform(0, 50, 50), R_carga=rng.uniform(1e4, 1e5, 50))
+    num, den = calculo.coeficientes_lote(tipo, R, C, L, p)
+    metricas = calculo.metricas_lote(tipo, R, C, L, p)
+
+    cortes = [metricas["wc"]] if tipo not in calculo.TIPOS_RLC else [metricas["wc1"], metricas["wc2"]]
+    alvo = calculo.ganho_maximo_biquad(num, den) / np.sqrt(2.0)
+    for wc in cortes:
+        assert np.all(np.isfinite(wc))
+        H = calculo.avaliar_lote(num, den, wc[:, None])[:, 0]
+        np.testing.assert_allclose(np.abs(H), alvo, rtol=1e-6)
+
+
+def test_notch_com_parasitas_tem_profundidade_finita():
+    R, C, L = PROJETOS["rejeita_faixa"]
+    with np.errstate(divide='ignore'):
+        ideal = calculo.profundidade_notch(*calculo.coeficientes_lote("rejeita_faixa", R, C, L))
+    real = calculo.profundidade_notch(*calculo.coeficientes_lote("rejeita_faixa", R, C, L,
+                                                                 calculo.Parasitas(R_L=5.0)))
+    assert np.isinf(ideal[0])
+    # em ω0 o ramo LC vale só R_L: |H| = R_L / (R + R_L)
+    np.testing.assert_allclose(real, -20.0 * np.log10(5.0 / 105.0), rtol=1e-9)
+
+
+@pytest.mark.parametrize("tipo, R, L, p", [
+    # notch raso: o ramo LC nunca cai abaixo de R_L, |H| mínimo = 300/400 > 1/√2
+    ("rejeita_faixa", 100.0, 1e-3, calculo.Parasitas(R_L=300.0)),
+    # ESR alto deixa um patamar acima de -3 dB
+    ("passa_baixa", 100.0, None, calculo.Parasitas(R_C=300.0)),
+    ("passa_baixa", 100.0, None, calculo.Parasitas(R_C=300.0, R_carga=50.0)),
+])
+def test_sem_cruzamento_fica_nan_sem_busca(monkeypatch, tipo, R, L, p):
+    def proibido(*args, **kwargs):
+        raise AssertionError("projeto sem cruzamento não deveria ir para a busca numérica")
+    monkeypatch.setattr(calculo, "cortes_numericos", proibido)
+
+    n = 1000
+    C = np.geomspace(1e-9, 1e-6, n)
+    metricas = calculo.metricas_lote(tipo, R, C, L, p)
+    chave = "wc1" if tipo in calculo.TIPOS_RLC else "wc"
+    assert np.all(np.isnan(metricas[chave]))
+
+
+@pytest.mark.parametrize("grade", ["fixa", "adaptativa"])
+def test_grade_sem_corte_centrada_no_polo(grade):
+    # com ESR de 300 Ω o passa-baixa não cai 3 dB (ωc = NaN); a grade fica
+    # em volta do pólo 1/((R + R_C) C) = 2500 rad/s
+    spec = calculo.FiltroSpec("passa_baixa", 100.0, 1e-6, grade=grade,
+                              parasitas=calculo.Parasitas(R_C=300.0))
+    resposta = calculo.calcular(spec)
+    assert np.isnan(resposta.metricas.wc)
+    assert np.all(np.isfinite(resposta.w)) and np.all(np.isfinite(resposta.mag))
+    np.testing.assert_allclose([resposta.w[0], resposta.w[-1]], [25.0, 2.5e5])
+
+    sintonia = calculo.Sintonia(spec)
+    np.testing.assert_allclose([sintonia.w[0], sintonia.w[-1]], [25.0, 2.5e5])
+    assert np.all(np.isfinite(sintonia.ajustar(R=200.0).mag))
+
+    lote = calculo.resposta_lote("passa_baixa", [100.0, 100.0], 1e-6,
+                                 parasitas=calculo.Parasitas(R_C=[300.0, 0.0]))
+    np.testing.assert_allclose(lote["w"][:, 0], [25.0, 100.0])
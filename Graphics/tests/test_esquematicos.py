@@ -0,0 +1,17 @@
+import pytest
+
+import esquematicos
+
+
+@pytest.mark.parametrize("valor, unidade, texto", [
+    (100.0, "Ω", "100 Ω"),
+    (1e-6, "F", "1 µF"),
+    (4.7e3, "Ω", "4.7 kΩ"),
+    (999.99, "Ω", "1 kΩ"),
+    (999.4, "Ω", "999 Ω"),
+    (0.99999e-6, "F", "1 µF"),
+    (999.9e-9, "H", "1 µH"),
+    (1e-12, "F", "1 pF"),
+])
+def test_formatar(valor, unidade, texto):
+    assert esquematicos.formatar(valor, unidade) == texto
@@ -0,0 +1,65 @@
+import csv
+import json
+import math
+
+import pytest
+
+import lote
+
+
+def test_saida_repete_parasitas():
+    linhas = [
+        {"tipo": "rejeita_faixa", "R": "100", "C": "1e-6", "L": "1e-3", "R_L": "5", "R_carga": "2e3"},
+        {"tipo": "passa_baixa", "R": "100", "C": "1e-6"},
+    ]
+    com, sem = lote.avaliar_linhas(linhas)
+    assert list(com) == lote.colunas()
+    assert (com["R_L"], com["R_C"], com["R_fonte"], com["R_carga"]) == (5.0, None, None, 2e3)
+    assert all(sem[k] is None for k in lote.PARASITAS)
+    assert com["erro"] is None and sem["erro"] is None
+    assert math.isclose(sem["wc"], 1e4)
+
+
+@pytest.mark.parametrize("linha, mensagem", [
+    ({"tipo": "passa_baixa", "C": "1e-6"}, "Falta o valor de R"),
+    ({"tipo": "passa_baixa", "R": "", "C": "1e-6"}, "Falta o valor de R"),
+    ({"tipo": "passa_baixa", "R": "abc", "C": "1e-6"}, "R não é um número"),
+    ({"tipo": "passa_baixa", "R": "-100", "C": "1e-6"}, "R deve ser um número positivo"),
+    ({"tipo": "passa_alta", "R": "100", "C": "0"}, "C deve ser um número positivo"),
+    ({"tipo": "passa_alta", "R": "100", "C": "nan"}, "C deve ser um número positivo"),
+    ({"tipo": "passa_faixa", "R": "100", "C": "1e-6"}, "Falta o valor de L"),
+    ({"tipo": "rejeita_faixa", "R": "100", "C": "1e-6", "L": "inf"}, "L deve ser um número positivo"),
+    ({"tipo": "passa_faixa", "R": "100", "C": "1e-6", "L": "1e-3", "R_L": "x"}, "R_L não é um número"),
+    ({"tipo": "passa_faixa", "R": "100", "C": "1e-6", "L": "1e-3", "R_L": "-1"}, "R_L não pode ser negativa"),
+    ({"tipo": "elíptico", "R": "100", "C": "1e-6"}, "Tipo de filtro desconhecido"),
+])
+def test_linha_invalida_so_marca_o_erro_dela(linha, mensagem):
+    valida = {"tipo": "passa_baixa", "R": "100", "C": "1e-6"}
+    antes, ruim, depois = lote.avaliar_linhas([valida, linha, valida])
+    assert mensagem in ruim["erro"]
+    assert all(ruim[k] is None for k in lote.METRICAS)
+    for boa in (antes, depois):
+        assert boa["erro"] is None and math.isclose(boa["wc"], 1e4)
+
+
+def _estrito(texto):
+    def recusar(constante):
+        raise ValueError(f"JSON inválido: {constante}")
+    return json.loads(texto, parse_constant=recusar)
+
+
+def test_saida_sem_infinitos(tmp_path):
+    # |H| = 0 em ω = 0 (passa-alta) e em ω0 (notch ideal): -inf dB
+    entrada = tmp_path / "projetos.csv"
+    entrada.write_text("tipo,R,C,L\npassa_alta,100,1e-6,\nrejeita_faixa,100,1e-6,1e-3\n")
+    w0 = 1.0 / math.sqrt(1e-3 * 1e-6)
+
+    lote.processar(str(entrada), str(tmp_path / "saida.jsonl"), frequencias=[0.0, w0])
+    alta, notch = [_estrito(t) for t in (tmp_path / "saida.jsonl").read_text().splitlines()]
+    assert alta["mag_db@0"] is None
+    assert notch[f"mag_db@{w0:g}"] is None
+
+    lote.processar(str(entrada), str(tmp_path / "saida.csv"), frequencias=[0.0, w0])
+    with open(tmp_path / "saida.csv", newline="") as f:
+        alta, notch = csv.DictReader(f)
+    assert alta["mag_db@0"] == "" and notch[f"mag_db@{w0:g}"] == ""
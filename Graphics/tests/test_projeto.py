@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import calculo
+import projeto
+
+FAIXA_R = (10.0, 1e4)
+FAIXA_L = (1e-4, 1e-1)
+FAIXA_C = (1e-9, 1e-6)
+
+
+def _e12(faixa):
+    return np.asarray(projeto.valores_serie("E12", *faixa))
+
+
+def test_valores_serie():
+    valores = _e12((100.0, 1000.0))
+    np.testing.assert_array_equal(valores, [100, 120, 150, 180, 220, 270, 330, 390, 470, 560, 680, 820, 1000])
+    assert projeto.valores_serie("E12", 1e-9, 1e-8)[6] == 3.3e-9
+    with pytest.raises(ValueError):
+        projeto.valores_serie("E7", 1.0, 10.0)
+
+
+@pytest.mark.parametrize("tipo", ["passa_baixa", "passa_alta"])
+@pytest.mark.parametrize("wc", [1234.0, 7.7e4])
+def test_rc_igual_forca_bruta(tipo, wc):
+    R, C = (v.ravel() for v in np.meshgrid(_e12(FAIXA_R), _e12(FAIXA_C), indexing="ij"))
+    erro = np.abs(1.0 / (R * C) / wc - 1.0)
+
+    achados = projeto.projetar(tipo, wc=wc, serie="E12", n=5, faixa_R=FAIXA_R, faixa_C=FAIXA_C)
+    np.testing.assert_allclose([a.erro for a in achados], np.sort(erro)[:5], rtol=1e-12)
+    for a in achados:
+        assert a.erro == pytest.approx(abs(a.wc / wc - 1.0))
+        assert a.wc == pytest.approx(1.0 / (a.R * a.C))
+
+
+@pytest.mark.parametrize("tipo", ["passa_faixa", "rejeita_faixa"])
+@pytest.mark.parametrize("alvo", [{"w0": 2e4, "Q": 5.0}, {"w0": 3.3e5, "BW": 1e4}])
+def test_rlc_igual_forca_bruta(tipo, alvo):
+    R, L, C = (v.ravel() for v in np.meshgrid(_e12(FAIXA_R), _e12(FAIXA_L), _e12(FAIXA_C), indexing="ij"))
+    m = calculo.metricas_lote(tipo, R, C, L)
+    segundo = m["Q"] / alvo["Q"] - 1.0 if "Q" in alvo else m["BW"] / alvo["BW"] - 1.0
+    erro = np.hypot(m["w0"] / alvo["w0"] - 1.0, segundo)
+
+    achados = projeto.projetar(tipo, serie="E12", n=3, faixa_R=FAIXA_R, faixa_L=FAIXA_L,
+                               faixa_C=FAIXA_C, **alvo)
+    np.testing.assert_allclose([a.erro for a in achados], np.sort(erro)[:3], rtol=1e-12)
+    for a in achados:
+        assert a.w0 == pytest.approx(1.0 / np.sqrt(a.L * a.C))
+        assert a.Q == pytest.approx(a.w0 * a.L / a.R)
+
+
+def test_alvo_incompleto():
+    with pytest.raises(ValueError):
+        projeto.projetar("passa_baixa")
+    with pytest.raises(ValueError):
+        projeto.projetar("passa_faixa", w0=1e4, Q=2.0, BW=5e3)
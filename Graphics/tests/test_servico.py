@@ -0,0 +1,49 @@
+import asyncio
+import json
+import math
+
+import servico
+
+
+def _estrito(texto):
+    def recusar(constante):
+        raise ValueError(f"JSON inválido: {constante}")
+    return json.loads(texto, parse_constant=recusar)
+
+
+async def _post(porta, corpo):
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    dados = json.dumps(corpo).encode()
+    writer.write(b"POST /avaliar HTTP/1.1\r\nConnection: close\r\n"
+                 + f"Content-Length: {len(dados)}\r\n\r\n".encode() + dados)
+    resposta = await reader.read()
+    writer.close()
+    cabecalho, _, corpo = resposta.partition(b"\r\n\r\n")
+    return cabecalho.split(b"\r\n")[0], corpo
+
+
+def test_resposta_sem_infinitos():
+    # |H| = 0 em ω = 0 no passa-alta e em ω0 no notch ideal: -inf dB vira null
+    w0 = 1.0 / math.sqrt(1e-3 * 1e-6)
+    pedido = {"projetos": [{"tipo": "passa_alta", "R": 100, "C": 1e-6},
+                           {"tipo": "rejeita_faixa", "R": 100, "C": 1e-6, "L": 1e-3}],
+              "frequencias": [0, w0]}
+
+    async def rodar():
+        s = servico.Servico(processos=0)
+        _, porta = await s.iniciar(porta=0)
+        try:
+            return await _post(porta, pedido)
+        finally:
+            await s.fechar()
+
+    status, corpo = asyncio.run(rodar())
+    assert status == b"HTTP/1.1 200 OK"
+    alta, notch = _estrito(corpo)["resultados"]
+    assert alta["mag_db@0"] is None
+    assert notch[f"mag_db@{w0:g}"] is None
+
+
+def test_json_limpa_nao_finitos():
+    dados = {"a": [1.0, math.inf, -math.inf], "b": {"c": math.nan}, "d": "texto"}
+    assert servico._json(dados) == {"a": [1.0, None, None], "b": {"c": None}, "d": "texto"}
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from scipy.signal import bessel, butter, cheby1, freqs_zpk
+
+import sintese
+
+# bordas da banda: ω0² = w_inf·w_sup e BW = w_sup - w_inf, como no scipy
+W_INF, W_SUP = 2e3, 8e3
+W0, BW = np.sqrt(W_INF * W_SUP), W_SUP - W_INF
+WC = 1e4
+RIPPLE = 1.0
+W = np.logspace(1, 7, 3001)
+
+_BTYPE = {"passa_baixa": "lowpass", "passa_alta": "highpass",
+          "passa_faixa": "bandpass", "rejeita_faixa": "bandstop"}
+
+
+def _referencia(tipo, ordem, aproximacao):
+    faixa = [W_INF, W_SUP] if tipo in ("passa_faixa", "rejeita_faixa") else WC
+    opcoes = dict(btype=_BTYPE[tipo], analog=True, output="zpk")
+    if aproximacao == "butterworth":
+        z, p, k = butter(ordem, faixa, **opcoes)
+    elif aproximacao == "chebyshev":
+        z, p, k = cheby1(ordem, RIPPLE, faixa, **opcoes)
+    else:
+        z, p, k = bessel(ordem, faixa, norm="mag", **opcoes)
+    _, H = freqs_zpk(z, p, k, worN=W)
+    return np.abs(H)
+
+
+@pytest.mark.parametrize("aproximacao", sintese.APROXIMACOES)
+@pytest.mark.parametrize("ordem", [1, 2, 3, 4, 5])
+@pytest.mark.parametrize("tipo", list(_BTYPE))
+def test_cascata_igual_ao_projeto_do_scipy(tipo, ordem, aproximacao):
+    cascata = sintese.sintetizar(tipo, ordem, aproximacao, wc=WC, w0=W0, BW=BW, ripple_db=RIPPLE)
+    mag, _ = cascata.resposta(W)
+    ref = _referencia(tipo, ordem, aproximacao)
+    assert np.max(np.abs(mag - ref)) <= 1e-8 * ref.max()
+
+
+@pytest.mark.parametrize("tipo", ["passa_faixa", "rejeita_faixa"])
+def test_ordem_das_secoes(tipo):
+    # passa/rejeita-faixa de ordem n: n pólos de cada lado, em seções de 2ª ordem
+    cascata = sintese.sintetizar(tipo, 3, wc=WC, w0=W0, BW=BW)
+    _, den = cascata.coeficientes()
+    assert sum(np.trim_zeros(d, "f").size - 1 for d in den) == 6
+    assert all(s.R > 0 and s.C > 0 and s.L > 0 for s in cascata.secoes)
+
+
+def test_parametros_faltando():
+    with pytest.raises(ValueError):
+        sintese.sintetizar("passa_faixa", 2, w0=W0)
+    with pytest.raises(ValueError):
+        sintese.sintetizar("passa_baixa", 2)
+    with pytest.raises(ValueError):
+        sintese.sintetizar("passa_baixa", 2, "eliptico", wc=WC)
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+from scipy.signal import cont2discrete, lfilter
+
+import calculo
+import tempo
+
+PROJETOS = {
+    "passa_baixa": (1e3, 1e-6, None),
+    "passa_alta": (1e3, 1e-6, None),
+    "passa_faixa": (100.0, 1e-6, 1e-3),
+    "rejeita_faixa": (100.0, 1e-6, 1e-3),
+}
+FS = 48000.0
+
+
+def _referencia(tipo, metodo, x):
+    R, C, L = PROJETOS[tipo]
+    num, den = calculo.coeficientes_lote(tipo, R, C, L)
+    num_d, den_d, _ = cont2discrete((num[0], den[0]), 1.0 / FS, method=metodo)
+    return lfilter(np.ravel(num_d), den_d, x)
+
+
+@pytest.mark.parametrize("metodo", tempo.METODOS)
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_blocos_iguais_ao_lfilter(tipo, metodo):
+    x = np.random.default_rng(0).standard_normal(5000)
+    filtro = tempo.FiltroDiscreto.de_spec(calculo.FiltroSpec(tipo, *PROJETOS[tipo]), FS, metodo)
+    # blocos de tamanhos irregulares: o estado tem de passar de um para o outro
+    y = np.concatenate(list(tempo.filtrar_fluxo(np.split(x, [1, 7, 500, 2048]), filtro)))
+
+    ref = _referencia(tipo, metodo, x)
+    assert np.max(np.abs(y - ref)) <= 1e-9 * np.max(np.abs(ref))
+
+
+def test_zoh_comeca_com_uma_amostra_de_atraso():
+    filtro = tempo.FiltroDiscreto.de_spec(calculo.FiltroSpec("passa_baixa", 1e3, 1e-6), FS, "zoh")
+    y = filtro.processar(np.ones(3))
+    assert y[0] == 0.0 and y[1] > 0.0
+
+
+def _passa_faixa_estreito(f0, Q, C=1e-6):
+    w0 = 2.0 * np.pi * f0
+    L = 1.0 / (w0**2 * C)
+    return calculo.FiltroSpec("passa_faixa", w0 * L / Q, C, L)
+
+
+@pytest.mark.parametrize("f0, Q", [(16.0, 10.0), (50.0, 1600.0), (16.0, 2000.0)])
+def test_float32_so_nas_amostras(f0, Q):
+    # passa-faixas estreitos de baixa frequência: a recursão precisa de float64
+    spec = _passa_faixa_estreito(f0, Q)
+    t = np.arange(int(FS)) / FS
+    x = np.sin(2.0 * np.pi * f0 * t).astype(np.float32)
+    f64 = tempo.FiltroDiscreto.de_spec(spec, FS)
+    f32 = tempo.FiltroDiscreto.de_spec(spec, FS, dtype=np.float32)
+    assert f32.sos.dtype == np.float64
+
+    y64 = np.concatenate([f64.processar(b) for b in tempo.em_blocos(x, 4096)])
+    y32 = np.concatenate([f32.processar(b) for b in tempo.em_blocos(x, 4096)])
+    assert y32.dtype == np.float32
+    assert np.max(np.abs(y32 - y64)) <= 1e-6 * np.max(np.abs(y64))
+
+
+def test_filtrar_arquivo_float32(tmp_path):
+    x = np.random.default_rng(1).standard_normal(10000).astype(np.float32)
+    np.save(tmp_path / "entrada.npy", x)
+    spec = calculo.FiltroSpec("passa_faixa", *PROJETOS["passa_faixa"])
+    filtro = tempo.FiltroDiscreto.de_spec(spec, FS, dtype=np.float32)
+
+    n = tempo.filtrar_arquivo(str(tmp_path / "entrada.npy"), str(tmp_path / "saida.npy"), filtro,
+                              tamanho_bloco=3000)
+    y = np.load(tmp_path / "saida.npy")
+    ref = _referencia("passa_faixa", "bilinear", x.astype(np.float64))
+    assert n == x.size and y.dtype == np.float32
+    assert np.max(np.abs(y - ref)) <= 1e-6 * np.max(np.abs(ref))
+
+
+@pytest.mark.parametrize("tipo", calculo.TIPOS)
+def test_de_spec_com_parasitas(tipo):
+    R, C, L = PROJETOS[tipo]
+    p = calculo.Parasitas(R_L=20.0, R_C=5.0, R_fonte=50.0, R_carga=500.0)
+    filtro = tempo.FiltroDiscreto.de_spec(calculo.FiltroSpec(tipo, R, C, L, parasitas=p), FS)
+
+    num, den = calculo.coeficientes_lote(tipo, R, C, L, p)
+    num_d, den_d, _ = cont2discrete((num[0], den[0]), 1.0 / FS, method="bilinear")
+    x = np.random.default_rng(2).standard_normal(2000)
+    ref = lfilter(np.ravel(num_d), den_d, x)
+    assert np.max(np.abs(filtro.processar(x) - ref)) <= 1e-9 * np.max(np.abs(ref))
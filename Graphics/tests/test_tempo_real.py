@@ -0,0 +1,71 @@
+import io
+
+import numpy as np
+import pytest
+
+import calculo
+import tempo
+import tempo_real
+
+FS = 48000.0
+
+
+def _passa_faixa_estreito(f0=16.0, Q=2000.0, C=1e-6):
+    w0 = 2.0 * np.pi * f0
+    L = 1.0 / (w0**2 * C)
+    return calculo.FiltroSpec("passa_faixa", w0 * L / Q, C, L)
+
+
+def test_padrao_igual_ao_filtro_float64():
+    spec = _passa_faixa_estreito()
+    x = np.sin(2.0 * np.pi * 16.0 * np.arange(int(FS)) / FS).astype(np.float32)
+    processador = tempo_real.ProcessadorTempoReal(spec, FS, tamanho_buffer=256)
+    y = np.concatenate([processador.processar(b) for b in tempo.em_blocos(x, 256)])
+
+    ref = tempo.FiltroDiscreto.de_spec(spec, FS).processar(x)
+    np.testing.assert_allclose(y, ref, rtol=0, atol=1e-12 * np.max(np.abs(ref)))
+
+
+class _Picotado(io.BytesIO):
+    # entrega no máximo `passo` bytes por leitura, como um pipe
+    def __init__(self, dados, passo):
+        super().__init__(dados)
+        self.passo = passo
+
+    def readinto(self, destino):
+        return super().readinto(memoryview(destino)[:self.passo])
+
+
+@pytest.mark.parametrize("passo", [1024, 1000, 3])
+def test_fluxo_com_bytes_sobrando(passo):
+    x = np.random.default_rng(0).standard_normal(256).astype(np.float32)
+    entrada = _Picotado(x.tobytes() + b"\x01\x02", passo)
+    saida = io.BytesIO()
+    spec = calculo.FiltroSpec("passa_baixa", 1e3, 1e-6)
+    processador = tempo_real.ProcessadorTempoReal(spec, FS, tamanho_buffer=256)
+
+    with pytest.warns(RuntimeWarning, match="2 byte"):
+        total = tempo_real.executar_fluxo(processador, entrada, saida)
+
+    assert total == 256
+    y = np.frombuffer(saida.getvalue(), dtype=np.float32)
+    ref = tempo.FiltroDiscreto.de_spec(spec, FS).processar(x)
+    np.testing.assert_allclose(y, ref, rtol=1e-6, atol=1e-7)
+
+
+def test_bloco_vazio():
+    processador = tempo_real.ProcessadorTempoReal(calculo.FiltroSpec("passa_baixa", 1e3, 1e-6), FS)
+    assert processador.processar(np.empty(0, dtype=np.float32)).size == 0
+    assert processador.n_buffers == 0
+
+
+def test_ajustar_mantem_parasitas():
+    p = calculo.Parasitas(R_L=20.0, R_carga=500.0)
+    spec = calculo.FiltroSpec("passa_faixa", 100.0, 1e-6, 1e-3, parasitas=p)
+    processador = tempo_real.ProcessadorTempoReal(spec, FS)
+    processador.ajustar(R=150.0)
+    processador.processar(np.zeros(256))
+    assert processador.spec == calculo.FiltroSpec("passa_faixa", 150.0, 1e-6, 1e-3, parasitas=p)
+
+    num, den = calculo.coeficientes_lote("passa_faixa", 150.0, 1e-6, 1e-3, p)
+    np.testing.assert_allclose(processador.filtro.sos, tempo.discretizar(num[0], den[0], FS))
@@ -0,0 +1,91 @@
+import math
+
+import numpy as np
+import pytest
+
+import tolerancia
+
+N = 200_000
+T = 0.1
+
+
+def _momentos_inverso_uniforme(t):
+    # u ~ U(-t, t): E[1/(1+u)] e desvio de 1/(1+u)
+    media = math.log((1 + t) / (1 - t)) / (2 * t)
+    return media, math.sqrt(1.0 / (1 - t * t) - media**2)
+
+
+def test_media_e_desvio_rc():
+    # só R varia: ωc = ωc0 / (1 + u)
+    r = tolerancia.monte_carlo("passa_baixa", 1e3, 1e-6, tolerancia={"R": T}, n=N,
+                               distribuicao="uniforme", semente=1, tamanho_bloco=30_000)
+    media, desvio = _momentos_inverso_uniforme(T)
+    wc0 = 1e3
+    assert r.n == N
+    assert r.media["wc"] == pytest.approx(wc0 * media, abs=5 * wc0 * desvio / math.sqrt(N))
+    assert r.desvio["wc"] == pytest.approx(wc0 * desvio, rel=0.02)
+    assert wc0 / (1 + T) <= r.minimo["wc"] and r.maximo["wc"] <= wc0 / (1 - T)
+    contagens, bordas = r.histogramas["wc"]
+    assert contagens.sum() == N and bordas[0] < r.minimo["wc"] and r.maximo["wc"] < bordas[-1]
+
+
+def test_media_rlc():
+    # só L varia: ω0 = ω00 / √(1+u), BW = BW0 / (1+u)
+    R, C, L = 100.0, 1e-6, 1e-3
+    r = tolerancia.monte_carlo("passa_faixa", R, C, L, tolerancia={"L": T}, n=N,
+                               distribuicao="uniforme", semente=2)
+    media, desvio = _momentos_inverso_uniforme(T)
+    BW0 = R / L
+    assert r.media["BW"] == pytest.approx(BW0 * media, abs=5 * BW0 * desvio / math.sqrt(N))
+    # E[(1+u)^-1/2] = ((1+t)^1/2 - (1-t)^1/2) / t
+    w00 = 1.0 / math.sqrt(L * C)
+    assert r.media["w0"] == pytest.approx(w00 * (math.sqrt(1 + T) - math.sqrt(1 - T)) / T, rel=1e-3)
+    assert set(r.media) == set(tolerancia.METRICAS_RLC)
+
+
+@pytest.mark.parametrize("distribuicao, a, esperado", [
+    ("uniforme", 0.04, 0.04 / T),
+    # normal com σ = t/3: P(|u| <= σ)
+    ("normal", T / 3, math.erf(1 / math.sqrt(2))),
+    ("normal", 2 * T, 1.0),      # truncada em ±t: tudo passa
+])
+def test_rendimento(distribuicao, a, esperado):
+    wc0 = 1e3
+    limites = {"wc": (wc0 / (1 + a), wc0 / (1 - a))}      # |u| <= a
+    r = tolerancia.monte_carlo("passa_alta", 1e3, 1e-6, tolerancia={"R": T}, n=N,
+                               distribuicao=distribuicao, limites=limites, semente=3)
+    erro_padrao = math.sqrt(esperado * (1 - esperado) / N)
+    assert r.rendimento == pytest.approx(esperado, abs=5 * erro_padrao + 1e-12)
+    assert r.rendimento_metrica["wc"] == r.rendimento
+
+
+def test_rendimento_de_varias_metricas():
+    # Q = (1/R)√(L/C) e BW = R/L com só R variando: os dois limites cortam o mesmo lado
+    R, C, L = 100.0, 1e-6, 1e-3
+    r = tolerancia.monte_carlo("passa_faixa", R, C, L, tolerancia={"R": T}, n=N,
+                               distribuicao="uniforme", semente=4,
+                               limites={"BW": (R / L, np.inf), "Q": (0.0, np.inf)})
+    assert r.rendimento_metrica["Q"] == 1.0
+    assert r.rendimento == r.rendimento_metrica["BW"] == pytest.approx(0.5, abs=5 * 0.5 / math.sqrt(N))
+
+
+def test_semente_e_processos():
+    opcoes = dict(tolerancia=0.05, n=20_000, semente=7, tamanho_bloco=3_000)
+    a = tolerancia.monte_carlo("rejeita_faixa", 100.0, 1e-6, 1e-3, **opcoes)
+    b = tolerancia.monte_carlo("rejeita_faixa", 100.0, 1e-6, 1e-3, **opcoes)
+    assert a.media == b.media
+    for k in a.histogramas:
+        np.testing.assert_array_equal(a.histogramas[k][0], b.histogramas[k][0])
+
+    p = tolerancia.monte_carlo("rejeita_faixa", 100.0, 1e-6, 1e-3, processos=2, **opcoes)
+    assert p.n == 20_000
+    assert p.media["w0"] == pytest.approx(a.media["w0"], rel=1e-3)
+
+
+def test_parametros_invalidos():
+    with pytest.raises(ValueError):
+        tolerancia.monte_carlo("passa_faixa", 100.0, 1e-6)
+    with pytest.raises(ValueError):
+        tolerancia.monte_carlo("passa_baixa", 100.0, 1e-6, distribuicao="triangular")
+    with pytest.raises(ValueError):
+        tolerancia.monte_carlo("passa_baixa", 100.0, 1e-6, limites={"Q": (1, 2)})
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from scipy.signal import impulse, step
+
+import calculo
+import transitorio
+
+L, C = 1e-3, 1e-6
+R_CRITICO = 2.0 * np.sqrt(L / C)       # R/L = 2 ω0
+
+# sub, crítico e sobreamortecido nos RLC; os RC só têm um pólo real
+PROJETOS = [("passa_baixa", 100.0, None), ("passa_alta", 100.0, None)] + [
+    (tipo, R, L) for tipo in calculo.TIPOS_RLC for R in (10.0, R_CRITICO, 2000.0)]
+
+
+def _coeficientes(tipo, R, Lp):
+    num, den = calculo.coeficientes_lote(tipo, R, C, Lp)
+    return num[0], den[0]
+
+
+@pytest.mark.parametrize("tipo, R, Lp", PROJETOS)
+def test_degrau_igual_ao_scipy(tipo, R, Lp):
+    r = transitorio.resposta_tempo(tipo, R, C, Lp, n_pontos=500)
+    t, y = r["t"][0], r["y"][0]
+    _, y_ref = step(_coeficientes(tipo, R, Lp), T=t)
+    assert np.max(np.abs(y - y_ref)) <= 1e-9
+
+
+@pytest.mark.parametrize("tipo, R, Lp", PROJETOS)
+def test_impulso_igual_ao_scipy(tipo, R, Lp):
+    r = transitorio.resposta_tempo(tipo, R, C, Lp, n_pontos=500, entrada="impulso")
+    t, y = r["t"][0], r["y"][0]
+    # scipy.signal.impulse também deixa de fora o termo k·δ(t)
+    _, y_ref = impulse(_coeficientes(tipo, R, Lp), T=t)
+    assert np.max(np.abs(y - y_ref)) <= 1e-9 * np.max(np.abs(y_ref))
+    num, den = _coeficientes(tipo, R, Lp)
+    k = num[0] / den[0] if num.size == den.size else 0.0
+    assert r["direto"][0] == pytest.approx(k)
+
+
+def test_varios_projetos_de_uma_vez():
+    R = np.array([10.0, R_CRITICO, 2000.0])
+    t = np.linspace(0, 2e-3, 300)
+    r = transitorio.resposta_tempo("passa_faixa", R, C, L, t=t)
+    for i, Ri in enumerate(R):
+        _, y_ref = step(_coeficientes("passa_faixa", Ri, L), T=t)
+        assert np.max(np.abs(r["y"][i] - y_ref)) <= 1e-9
+
+
+def test_metricas_segunda_ordem_subamortecida():
+    # passa-baixa padrão ω²/(s² + 2ζω s + ω²): sobressinal e pico têm forma fechada
+    w, zeta = 1e3, 0.2
+    t = np.linspace(0, 0.05, 200001)
+    _, y = step(([w**2], [1.0, 2 * zeta * w, w**2]), T=t)
+    m = transitorio.metricas_degrau(t[None, :], y[None, :], [0.0], [1.0])
+    wd = w * np.sqrt(1 - zeta**2)
+    assert m["sobressinal"][0] == pytest.approx(100 * np.exp(-np.pi * zeta / np.sqrt(1 - zeta**2)), rel=1e-4)
+    assert m["tempo_pico"][0] == pytest.approx(np.pi / wd, rel=1e-3)
+    assert m["tempo_acomodacao"][0] == pytest.approx(4 / (zeta * w), rel=0.2)
+
+
+def test_metricas_sem_sobressinal():
+    # RC: subida 10-90% = RC ln 9; sem sobressinal o tempo de pico não existe
+    m = transitorio.metricas_lote("passa_baixa", [100.0], [1e-6], n_pontos=20000)
+    assert m["tempo_subida"][0] == pytest.approx(100 * 1e-6 * np.log(9), rel=1e-3)
+    assert m["sobressinal"][0] == 0.0
+    assert np.isnan(m["tempo_pico"][0])
+    assert m["w_oscilacao"][0] == 0.0
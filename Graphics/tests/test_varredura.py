@@ -0,0 +1,104 @@
+import glob
+import os
+
+import numpy as np
+import pytest
+
+import calculo
+import varredura
+
+R = np.geomspace(10.0, 1e3, 7)
+L = np.geomspace(1e-4, 1e-2, 5)
+C = np.geomspace(1e-9, 1e-6, 6)
+W = [1e3, 1e4]
+
+
+def _varredura(pasta=None, **opcoes):
+    opcoes = dict(dict(frequencias=W, tamanho_bloco=40, processos=1, pasta=pasta), **opcoes)
+    return varredura.Varredura("passa_faixa", R, C, L, **opcoes)
+
+
+def _juntar(blocos):
+    blocos = sorted(blocos, key=lambda b: b["indice"][0])
+    return {k: np.concatenate([b[k] for b in blocos]) for k in blocos[0]}
+
+
+def _conferir(resultado):
+    # mesma ordem do produto cartesiano R x L x C
+    r, l, c = (v.ravel() for v in np.meshgrid(R, L, C, indexing="ij"))
+    np.testing.assert_array_equal(resultado["indice"], np.arange(r.size))
+    np.testing.assert_array_equal(resultado["R"], r)
+    metricas = calculo.metricas_lote("passa_faixa", r, c, l)
+    for chave in ("wc1", "wc2", "w0", "Q"):
+        np.testing.assert_allclose(resultado[chave], metricas[chave])
+    num, den = calculo.coeficientes_lote("passa_faixa", r, c, l)
+    np.testing.assert_allclose(resultado["atenuacao_db"],
+                               -20.0 * np.log10(np.abs(calculo.avaliar_lote(num, den, W))))
+
+
+def test_varredura_completa():
+    v = _varredura()
+    _conferir(_juntar(list(v.executar())))
+    assert v.progresso == 1.0 and v.n_blocos == 6
+
+
+def test_retoma_do_checkpoint(tmp_path):
+    v = _varredura(tmp_path)
+    execucao = v.executar()
+    primeiro = next(execucao)
+    execucao.close()            # "queda" depois do primeiro bloco
+
+    retomada = _varredura(tmp_path)
+    pendentes = retomada.blocos_pendentes()
+    assert primeiro["indice"][0] // 40 not in pendentes
+    novos = list(retomada.executar())
+    assert len(novos) == len(pendentes) and retomada.progresso == 1.0
+    _conferir(_juntar(list(retomada.carregar())))
+
+
+def test_queda_ao_salvar_nao_deixa_bloco_falso(tmp_path, monkeypatch):
+    def queda(*args):
+        raise OSError("queda no meio da gravação")
+    monkeypatch.setattr(varredura.os, "replace", queda)
+    with pytest.raises(OSError):
+        list(_varredura(tmp_path).executar())
+    monkeypatch.undo()
+
+    # o temporário que sobrou não pode passar por bloco salvo
+    assert glob.glob(os.path.join(tmp_path, "bloco_*.npz")) == []
+    v = _varredura(tmp_path)
+    assert v.blocos_pendentes() == list(range(v.n_blocos))
+    _conferir(_juntar(list(v.executar())))
+
+    # nem atrapalhar o reinício com outros parâmetros
+    list(_varredura(tmp_path, frequencias=[1e3], reiniciar=True).executar())
+    assert not glob.glob(os.path.join(tmp_path, "*.tmp"))
+
+
+def test_pasta_de_outra_varredura(tmp_path):
+    list(_varredura(tmp_path).executar())
+    # frequências diferentes: os blocos salvos não servem
+    with pytest.raises(ValueError, match="outros parâmetros"):
+        _varredura(tmp_path, frequencias=[1e3]).blocos_pendentes()
+    with pytest.raises(ValueError, match="outros parâmetros"):
+        list(_varredura(tmp_path, tamanho_bloco=30).executar())
+
+    v = _varredura(tmp_path, reiniciar=True, frequencias=[1e3])
+    assert len(list(v.executar())) == v.n_blocos
+    assert _varredura(tmp_path, frequencias=[1e3]).blocos_pendentes() == []
+
+
+def test_assinatura():
+    assert _varredura().assinatura() == _varredura().assinatura()
+    assert _varredura().assinatura() != _varredura(frequencias=[1e3]).assinatura()
+    assert _varredura().assinatura() != _varredura(tamanho_bloco=30).assinatura()
+
+
+def test_cancelar():
+    v = _varredura(tamanho_bloco=5)
+    recebidos = 0
+    for _ in v.executar():
+        recebidos += 1
+        v.cancelar()
+    # só terminam os blocos que já estavam em andamento (até 2 por processo)
+    assert recebidos <= 3 and v.feitos == recebidos and v.progresso < 1.0
@@ -0,0 +1,216 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+import calculo
+
+# Análise de Monte Carlo das tolerâncias de R, L e C. As amostras são geradas
+# e avaliadas em blocos (calculo.metricas_lote, tudo vetorizado); de cada
+# bloco só ficam histogramas em bordas fixas, somas e contagens de aprovação,
+# então a memória não cresce com o número de amostras. Os blocos podem ser
+# divididos entre processos, cada um com sua própria semente derivada.
+
+DISTRIBUICOES = ("normal", "uniforme")
+METRICAS_RC = ("wc",)
+METRICAS_RLC = ("wc1", "wc2", "w0", "BW", "Q")
+
+
+def amostrar(rng, nominal, tolerancia, n, distribuicao="normal"):
+    """n valores em torno do nominal.
+
+    'uniforme': entre nominal·(1 ± tolerancia).
+    'normal': desvio padrão tolerancia/3 (99,7% dentro da tolerância), truncado em ±tolerancia.
+    """
+    if distribuicao == "uniforme":
+        desvio = rng.uniform(-tolerancia, tolerancia, n)
+    elif distribuicao == "normal":
+        desvio = np.clip(rng.normal(0.0, tolerancia / 3.0, n), -tolerancia, tolerancia)
+    else:
+        raise ValueError(f"Distribuição desconhecida: {distribuicao!r}")
+    return nominal * (1.0 + desvio)
+
+
+def _metricas(tipo):
+    return METRICAS_RLC if tipo in calculo.TIPOS_RLC else METRICAS_RC
+
+
+def _bordas(tipo, R, C, L, tolerancias, n_classes):
+    # bordas fixas dos histogramas: o pior caso das tolerâncias, com folga
+    nominal = calculo.metricas_lote(tipo, R, C, L)
+    bordas = {}
+    folga = 1.0 + 3.0 * max(tolerancias.values())
+    for nome in _metricas(tipo):
+        valor = float(nominal[nome][0])
+        bordas[nome] = np.geomspace(valor / folga, valor * folga, n_classes + 1)
+    return bordas
+
+
+def _avaliar_parte(tipo, R, C, L, tolerancias, distribuicao, n, tamanho_bloco,
+                   semente, bordas, limites):
+    """Roda n amostras em blocos e devolve só os acumuladores (pode rodar noutro processo)."""
+    rng = np.random.default_rng(semente)
+    nomes = _metricas(tipo)
+    acum = {
+        "n": 0,
+        "aprovados": 0,
+        "aprovados_metrica": {k: 0 for k in limites},
+        "contagens": {k: np.zeros(bordas[k].size - 1, dtype=np.int64) for k in nomes},
+        "soma": {k: 0.0 for k in nomes},
+        "soma2": {k: 0.0 for k in nomes},
+        "minimo": {k: np.inf for k in nomes},
+        "maximo": {k: -np.inf for k in nomes},
+    }
+    restante = n
+    while restante > 0:
+        m = min(tamanho_bloco, restante)
+        restante -= m
+        Rs = amostrar(rng, R, tolerancias["R"], m, distribuicao)
+        Cs = amostrar(rng, C, tolerancias["C"], m, distribuicao)
+        Ls = amostrar(rng, L, tolerancias["L"], m, distribuicao) if L is not None else None
+        metricas = calculo.metricas_lote(tipo, Rs, Cs, Ls)
+
+        acum["n"] += m
+        for k in nomes:
+            v = metricas[k]
+            acum["contagens"][k] += np.histogram(v, bordas[k])[0]
+            acum["soma"][k] += float(v.sum())
+            acum["soma2"][k] += float(np.dot(v, v))
+            acum["minimo"][k] = min(acum["minimo"][k], float(v.min()))
+            acum["maximo"][k] = max(acum["maximo"][k], float(v.max()))
+
+        aprovado = np.ones(m, dtype=bool)
+        for k, (minimo, maximo) in limites.items():
+            ok = (metricas[k] >= minimo) & (metricas[k] <= maximo)
+            acum["aprovados_metrica"][k] += int(ok.sum())
+            aprovado &= ok
+        acum["aprovados"] += int(aprovado.sum())
+    return acum
+
+
+def _somar(total, parte):
+    total["n"] += parte["n"]
+    total["aprovados"] += parte["aprovados"]
+    for k, v in parte["aprovados_metrica"].items():
+        total["aprovados_metrica"][k] += v
+    for k in parte["contagens"]:
+        total["contagens"][k] += parte["contagens"][k]
+        total["soma"][k] += parte["soma"][k]
+        total["soma2"][k] += parte["soma2"][k]
+        total["minimo"][k] = min(total["minimo"][k], parte["minimo"][k])
+        total["maximo"][k] = max(total["maximo"][k], parte["maximo"][k])
+    return total
+
+
+@dataclass
+class ResultadoMC:
+    """Resumo de uma análise de Monte Carlo.
+
+    histogramas[metrica] = (contagens, bordas); rendimento é a fração de
+    amostras dentro de todos os limites (1.0 se não houver limites).
+    """
+    tipo: str
+    n: int
+    histogramas: dict
+    media: dict
+    desvio: dict
+    minimo: dict
+    maximo: dict
+    limites: dict = field(default_factory=dict)
+    rendimento: float = 1.0
+    rendimento_metrica: dict = field(default_factory=dict)
+
+    def resumo(self):
+        linhas = [f"{self.tipo}: {self.n} amostras"]
+        for k in self.media:
+            linhas.append(f"  {k:4s} média = {self.media[k]:.4e}  desvio = {self.desvio[k]:.3e}  "
+                          f"[{self.minimo[k]:.4e}, {self.maximo[k]:.4e}]")
+        for k, (minimo, maximo) in self.limites.items():
+            linhas.append(f"  {k:4s} em [{minimo:.4e}, {maximo:.4e}]: {100 * self.rendimento_metrica[k]:.2f}%")
+        linhas.append(f"  rendimento = {100 * self.rendimento:.2f}%")
+        return "\n".join(linhas)
+
+    def plotar(self, mostrar=True):
+        """Um histograma por métrica, com os limites de especificação."""
+        import matplotlib.pyplot as plt
+
+        nomes = list(self.histogramas)
+        fig, eixos = plt.subplots(len(nomes), 1, figsize=(8, 2.2 * len(nomes)), squeeze=False)
+        for ax, k in zip(eixos[:, 0], nomes):
+            contagens, bordas = self.histogramas[k]
+            ax.stairs(contagens / self.n, bordas, fill=True, alpha=0.6)
+            ax.set_xscale('log')
+            ax.set_ylabel('fração')
+            ax.set_title(k)
+            for limite in self.limites.get(k, ()):
+                if np.isfinite(limite):
+                    ax.axvline(limite, color='r', linestyle='--')
+        eixos[-1, 0].set_xlabel('rad/s (Q adimensional)')
+        fig.tight_layout()
+        if mostrar:
+            plt.show()
+        return fig
+
+
+def monte_carlo(tipo, R, C, L=None, tolerancia=0.05, n=1_000_000, distribuicao="normal",
+                limites=None, tamanho_bloco=100_000, processos=1, semente=None, n_classes=100):
+    """Análise de Monte Carlo das métricas do filtro com componentes em tolerância.
+
+    Parâmetros
+    ----------
+    tipo : tipo de filtro (ver calculo.TIPOS).
+    R, C, L : valores nominais.
+    tolerancia : fração (0.05 = 5%) igual para todos, ou dicionário {'R': .., 'C': .., 'L': ..}.
+    n : número de amostras.
+    distribuicao : 'normal' ou 'uniforme' (ver amostrar).
+    limites : {metrica: (minimo, maximo)} da especificação, ex. {'w0': (9.5e3, 1.05e4)}.
+    tamanho_bloco : amostras avaliadas de cada vez (limita a memória).
+    processos : > 1 divide as amostras entre processos.
+    semente : semente do gerador (reprodutível para o mesmo número de processos).
+    """
+    tipo = calculo.normalizar_tipo(tipo)
+    if tipo in calculo.TIPOS_RLC and L is None:
+        raise ValueError(f"O filtro {tipo} precisa de L.")
+    if distribuicao not in DISTRIBUICOES:
+        raise ValueError(f"Distribuição desconhecida: {distribuicao!r}")
+    if not isinstance(tolerancia, dict):
+        tolerancia = {"R": tolerancia, "C": tolerancia, "L": tolerancia}
+    tolerancias = {"R": 0.0, "C": 0.0, "L": 0.0, **tolerancia}
+    limites = dict(limites or {})
+    for k in limites:
+        if k not in _metricas(tipo):
+            raise ValueError(f"Métrica {k!r} não se aplica ao filtro {tipo}.")
+
+    bordas = _bordas(tipo, R, C, L, tolerancias, n_classes)
+    processos = max(1, min(int(processos or os.cpu_count() or 1), n))
+    partes = [n // processos + (i < n % processos) for i in range(processos)]
+    sementes = np.random.SeedSequence(semente).spawn(processos)
+    argumentos = [(tipo, R, C, L, tolerancias, distribuicao, m, tamanho_bloco, s, bordas, limites)
+                  for m, s in zip(partes, sementes)]
+
+    if processos == 1:
+        resultados = [_avaliar_parte(*argumentos[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=processos) as pool:
+            resultados = list(pool.map(_avaliar_parte, *zip(*argumentos)))
+
+    total = resultados[0]
+    for parte in resultados[1:]:
+        total = _somar(total, parte)
+
+    media = {k: s / total["n"] for k, s in total["soma"].items()}
+    desvio = {k: float(np.sqrt(max(total["soma2"][k] / total["n"] - media[k]**2, 0.0)))
+              for k in media}
+    return ResultadoMC(
+        tipo=tipo,
+        n=total["n"],
+        histogramas={k: (total["contagens"][k], bordas[k]) for k in total["contagens"]},
+        media=media,
+        desvio=desvio,
+        minimo=total["minimo"],
+        maximo=total["maximo"],
+        limites=limites,
+        rendimento=total["aprovados"] / total["n"],
+        rendimento_metrica={k: v / total["n"] for k, v in total["aprovados_metrica"].items()},
+    )
@@ -0,0 +1,212 @@
+import numpy as np
+
+import calculo
+import perfil
+
+# Resposta no tempo (degrau e impulso) e métricas do transitório, em forma
+# fechada a partir dos pólos. Todos os filtros do projeto são de 1ª ordem
+# (RC) ou de 2ª ordem (RLC), então
+#
+#   H(s) = k + (c1 s + c0) / ((s - p1)(s - p2)),   p1,2 = m ± d
+#
+# e as respostas saem de e^{mt} cosh(dt) e e^{mt} sinh(dt)/d, avaliadas
+# para muitos projetos de uma vez (matriz projetos x instantes), sem
+# uma chamada de lsim por projeto. Só funções reais são usadas (cos/sin
+# nos projetos oscilatórios, expm1 nos demais), o que também cobre o caso
+# criticamente amortecido (d -> 0) sem divisão por zero.
+
+ENTRADAS = ("degrau", "impulso")
+METRICAS = ("tempo_subida", "tempo_acomodacao", "sobressinal", "tempo_pico", "w_oscilacao")
+
+
+def _exp_par(m, d2, t):
+    # C = e^{mt} cosh(dt) e S = e^{mt} sinh(dt)/d com d² = d2, só com funções reais:
+    # d2 < 0 (oscilatório, d = jω): e^{mt} cos(ωt) e e^{mt} sin(ωt)/ω;
+    # d2 >= 0: com e1 = e^{(m+d)t} e x = 1 - e^{-2dt} (expm1, sem cancelamento),
+    # C = e1 (1 - x/2) e S = e1 x / (2d), que tende a t e^{mt} quando d -> 0
+    C = np.empty_like(t)
+    S = np.empty_like(t)
+    osc = d2[:, 0] < 0
+
+    w = np.sqrt(-d2[osc])
+    tt = t[osc]
+    emt = np.exp(m[osc] * tt)
+    C[osc] = emt * np.cos(w * tt)
+    S[osc] = emt * np.sin(w * tt) / w
+
+    d = np.sqrt(d2[~osc])
+    tt = t[~osc]
+    e1 = np.exp((m[~osc] + d) * tt)
+    x = -np.expm1(-2.0 * d * tt)
+    C[~osc] = e1 * (1.0 - x / 2.0)
+    S[~osc] = np.where(d > 0, e1 * x / (2.0 * np.where(d > 0, d, 1.0)), e1 * tt)
+    return C, S
+
+
+def _decompor(tipo, R, C, L):
+    # coeficientes normalizados: H = k + (c1 s + c0) / (s² + a1 s + a0) (2ª ordem)
+    # ou H = k + c0 / (s + a0) (1ª ordem, c1 = a1 = 0 não usados)
+    num, den = calculo.coeficientes_lote(tipo, R, C, L)
+    num = calculo._coeficientes_2a_ordem(num)
+    den = calculo._coeficientes_2a_ordem(den)
+    ordem = 2 if np.any(den[:, 0] != 0) else 1
+    if ordem == 1:
+        b1, b0 = num[:, 1] / den[:, 1], num[:, 2] / den[:, 1]
+        a0 = den[:, 2] / den[:, 1]
+        k = b1
+        return ordem, k, np.zeros_like(k), b0 - k * a0, np.zeros_like(k), a0
+    b2, b1, b0 = (num / den[:, :1]).T
+    a1, a0 = den[:, 1] / den[:, 0], den[:, 2] / den[:, 0]
+    k = b2
+    return ordem, k, b1 - k * a1, b0 - k * a0, a1, a0
+
+
+def polos(tipo, R, C, L=None):
+    """Pólos de cada projeto, matriz (n_projetos, 2) complexa (NaN no 2º pólo dos filtros RC)."""
+    tipo, R, C, L = calculo.componentes_lote(tipo, R, C, L)
+    ordem, _, _, _, a1, a0 = _decompor(tipo, R, C, L)
+    if ordem == 1:
+        return np.stack([-a0 + 0j, np.full(a0.size, np.nan + 0j)], axis=1)
+    m = -a1 / 2.0
+    d = np.sqrt(m.astype(complex)**2 - a0)
+    return np.stack([m + d, m - d], axis=1)
+
+
+def duracao_padrao(tipo, R, C, L=None, constantes=10.0):
+    """Janela de simulação por projeto: `constantes` vezes a constante de tempo do pólo mais lento."""
+    p = polos(tipo, R, C, L)
+    sigma = -np.nanmax(p.real, axis=1)
+    return constantes / sigma
+
+
+@perfil.medir("tempo/analitico")
+def resposta_tempo(tipo, R, C, L=None, t=None, n_pontos=1000, entrada="degrau"):
+    """Resposta ao degrau ou ao impulso de vários projetos, em forma fechada.
+
+    t : instantes (s), 1-D compartilhado ou (n_projetos, n_pontos). Se omitido,
+        cada projeto usa n_pontos uniformes em [0, duracao_padrao].
+    entrada : 'degrau' ou 'impulso'.
+
+    Retorna {'t', 'y'} (matrizes n_projetos x n_pontos). Para o impulso, o
+    termo k·δ(t) dos filtros com ganho em alta frequência (passa-alta,
+    rejeita-faixa) não cabe em y e vem à parte em 'direto'.
+    """
+    if entrada not in ENTRADAS:
+        raise ValueError(f"Entrada desconhecida: {entrada!r}")
+    tipo, R, C, L = calculo.componentes_lote(tipo, R, C, L)
+    if t is None:
+        t = np.linspace(0.0, 1.0, n_pontos)[None, :] * duracao_padrao(tipo, R, C, L)[:, None]
+    else:
+        t = np.asarray(t, dtype=float)
+        t = np.broadcast_to(t, (R.size, t.shape[-1]))
+
+    ordem, k, c1, c0, a1, a0 = (x[:, None] if np.ndim(x) else x for x in _decompor(tipo, R, C, L))
+    if ordem == 1:
+        e = np.exp(-a0 * t)
+        y = k + c0 * (1.0 - e) / a0 if entrada == "degrau" else c0 * e
+    else:
+        m = -a1 / 2.0
+        Cp, Sp = _exp_par(m, m**2 - a0, t)
+        # combinações por projeto feitas no lugar, sem matrizes temporárias
+        if entrada == "degrau":
+            # ∫ e^{mt} sinh(dt)/d = (1 - e^{mt}(cosh(dt) - m sinh(dt)/d)) / a0, então
+            # y = k + c1 S + (c0/a0)(1 - C + m S)
+            beta = c0 / a0
+            y = Sp
+            y *= c1 + beta * m
+            Cp *= beta
+            y -= Cp
+            y += k + beta
+        else:
+            # h = c1 (C + m S) + c0 S
+            y = Sp
+            y *= c1 * m + c0
+            Cp *= c1
+            y += Cp
+
+    resultado = {"t": t, "y": y}
+    if entrada == "impulso":
+        resultado["direto"] = np.broadcast_to(k, (R.size, 1))[:, 0]
+    return resultado
+
+
+def _primeiro_cruzamento(t, z, nivel):
+    # instante (interpolado) em que z cruza `nivel` pela primeira vez (NaN se nunca)
+    acima = z >= nivel
+    i = np.argmax(acima, axis=1)
+    nunca = ~acima[np.arange(z.shape[0]), i]
+    i0 = np.maximum(i - 1, 0)
+    linhas = np.arange(z.shape[0])
+    z0, z1 = z[linhas, i0], z[linhas, i]
+    t0, t1 = t[linhas, i0], t[linhas, i]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frac = np.where(z1 != z0, (nivel - z0) / (z1 - z0), 0.0)
+    return np.where(nunca, np.nan, t0 + np.clip(frac, 0.0, 1.0) * (t1 - t0))
+
+
+def metricas_degrau(t, y, y_inicial, y_final, tolerancia=0.02):
+    """Métricas do transitório a partir de respostas ao degrau amostradas.
+
+    tempo_subida : de 10% a 90% da variação y_final - y_inicial (NaN se ela é nula,
+        como no passa-faixa, cujo degrau começa e termina em zero).
+    tempo_acomodacao : último instante fora da faixa ±tolerancia em torno de y_final,
+        relativa à variação ou, se ela é nula, ao pico (NaN se não acomodou na janela).
+    sobressinal : quanto y passa de y_final no sentido da variação, em % da variação.
+    tempo_pico : instante do sobressinal (ou do pico, se não há variação); NaN
+        se a resposta não passa de y_final (sem sobressinal, o pico seria só o
+        fim da janela).
+    """
+    y_inicial = np.asarray(y_inicial, dtype=float)[:, None]
+    y_final = np.asarray(y_final, dtype=float)[:, None]
+    variacao = y_final - y_inicial
+    tem_variacao = np.abs(variacao[:, 0]) > 1e-12 * np.max(np.abs(y), axis=1)
+    variacao_segura = np.where(tem_variacao[:, None], variacao, 1.0)
+    linhas = np.arange(y.shape[0])
+
+    z = (y - y_inicial) / variacao_segura
+    subida = _primeiro_cruzamento(t, z, 0.9) - _primeiro_cruzamento(t, z, 0.1)
+
+    desvio = (y - y_final) * np.sign(variacao_segura)
+    i_pico = np.argmax(desvio, axis=1)
+    sobressinal = np.maximum(desvio[linhas, i_pico], 0.0) / np.abs(variacao_segura[:, 0]) * 100.0
+    # folga para o arredondamento de respostas que só encostam em y_final
+    passou = desvio[linhas, i_pico] > 1e-9 * np.abs(variacao_segura[:, 0])
+
+    # sem variação (passa-faixa): pico da resposta em relação ao valor final
+    erro = np.abs(y - y_final)
+    i_max = np.argmax(erro, axis=1)
+    escala = np.where(tem_variacao, np.abs(variacao[:, 0]), erro[linhas, i_max])
+    fora = erro > tolerancia * escala[:, None]
+    ultimo = y.shape[1] - 1 - np.argmax(fora[:, ::-1], axis=1)
+    acomodacao = np.where(~fora.any(axis=1), 0.0, t[linhas, np.minimum(ultimo + 1, y.shape[1] - 1)])
+    acomodacao = np.where(fora[:, -1], np.nan, acomodacao)
+
+    return {
+        "tempo_subida": np.where(tem_variacao, subida, np.nan),
+        "tempo_acomodacao": acomodacao,
+        "sobressinal": np.where(tem_variacao, sobressinal, np.nan),
+        "tempo_pico": np.where(tem_variacao, np.where(passou, t[linhas, i_pico], np.nan), t[linhas, i_max]),
+    }
+
+
+@perfil.medir("tempo/metricas")
+def metricas_lote(tipo, R, C, L=None, n_pontos=1000, tolerancia=0.02, tamanho_bloco=5000):
+    """Métricas do degrau de muitos projetos, em blocos (memória limitada).
+
+    Retorna um dicionário de vetores: 'tempo_subida', 'tempo_acomodacao' (s),
+    'sobressinal' (%), 'tempo_pico' (s) e 'w_oscilacao' (rad/s, parte
+    imaginária dos pólos; 0 quando não há oscilação).
+    """
+    tipo, R, C, L = calculo.componentes_lote(tipo, R, C, L)
+    saida = {k: np.empty(R.size) for k in METRICAS}
+    for ini in range(0, R.size, tamanho_bloco):
+        fim = min(ini + tamanho_bloco, R.size)
+        Lb = None if L is None else L[ini:fim]
+        r = resposta_tempo(tipo, R[ini:fim], C[ini:fim], Lb, n_pontos=n_pontos)
+        # valor logo após o degrau e em regime: ganhos em s -> ∞ e em s = 0
+        ordem, k, c1, c0, a1, a0 = _decompor(tipo, R[ini:fim], C[ini:fim], Lb)
+        m = metricas_degrau(r["t"], r["y"], k, k + c0 / a0, tolerancia)
+        m["w_oscilacao"] = np.abs(polos(tipo, R[ini:fim], C[ini:fim], Lb)[:, 0].imag)
+        for chave in METRICAS:
+            saida[chave][ini:fim] = m[chave]
+    return saida
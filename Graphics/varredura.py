@@ -0,0 +1,216 @@
+import glob
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+import calculo
+
+# Varredura do espaço de projeto: o produto cartesiano dos valores de R, L e C
+# é dividido em blocos de índices, avaliados em paralelo por um pool de
+# processos. Cada bloco pronto é entregue assim que termina e, se houver uma
+# pasta de checkpoint, salvo em disco para que a varredura possa ser retomada.
+# A pasta guarda também a assinatura dos parâmetros (tipo, valores dos
+# componentes, frequências, tamanho do bloco): blocos de outra varredura
+# nunca são misturados com os da atual.
+
+
+def _componentes_bloco(tipo, eixos, ini, fim):
+    # índices planos [ini, fim) -> valores de R, C, L do produto cartesiano
+    formato = tuple(len(e) for e in eixos)
+    indices = np.unravel_index(np.arange(ini, fim), formato)
+    valores = [np.asarray(e, dtype=float)[i] for e, i in zip(eixos, indices)]
+    if tipo in calculo.TIPOS_RLC:
+        R, L, C = valores
+    else:
+        (R, C), L = valores, None
+    return R, C, L
+
+
+def avaliar_bloco(tipo, eixos, ini, fim, frequencias=()):
+    """Avalia os projetos [ini, fim) da grade: métricas e atenuação em dB.
+
+    Retorna um dicionário de vetores: 'indice', 'R', 'C', ('L'), as métricas de
+    calculo.metricas_lote e, se houver frequências, 'atenuacao_db' com forma
+    (n_projetos, n_frequencias) — atenuação = -20 log10 |H(jω)|.
+    """
+    R, C, L = _componentes_bloco(tipo, eixos, ini, fim)
+    resultado = {"indice": np.arange(ini, fim), "R": R, "C": C}
+    if L is not None:
+        resultado["L"] = L
+    resultado.update(calculo.metricas_lote(tipo, R, C, L))
+
+    frequencias = np.asarray(frequencias, dtype=float)
+    if frequencias.size:
+        num, den = calculo.coeficientes_lote(tipo, R, C, L)
+        with np.errstate(divide='ignore'):
+            resultado["atenuacao_db"] = -20.0 * np.log10(np.abs(calculo.avaliar_lote(num, den, frequencias)))
+    return resultado
+
+
+class Varredura:
+    """Varredura paralela de uma grade de componentes.
+
+    Parâmetros
+    ----------
+    tipo : tipo de filtro (ver calculo.TIPOS).
+    R, C, L : valores de cada componente; a grade é o produto cartesiano
+        R x L x C (filtros RLC) ou R x C (filtros RC).
+    frequencias : frequências (rad/s) em que a atenuação é reportada.
+    tamanho_bloco : projetos por bloco de trabalho.
+    processos : tamanho do pool (padrão: os.cpu_count()).
+    pasta : diretório de checkpoint; blocos já salvos nele são pulados.
+    reiniciar : se a pasta tem blocos de uma varredura com outros parâmetros,
+        apaga esses blocos e começa de novo (padrão: ValueError).
+
+    Uso::
+
+        v = Varredura("passa_faixa", R=e24_R, L=e24_L, C=e24_C, pasta="saida")
+        for bloco in v.executar():
+            ...   # dicionário de vetores, ver avaliar_bloco
+    """
+
+    def __init__(self, tipo, R, C, L=None, frequencias=(), tamanho_bloco=20000,
+                 processos=None, pasta=None, reiniciar=False):
+        self.tipo = calculo.normalizar_tipo(tipo)
+        if self.tipo in calculo.TIPOS_RLC:
+            if L is None:
+                raise ValueError(f"O filtro {self.tipo} precisa dos valores de L.")
+            self.eixos = (np.ravel(R), np.ravel(L), np.ravel(C))
+        else:
+            self.eixos = (np.ravel(R), np.ravel(C))
+        self.frequencias = np.ravel(np.asarray(frequencias, dtype=float))
+        self.tamanho_bloco = int(tamanho_bloco)
+        self.processos = processos or os.cpu_count() or 1
+        self.pasta = pasta
+        self.reiniciar = reiniciar
+        self.total = int(np.prod([e.size for e in self.eixos]))
+        self.n_blocos = -(-self.total // self.tamanho_bloco)
+        self.feitos = 0
+        self._cancelar = threading.Event()
+
+    # -----------------------------
+    # Controle
+    # -----------------------------
+    def cancelar(self):
+        """Pede o fim da varredura; blocos em andamento terminam, os demais não começam."""
+        self._cancelar.set()
+
+    @property
+    def progresso(self):
+        """Fração de blocos concluídos (0 a 1)."""
+        return self.feitos / self.n_blocos if self.n_blocos else 1.0
+
+    # -----------------------------
+    # Checkpoint
+    # -----------------------------
+    def _arquivo_bloco(self, k):
+        return os.path.join(self.pasta, f"bloco_{k:06d}.npz")
+
+    def _arquivo_parametros(self):
+        return os.path.join(self.pasta, "varredura.json")
+
+    def assinatura(self):
+        """Hash dos parâmetros que definem o conteúdo de cada bloco."""
+        h = hashlib.sha1()
+        h.update(f"{self.tipo}|{self.tamanho_bloco}|{len(self.eixos)}".encode())
+        for vetor in (*self.eixos, self.frequencias):
+            vetor = np.ascontiguousarray(vetor, dtype=float)
+            h.update(f"|{vetor.size}|".encode())
+            h.update(vetor.tobytes())
+        return h.hexdigest()
+
+    def _conferir_pasta(self, gravar=False):
+        # garante que os blocos da pasta são desta varredura (ou apaga, com reiniciar)
+        if self.pasta is None:
+            return
+        arquivo = self._arquivo_parametros()
+        salva = None
+        if os.path.exists(arquivo):
+            with open(arquivo) as f:
+                salva = json.load(f).get("assinatura")
+        blocos = glob.glob(os.path.join(self.pasta, "bloco_*.npz"))
+        if salva != self.assinatura() and (salva is not None or blocos):
+            if not self.reiniciar:
+                raise ValueError(f"A pasta {self.pasta!r} tem blocos de uma varredura com outros "
+                                 "parâmetros; use outra pasta ou reiniciar=True.")
+            for bloco in blocos + glob.glob(os.path.join(self.pasta, "bloco_*.npz.tmp")):
+                os.remove(bloco)
+            salva = None
+        if gravar and salva is None:
+            with open(arquivo, "w") as f:
+                json.dump({"assinatura": self.assinatura(), "tipo": self.tipo,
+                           "total": self.total, "tamanho_bloco": self.tamanho_bloco}, f)
+
+    def blocos_pendentes(self):
+        """Índices dos blocos que ainda não têm resultado salvo na pasta."""
+        if self.pasta is None:
+            return list(range(self.n_blocos))
+        self._conferir_pasta()
+        return [k for k in range(self.n_blocos) if not os.path.exists(self._arquivo_bloco(k))]
+
+    def _salvar(self, k, resultado):
+        # grava num arquivo temporário e renomeia: um bloco nunca fica pela metade.
+        # O temporário não pode casar com bloco_*.npz (np.savez com um nome
+        # acrescenta .npz, por isso a gravação passa pelo arquivo aberto)
+        temporario = self._arquivo_bloco(k) + ".tmp"
+        with open(temporario, "wb") as f:
+            np.savez(f, **resultado)
+        os.replace(temporario, self._arquivo_bloco(k))
+
+    def carregar(self):
+        """Lê da pasta todos os blocos já concluídos, em ordem."""
+        if self.pasta is None:
+            return
+        self._conferir_pasta()
+        for k in range(self.n_blocos):
+            arquivo = self._arquivo_bloco(k)
+            if os.path.exists(arquivo):
+                with np.load(arquivo) as dados:
+                    yield {chave: dados[chave] for chave in dados.files}
+
+    # -----------------------------
+    # Execução
+    # -----------------------------
+    def executar(self):
+        """Gera o resultado de cada bloco assim que ele termina (ordem não garantida)."""
+        if self.pasta is not None:
+            os.makedirs(self.pasta, exist_ok=True)
+            self._conferir_pasta(gravar=True)
+        pendentes = self.blocos_pendentes()
+        self.feitos = self.n_blocos - len(pendentes)
+        self._cancelar.clear()
+
+        with ProcessPoolExecutor(max_workers=self.processos) as pool:
+            em_voo = {}
+            fila = iter(pendentes)
+            try:
+                while True:
+                    # mantém no máximo 2 blocos por processo em andamento
+                    while not self._cancelar.is_set() and len(em_voo) < 2 * self.processos:
+                        k = next(fila, None)
+                        if k is None:
+                            break
+                        ini = k * self.tamanho_bloco
+                        fim = min(ini + self.tamanho_bloco, self.total)
+                        futuro = pool.submit(avaliar_bloco, self.tipo, self.eixos, ini, fim,
+                                             self.frequencias)
+                        em_voo[futuro] = k
+                    if not em_voo:
+                        break
+
+                    prontos, _ = wait(em_voo, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        k = em_voo.pop(futuro)
+                        resultado = futuro.result()
+                        if self.pasta is not None:
+                            self._salvar(k, resultado)
+                        self.feitos += 1
+                        yield resultado
+            finally:
+                # cancelamento (ou gerador fechado): descarta o que não começou
+                for futuro in em_voo:
+                    futuro.cancel()